@@ -0,0 +1,168 @@
+"""
+Compares the per-call overhead of the xcomposite decorators against the
+generic closures they replaced. The legacy closures are reproduced here
+so both can be timed side by side against the same compositions.
+
+Run with:
+
+    python -m benchmarks.decorator_overhead
+"""
+import timeit
+
+import xcomposite
+from xcomposite.core import Ignore
+
+
+# ------------------------------------------------------------------------------
+def _legacy_results(composition_class, method_name, *args, **kwargs):
+    results = list()
+
+    for method in composition_class._dispatch_methods(method_name):
+        result = method(*args[1:], **kwargs)
+
+        if not isinstance(result, Ignore):
+            results.append(result)
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def legacy_take_sum(func):
+    def inner(*args, **kwargs):
+        return sum(_legacy_results(args[0], func.__name__, *args, **kwargs))
+    return inner
+
+
+# ------------------------------------------------------------------------------
+def legacy_extend_results(func):
+    def inner(*args, **kwargs):
+        extended_results = list()
+        results = _legacy_results(args[0], func.__name__, *args, **kwargs)
+
+        for result in results:
+            if not isinstance(result, Ignore):
+                extended_results.extend(result)
+
+        return extended_results
+    return inner
+
+
+# ------------------------------------------------------------------------------
+def legacy_update_dictionary(func):
+    def inner(*args, **kwargs):
+        output = dict()
+        results = _legacy_results(args[0], func.__name__, *args, **kwargs)
+
+        for result in results:
+            if not isinstance(result, Ignore):
+                output.update(result)
+
+        return output
+    return inner
+
+
+# ------------------------------------------------------------------------------
+def legacy_take_first(func):
+    def inner(*args, **kwargs):
+        for method in args[0]._dispatch_methods(func.__name__):
+            result = method(*args[1:], **kwargs)
+            if not isinstance(result, Ignore):
+                return result
+        return None
+    return inner
+
+
+# ------------------------------------------------------------------------------
+def _build(decorators):
+    """
+    Builds a composition class whose methods are decorated with the
+    given (sum, extend, update, first) decorators.
+    """
+    take_sum, extend_results, update_dictionary, take_first = decorators
+
+    class Bench(xcomposite.Composition):
+
+        @take_sum
+        def value(self, x):
+            return x
+
+        @extend_results
+        def items(self, x):
+            return [x]
+
+        @update_dictionary
+        def mapping(self, x):
+            return {x: x}
+
+        @take_first
+        def first(self, x):
+            return x
+
+    return Bench
+
+
+# ------------------------------------------------------------------------------
+class Component(object):
+
+    def value(self, x):
+        return x
+
+    def items(self, x):
+        return [x]
+
+    def mapping(self, x):
+        return {x: x}
+
+    def first(self, x):
+        return x
+
+
+# ------------------------------------------------------------------------------
+def main(component_count=10, number=20000):
+    variants = dict(
+        legacy=_build(
+            (
+                legacy_take_sum,
+                legacy_extend_results,
+                legacy_update_dictionary,
+                legacy_take_first,
+            ),
+        ),
+        current=_build(
+            (
+                xcomposite.take_sum,
+                xcomposite.extend_results,
+                xcomposite.update_dictionary,
+                xcomposite.take_first,
+            ),
+        ),
+    )
+
+    print('%-10s %12s %12s %8s' % ('method', 'legacy (us)', 'current (us)', 'ratio'))
+
+    for method_name in ('value', 'items', 'mapping', 'first'):
+        timings = dict()
+
+        for label, composition_type in variants.items():
+            composition = composition_type()
+
+            for _ in range(component_count):
+                composition.bind(Component())
+
+            method = getattr(composition, method_name)
+            timings[label] = min(
+                timeit.repeat(lambda: method(1), number=number, repeat=5)
+            ) / number * 1e6
+
+        print(
+            '%-10s %12.3f %12.3f %8.2f' % (
+                method_name,
+                timings['legacy'],
+                timings['current'],
+                timings['legacy'] / timings['current'],
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares the memory held by large numbers of Composition and
+SlottedComposition instances, along with the time taken to create them
+and to call a decorated method on each.
+
+Run with:
+
+    python -m benchmarks.memory [instance_count]
+"""
+import sys
+import time
+import tracemalloc
+
+import xcomposite
+
+
+# ------------------------------------------------------------------------------
+class Component(object):
+
+    __slots__ = ()
+
+    def speed(self):
+        return 1
+
+
+# ------------------------------------------------------------------------------
+class Entity(xcomposite.Composition):
+
+    @xcomposite.take_sum
+    def speed(self):
+        return 0
+
+
+# ------------------------------------------------------------------------------
+class SlottedEntity(xcomposite.SlottedComposition):
+
+    __slots__ = ()
+
+    @xcomposite.take_sum
+    def speed(self):
+        return 0
+
+
+# ------------------------------------------------------------------------------
+def _measure(composition_type, count, component):
+    """
+    Creates the given number of compositions, each with a single component
+    bound. This returns the bytes allocated per instance before and after
+    calling a decorated method, along with the create and call timings in
+    seconds.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    compositions = list()
+
+    for _ in range(count):
+        composition = composition_type()
+        composition.bind(component)
+        compositions.append(composition)
+
+    created = time.perf_counter() - start
+    bound, _ = tracemalloc.get_traced_memory()
+
+    # -- Calling builds the dispatch caches, which are part of the
+    # -- memory a live composition holds
+    start = time.perf_counter()
+
+    for composition in compositions:
+        composition.speed()
+
+    called = time.perf_counter() - start
+
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return bound / count, allocated / count, created, called
+
+
+# ------------------------------------------------------------------------------
+def main(count=1000000):
+    component = Component()
+
+    print(
+        '%-20s %12s %12s %12s %12s' % (
+            'type', 'bound (B)', 'called (B)', 'create (s)', 'call (s)',
+        )
+    )
+
+    for composition_type in (Entity, SlottedEntity):
+        bound, allocated, created, called = _measure(
+            composition_type,
+            count,
+            component,
+        )
+
+        print(
+            '%-20s %12.1f %12.1f %12.3f %12.3f' % (
+                composition_type.__name__,
+                bound,
+                allocated,
+                created,
+                called,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,601 @@
+"""
+Measures the cost of every decorator, of attribute redirection and of
+binding and unbinding, across a range of component counts, argument
+shapes and result sizes. Each case is timed alongside a plain hand
+written loop doing the same work, which serves as the baseline.
+
+The results are written to a JSON file, and can be compared against the
+results of an earlier run to catch regressions:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+
+Each case is timed several times, with the case and its baseline measured
+in turn, and the best of each is kept. How far the median time of each
+lies above its best is recorded as the noise of the case.
+
+When comparing, any case which has become slower by more than both the
+threshold and the noise measured in the two runs is listed and the exit
+status is 1.
+
+Use --counts and --filter to run a subset of the cases, such as:
+
+    python -m benchmarks.suite --counts 1 10 --filter take_
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+import xcomposite
+
+
+# -- The component counts, argument shapes and result sizes measured
+COUNTS = (1, 10, 100, 1000)
+
+SHAPES = dict(
+    none=((), {}),
+    args=((1, 2, 3), {}),
+    kwargs=((), dict(a=1, b=2)),
+)
+
+SIZES = (1, 100)
+
+
+# ------------------------------------------------------------------------------
+class Component(object):
+    """
+    Implements every method the benchmarks call. List and dictionary
+    results hold the given number of items.
+    """
+
+    def __init__(self, size=1):
+        self.attribute = 0
+        self.items = list(range(size))
+        self.mapping = dict.fromkeys(self.items)
+
+    def number(self, *args, **kwargs):
+        return 1
+
+    def flag(self, *args, **kwargs):
+        return True
+
+    def sequence(self, *args, **kwargs):
+        return self.items
+
+    def dictionary(self, *args, **kwargs):
+        return self.mapping
+
+
+# ------------------------------------------------------------------------------
+def _min(components, args, kwargs):
+    result = components[0].number(*args, **kwargs)
+
+    for component in components[1:]:
+        value = component.number(*args, **kwargs)
+
+        if value < result:
+            result = value
+
+    return result
+
+
+# ------------------------------------------------------------------------------
+def _max(components, args, kwargs):
+    result = components[0].number(*args, **kwargs)
+
+    for component in components[1:]:
+        value = component.number(*args, **kwargs)
+
+        if value > result:
+            result = value
+
+    return result
+
+
+# ------------------------------------------------------------------------------
+def _sum(components, args, kwargs):
+    total = 0
+
+    for component in components:
+        total += component.number(*args, **kwargs)
+
+    return total
+
+
+# ------------------------------------------------------------------------------
+def _average(components, args, kwargs):
+    return _sum(components, args, kwargs) / len(components)
+
+
+# ------------------------------------------------------------------------------
+def _range(components, args, kwargs):
+    values = [component.number(*args, **kwargs) for component in components]
+    return [min(values), max(values)]
+
+
+# ------------------------------------------------------------------------------
+def _first(components, args, kwargs):
+    for component in components:
+        return component.number(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+def _first_true(components, args, kwargs):
+    for component in components:
+        result = component.number(*args, **kwargs)
+
+        if result:
+            return result
+
+
+# ------------------------------------------------------------------------------
+def _last(components, args, kwargs):
+    for component in reversed(components):
+        return component.number(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+def _any(components, args, kwargs):
+    for component in components:
+        if component.flag(*args, **kwargs):
+            return True
+
+    return False
+
+
+# ------------------------------------------------------------------------------
+def _all(components, args, kwargs):
+    for component in components:
+        if not component.flag(*args, **kwargs):
+            return False
+
+    return True
+
+
+# ------------------------------------------------------------------------------
+def _append(components, args, kwargs):
+    return [component.sequence(*args, **kwargs) for component in components]
+
+
+# ------------------------------------------------------------------------------
+def _append_unique(components, args, kwargs):
+    results = list()
+
+    for component in components:
+        result = component.number(*args, **kwargs)
+
+        if result not in results:
+            results.append(result)
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def _extend(components, args, kwargs):
+    results = list()
+
+    for component in components:
+        results.extend(component.sequence(*args, **kwargs))
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def _extend_unique(components, args, kwargs):
+    results = dict()
+
+    for component in components:
+        results.update(dict.fromkeys(component.sequence(*args, **kwargs)))
+
+    return list(results)
+
+
+# ------------------------------------------------------------------------------
+def _update(components, args, kwargs):
+    results = dict()
+
+    for component in components:
+        results.update(component.dictionary(*args, **kwargs))
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def _iter(components, args, kwargs):
+    return list(
+        component.sequence(*args, **kwargs) for component in components
+    )
+
+
+# ------------------------------------------------------------------------------
+def _chain(components, args, kwargs):
+    return [
+        item
+        for component in components
+        for item in component.sequence(*args, **kwargs)
+    ]
+
+
+# -- Each decorator along with the component method it is applied to, the
+# -- hand written equivalent, and whether the result size is relevant.
+# -- Generators are consumed into a list so the work is actually done.
+DECORATORS = (
+    ('take_min', xcomposite.take_min, 'number', _min, False),
+    ('take_max', xcomposite.take_max, 'number', _max, False),
+    ('take_sum', xcomposite.take_sum, 'number', _sum, False),
+    ('take_average', xcomposite.take_average, 'number', _average, False),
+    ('take_range', xcomposite.take_range, 'number', _range, False),
+    ('take_first', xcomposite.take_first, 'number', _first, False),
+    ('first_true', xcomposite.first_true, 'number', _first_true, False),
+    ('take_last', xcomposite.take_last, 'number', _last, False),
+    ('absolute_false', xcomposite.absolute_false, 'flag', _any, False),
+    ('absolute_true', xcomposite.absolute_true, 'flag', _all, False),
+    ('any_false', xcomposite.any_false, 'flag', _all, False),
+    ('any_true', xcomposite.any_true, 'flag', _any, False),
+    ('append_results', xcomposite.append_results, 'sequence', _append, True),
+    ('append_unique', xcomposite.append_unique, 'number', _append_unique,
+     False),
+    ('extend_results', xcomposite.extend_results, 'sequence', _extend, True),
+    ('extend_unique', xcomposite.extend_unique, 'sequence', _extend_unique,
+     True),
+    ('update_dictionary', xcomposite.update_dictionary, 'dictionary',
+     _update, True),
+    ('iter_results', xcomposite.iter_results, 'sequence', _iter, True),
+    ('chain_results', xcomposite.chain_results, 'sequence', _chain, True),
+)
+
+# -- Decorators whose results are generators, and so must be consumed
+_LAZY = ('iter_results', 'chain_results')
+
+
+# ------------------------------------------------------------------------------
+def _composition_type(decorator, method_name):
+    """
+    Builds a composition class with a single method, of the given name,
+    decorated with the given decorator.
+    """
+    def method(self, *args, **kwargs):
+        return None
+
+    method.__name__ = method_name
+
+    return type(
+        'Bench',
+        (xcomposite.Composition,),
+        {method_name: decorator(method)},
+    )
+
+
+# ------------------------------------------------------------------------------
+def _timer(function, minimum=0.005):
+    """
+    Returns a timer for the given function, along with the number of calls
+    per measurement needed for each measurement to take roughly the given
+    number of seconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+
+    # -- Estimate the cost of a call, using enough calls for the estimate
+    # -- to be meaningful
+    while True:
+        elapsed = timer.timeit(number)
+
+        if elapsed >= minimum / 10:
+            break
+
+        number *= 10
+
+    return timer, max(1, int(number * minimum / elapsed))
+
+
+# ------------------------------------------------------------------------------
+def _spread(times):
+    """
+    Returns how far the median of the given times lies above the best of
+    them, as a fraction of the best.
+    """
+    times = sorted(times)
+    return times[len(times) // 2] / times[0] - 1
+
+
+# ------------------------------------------------------------------------------
+def _case(name, measured, baseline, repeat=7):
+    """
+    Times the measured and baseline functions, returning the result
+    for the named case.
+
+    The two are measured in turn on each repeat, so that both see the same
+    state of the machine, and the best time of each is kept. The spread
+    of both across the repeats is recorded as the noise of the case.
+    """
+    measured_timer, measured_number = _timer(measured)
+    baseline_timer, baseline_number = _timer(baseline)
+
+    measured_times = list()
+    baseline_times = list()
+
+    for _ in range(repeat):
+        measured_times.append(
+            measured_timer.timeit(measured_number) / measured_number * 1e6
+        )
+        baseline_times.append(
+            baseline_timer.timeit(baseline_number) / baseline_number * 1e6
+        )
+
+    return name, dict(
+        xcomposite=min(measured_times),
+        baseline=min(baseline_times),
+        ratio=min(measured_times) / min(baseline_times),
+        spread=_spread(measured_times) + _spread(baseline_times),
+        repeat=repeat,
+    )
+
+
+# ------------------------------------------------------------------------------
+def decorator_cases(counts):
+    """
+    Yields the cases for every decorator.
+    """
+    for label, decorator, method_name, baseline, sized in DECORATORS:
+        composition_type = _composition_type(decorator, method_name)
+
+        for count in counts:
+            for size in (SIZES if sized else SIZES[:1]):
+                components = [Component(size) for _ in range(count)]
+                composition = composition_type()
+                composition.bind_many(components)
+                method = getattr(composition, method_name)
+
+                for shape, (args, kwargs) in SHAPES.items():
+                    name = '%s/components=%s/args=%s/size=%s' % (
+                        label,
+                        count,
+                        shape,
+                        size,
+                    )
+
+                    if label in _LAZY:
+                        def measured(method=method, a=args, k=kwargs):
+                            return list(method(*a, **k))
+
+                    else:
+                        def measured(method=method, a=args, k=kwargs):
+                            return method(*a, **k)
+
+                    def hand_written(c=components, a=args, k=kwargs):
+                        return baseline(c, a, k)
+
+                    yield name, measured, hand_written
+
+
+# ------------------------------------------------------------------------------
+def redirection_cases(counts):
+    """
+    Yields the cases for reading and writing an attribute held by the last
+    component, through __getattr__ and __setattr__.
+    """
+    for count in counts:
+        components = [object() for _ in range(count - 1)] + [Component()]
+        composition = xcomposite.Composition()
+        composition.bind_many(components)
+        owner = components[-1]
+
+        def get_redirected(composition=composition):
+            return composition.attribute
+
+        def get_direct(owner=owner):
+            return owner.attribute
+
+        def set_redirected(composition=composition):
+            composition.attribute = 1
+
+        def set_direct(owner=owner):
+            owner.attribute = 1
+
+        yield (
+            'getattr/components=%s' % count,
+            get_redirected,
+            get_direct,
+        )
+        yield (
+            'setattr/components=%s' % count,
+            set_redirected,
+            set_direct,
+        )
+
+
+# ------------------------------------------------------------------------------
+def binding_cases(counts):
+    """
+    Yields the cases for binding every component and then unbinding them
+    all again, by instance and by type.
+    """
+    for count in counts:
+        components = [Component() for _ in range(count)]
+
+        def bind_unbind(components=components):
+            composition = xcomposite.Composition()
+
+            for component in components:
+                composition.bind(component)
+
+            for component in components:
+                composition.unbind(component)
+
+        def bind_unbind_type(components=components):
+            composition = xcomposite.Composition()
+
+            for component in components:
+                composition.bind(component)
+
+            for _ in components:
+                composition.unbind(Component)
+
+        def bind_many(components=components):
+            composition = xcomposite.Composition()
+            composition.bind_many(components)
+            composition.unbind_many(components)
+
+        def list_append_remove(components=components):
+            store = list()
+
+            for component in components:
+                store.append(component)
+
+            for component in components:
+                store.remove(component)
+
+        yield (
+            'bind_unbind/components=%s' % count,
+            bind_unbind,
+            list_append_remove,
+        )
+        yield (
+            'bind_unbind_type/components=%s' % count,
+            bind_unbind_type,
+            list_append_remove,
+        )
+        yield (
+            'bind_many/components=%s' % count,
+            bind_many,
+            list_append_remove,
+        )
+
+
+# ------------------------------------------------------------------------------
+def run(counts=COUNTS, pattern=None):
+    """
+    Runs every case whose name contains the given pattern.
+
+    :return: dict of the results of the run
+    """
+    results = dict()
+
+    for cases in (decorator_cases, redirection_cases, binding_cases):
+        for name, measured, baseline in cases(counts):
+            if pattern and pattern not in name:
+                continue
+
+            name, result = _case(name, measured, baseline)
+            results[name] = result
+
+            print(
+                '%-52s %12.3f %12.3f %8.2f %7.1f%%' % (
+                    name,
+                    result['xcomposite'],
+                    result['baseline'],
+                    result['ratio'],
+                    result['spread'] * 100,
+                )
+            )
+
+    return dict(
+        meta=dict(
+            xcomposite=xcomposite.__version__,
+            python=platform.python_version(),
+            implementation=platform.python_implementation(),
+            machine=platform.machine(),
+            time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+        ),
+        results=results,
+    )
+
+
+# ------------------------------------------------------------------------------
+def compare(current, previous, threshold):
+    """
+    Lists the cases which have become slower by more than the threshold
+    (a fraction, so 0.25 is twenty five percent).
+
+    The baseline of each run is used to normalise the timings, so that
+    runs made on machines of differing speeds can still be compared. A
+    case must also have slowed by more than the spread measured in both
+    runs, so that noisy cases are not reported as regressions.
+
+    :return: list of the names of the regressed cases
+    """
+    regressions = list()
+
+    for name, result in sorted(current['results'].items()):
+        before = previous['results'].get(name)
+
+        if before is None:
+            continue
+
+        change = result['ratio'] / before['ratio'] - 1
+        noise = result.get('spread', 0) + before.get('spread', 0)
+
+        if change > max(threshold, noise):
+            regressions.append(name)
+            print(
+                '%-52s %+7.1f%% %7.1f%%' % (name, change * 100, noise * 100)
+            )
+
+    return regressions
+
+
+# ------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--output',
+        help='JSON file to write the results to',
+    )
+    parser.add_argument(
+        '--compare',
+        help='JSON file of an earlier run to compare the results against',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='Fraction a case may slow down by before it is a regression',
+    )
+    parser.add_argument(
+        '--counts',
+        type=int,
+        nargs='+',
+        default=COUNTS,
+        help='Component counts to measure',
+    )
+    parser.add_argument(
+        '--filter',
+        help='Only run the cases whose name contains this',
+    )
+    arguments = parser.parse_args(argv)
+
+    print(
+        '%-52s %12s %12s %8s %8s' % (
+            'case', 'xcomposite', 'baseline', 'ratio', 'spread',
+        )
+    )
+    current = run(arguments.counts, arguments.filter)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as stream:
+            json.dump(current, stream, indent=4, sort_keys=True)
+
+    if not arguments.compare:
+        return 0
+
+    with open(arguments.compare) as stream:
+        previous = json.load(stream)
+
+    print(
+        '\nRegressions beyond %.0f%%, or the noise of the case if greater:'
+        % (arguments.threshold * 100)
+    )
+
+    if compare(current, previous, arguments.threshold):
+        return 1
+
+    print('None')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,6 +18,9 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/mikemalinowski/xcomposite',
     packages=setuptools.find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Programming Language :: Python',
         'License :: OSI Approved :: MIT License',
@@ -79,9 +79,32 @@ xcomposite decorator.
 from .core import (
     Ignore,
     Composition,
+    SlottedComposition,
+)
+
+from .executors import (
+    Deadline,
+)
+
+from .group import (
+    CompositionGroup,
+)
+
+from .caching import (
+    memoize,
+    cache_components,
+)
+
+from .reducers import (
+    Reducer,
+)
+
+from .tracing import (
+    Tracer,
 )
 
 from .decorators import (
+    composite,
     take_min,
     take_max,
     take_sum,
@@ -99,8 +122,8 @@ from .decorators import (
     extend_results,
     extend_unique,
     update_dictionary,
-
-
+    iter_results,
+    chain_results,
 )
 __author__ = "Michael Malinowski"
 __copyright__ = "Copyright (C) 2019 Michael Malinowski"
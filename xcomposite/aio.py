@@ -0,0 +1,288 @@
+"""
+This module holds asyncio aware equivalents of the composite decorators.
+Decorated methods become coroutine functions which call every component
+and await any coroutines they return concurrently (with asyncio.gather)
+before combining the results exactly as the synchronous decorators do.
+
+    .. code-block:: python
+
+        >>> import asyncio
+        >>> import xcomposite
+        >>> from xcomposite import aio
+        >>>
+        >>>
+        >>> class Definition(xcomposite.Composition):
+        ...
+        ...     @aio.extend_results
+        ...     async def items(self):
+        ...         return ['a', 'b']
+        >>>
+        >>>
+        >>> class MyObject(object):
+        ...
+        ...     async def items(self):
+        ...         return ['x', 'y']
+        >>>
+        >>>
+        >>> definition = Definition()
+        >>> definition.bind(MyObject())
+        >>> print(asyncio.run(definition.items()))
+        ['x', 'y']
+
+Components may mix synchronous and asynchronous methods. This module is
+not imported by the xcomposite package itself and must be imported
+explicitly.
+"""
+import asyncio
+import functools
+import inspect
+
+from . import decorators
+from . import executors
+from . import reducers
+from . import tracing
+from .core import Ignore
+
+
+# ------------------------------------------------------------------------------
+async def _results(method_name, methods, args, kwargs):
+    """
+    Calls each of the given methods in order and awaits any awaitable
+    results concurrently.
+
+    If the call is made within an xcomposite.executors.Deadline, any
+    awaitables which have not finished in time are cancelled, and their
+    results skipped.
+
+    :param method_name: Name the methods were looked up with
+    :param methods: Sequence of bound methods to call
+    :param args: Tuple of args to pass to each call
+    :param kwargs: Dictionary of keyword arguments to pass to each call
+
+    :return: List of results which are not Ignore instances, in
+        method order
+    """
+    results = [method(*args, **kwargs) for method in methods]
+
+    pending = [
+        index
+        for index, result in enumerate(results)
+        if inspect.isawaitable(result)
+    ]
+
+    deadline = executors.current_deadline()
+
+    if pending and deadline is None:
+        awaited = await asyncio.gather(*[results[index] for index in pending])
+
+        for index, result in zip(pending, awaited):
+            results[index] = result
+
+    elif pending:
+        tasks = [asyncio.ensure_future(results[index]) for index in pending]
+        await asyncio.wait(tasks, timeout=deadline.remaining())
+
+        for index, task in zip(pending, tasks):
+            if task.done():
+                results[index] = task.result()
+                continue
+
+            task.cancel()
+            deadline.drop(method_name, methods[index])
+            results[index] = Ignore()
+
+    return [
+        result
+        for result in results
+        if not isinstance(result, Ignore)
+    ]
+
+
+# ------------------------------------------------------------------------------
+def _composite(func, reducer):
+    """
+    Builds the coroutine function which replaces a decorated method. This
+    gathers the results of all the component methods with the same name
+    as the decorated function and passes them to the reducer.
+
+    :param func: The function being decorated
+    :param reducer: xcomposite.Reducer instance
+
+    :return: coroutine function
+    """
+    method_name = func.__name__
+
+    @functools.wraps(func)
+    async def inner(self, *args, **kwargs):
+        results = await _results(
+            method_name,
+            self._dispatch_methods(method_name),
+            args,
+            kwargs,
+        )
+
+        if reducer.reverse:
+            results.reverse()
+
+        return reducer.reduce(results)
+
+    tracing.name_after(inner, func)
+    inner._composite_reducer = reducer
+    return inner
+
+
+# ------------------------------------------------------------------------------
+def composite(reducer):
+    """
+    Asynchronous equivalent of xcomposite.composite
+    """
+    if isinstance(reducer, type):
+        reducer = reducer()
+
+    def decorator(func):
+        return _composite(func, reducer)
+
+    return decorator
+
+
+# ------------------------------------------------------------------------------
+def take_min(func):
+    """
+    Asynchronous equivalent of xcomposite.take_min
+    """
+    return _composite(func, decorators._MIN)
+
+
+# ------------------------------------------------------------------------------
+def take_max(func):
+    """
+    Asynchronous equivalent of xcomposite.take_max
+    """
+    return _composite(func, decorators._MAX)
+
+
+# ------------------------------------------------------------------------------
+def take_sum(func):
+    """
+    Asynchronous equivalent of xcomposite.take_sum
+    """
+    return _composite(func, decorators._SUM)
+
+
+# ------------------------------------------------------------------------------
+def take_average(func):
+    """
+    Asynchronous equivalent of xcomposite.take_average
+    """
+    return _composite(func, decorators._AVERAGE)
+
+
+# ------------------------------------------------------------------------------
+def take_range(func):
+    """
+    Asynchronous equivalent of xcomposite.take_range
+    """
+    return _composite(func, decorators._RANGE)
+
+
+# ------------------------------------------------------------------------------
+def take_first(func):
+    """
+    Asynchronous equivalent of xcomposite.take_first. Note that every
+    component is called, as they are all awaited together.
+    """
+    return _composite(func, decorators._FIRST)
+
+
+# ------------------------------------------------------------------------------
+def first_true(func):
+    """
+    Asynchronous equivalent of xcomposite.first_true. Note that every
+    component is called, as they are all awaited together.
+    """
+    return _composite(func, decorators._FIRST_TRUE)
+
+
+# ------------------------------------------------------------------------------
+def take_last(func):
+    """
+    Asynchronous equivalent of xcomposite.take_last. Note that every
+    component is called, as they are all awaited together.
+    """
+    return _composite(func, decorators._LAST)
+
+
+# ------------------------------------------------------------------------------
+def any_true(func):
+    """
+    Asynchronous equivalent of xcomposite.any_true. Every component
+    is called.
+    """
+    return _composite(func, reducers.AnyReducer())
+
+
+# ------------------------------------------------------------------------------
+def any_false(func):
+    """
+    Asynchronous equivalent of xcomposite.any_false. Every component
+    is called.
+    """
+    return _composite(func, reducers.AllReducer())
+
+
+# ------------------------------------------------------------------------------
+def absolute_true(func):
+    """
+    Asynchronous equivalent of xcomposite.absolute_true. Every component
+    is called.
+    """
+    return _composite(func, reducers.AllReducer())
+
+
+# ------------------------------------------------------------------------------
+def absolute_false(func):
+    """
+    Asynchronous equivalent of xcomposite.absolute_false. Every component
+    is called.
+    """
+    return _composite(func, reducers.AnyReducer())
+
+
+# ------------------------------------------------------------------------------
+def append_results(func):
+    """
+    Asynchronous equivalent of xcomposite.append_results
+    """
+    return _composite(func, decorators._APPEND)
+
+
+# ------------------------------------------------------------------------------
+def append_unique(func):
+    """
+    Asynchronous equivalent of xcomposite.append_unique
+    """
+    return _composite(func, decorators._APPEND_UNIQUE)
+
+
+# ------------------------------------------------------------------------------
+def extend_results(func):
+    """
+    Asynchronous equivalent of xcomposite.extend_results
+    """
+    return _composite(func, decorators._EXTEND)
+
+
+# ------------------------------------------------------------------------------
+def extend_unique(func):
+    """
+    Asynchronous equivalent of xcomposite.extend_unique
+    """
+    return _composite(func, decorators._EXTEND_UNIQUE)
+
+
+# ------------------------------------------------------------------------------
+def update_dictionary(func):
+    """
+    Asynchronous equivalent of xcomposite.update_dictionary
+    """
+    return _composite(func, decorators._UPDATE)
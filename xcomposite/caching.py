@@ -0,0 +1,305 @@
+"""
+This module holds the caching support for composite methods.
+
+Memoization
+-----------
+
+The memoize decorator caches whole composite results. This is
+intended for decorated methods whose result only depends on the bound
+components and the arguments given, such that repeated calls can be
+answered without calling the components again.
+
+    .. code-block:: python
+
+        >>> class Entity(xcomposite.Composition):
+        ...
+        ...     @xcomposite.memoize(maxsize=256, ttl=30)
+        ...     @xcomposite.extend_unique
+        ...     def roles(self):
+        ...         return []
+
+The memoize decorator must sit atop of the xcomposite decorator. Each
+composition instance holds its own caches, and they are all cleared
+whenever a component is bound or unbound. Calls with arguments which
+cannot be hashed are never cached.
+
+Note that the cached result object is returned as-is on each hit, so
+results such as lists should not be altered by the caller. For the same
+reason methods returning iterators (iter_results and chain_results) cannot
+be memoized. Asynchronous methods (see xcomposite.aio) are memoized by
+caching the result they are awaited to.
+
+Component Caching
+-----------------
+
+The cache_components decorator instead caches the result of each
+component individually. The composite result is rebuilt from the cached
+component results on each call, and only components which have been
+marked as dirty are called again:
+
+    .. code-block:: python
+
+        >>> class Entity(xcomposite.Composition):
+        ...
+        ...     @xcomposite.cache_components
+        ...     @xcomposite.extend_results
+        ...     def roles(self):
+        ...         return []
+        >>>
+        >>> entity.mark_dirty(component)
+
+Components are marked as dirty automatically when an attribute is set on
+them through the composition (entity.health = 10), and all the cached
+results are dropped when a component is bound or unbound. Changes made to
+a component in any other way must be flagged with Composition.mark_dirty.
+"""
+import collections
+import functools
+import inspect
+import threading
+import time
+
+from . import reducers
+from . import tracing
+
+
+# -- Returned by the cache to denote a key which has no valid entry, as
+# -- None is a legitimate result to cache
+_MISSING = object()
+
+
+# ------------------------------------------------------------------------------
+class LRUCache(object):
+    """
+    A least recently used cache with an optional time to live, which
+    tracks how many lookups it has answered and missed.
+
+    :param maxsize: Maximum number of entries to hold. When this is
+        exceeded the least recently used entry is dropped. None means
+        the cache is unbounded.
+    :param ttl: Number of seconds an entry remains valid for, or None
+        for entries to remain valid until they are dropped.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------------------------
+    def get(self, key):
+        """
+        Returns the value stored against the key, or _MISSING if there
+        is no valid entry for it.
+
+        :param key: Hashable key
+
+        :return: Stored value or _MISSING
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+
+            if entry is not _MISSING:
+                value, expiry = entry
+
+                if expiry is None or expiry > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return _MISSING
+
+    # --------------------------------------------------------------------------
+    def set(self, key, value):
+        """
+        Stores the value against the key, dropping the least recently
+        used entry if the cache is full.
+
+        :param key: Hashable key
+        :param value: Value to store
+
+        :return: None
+        """
+        expiry = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (value, expiry)
+            self._entries.move_to_end(key)
+
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    # --------------------------------------------------------------------------
+    def clear(self):
+        """
+        Drops all the entries, leaving the statistics intact.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    # --------------------------------------------------------------------------
+    def info(self):
+        """
+        Returns the statistics of this cache.
+
+        :return: dict
+        """
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+        )
+
+
+# ------------------------------------------------------------------------------
+def _key(args, kwargs):
+    """
+    Builds a cache key from the arguments of a call.
+    """
+    if kwargs:
+        return args, tuple(sorted(kwargs.items()))
+
+    return args
+
+
+# ------------------------------------------------------------------------------
+def memoize(maxsize=128, ttl=None):
+    """
+    This decorator caches the results of a composite method against the
+    arguments it is called with. The cache is held on the composition
+    instance and is cleared whenever its components change.
+
+    :param maxsize: Maximum number of results to hold per composition,
+        or None for no limit
+    :param ttl: Number of seconds a result remains valid for, or None
+        for results to remain valid until the components change
+
+    :return: decorator
+    """
+    def decorator(func):
+        method_name = func.__name__
+
+        # -- An iterator is exhausted by the first caller, so caching it
+        # -- would give every later caller nothing
+        if isinstance(
+            getattr(func, '_composite_reducer', None),
+            reducers.IterReducer,
+        ):
+            raise TypeError(
+                'Cannot memoize %s, as it returns an iterator' % method_name,
+            )
+
+        def lookup(self, args, kwargs):
+            memo = self._lazy('_memo')
+            cache = memo.get(method_name)
+
+            if cache is None:
+                cache = memo.setdefault(
+                    method_name,
+                    LRUCache(maxsize=maxsize, ttl=ttl),
+                )
+
+            try:
+                key = _key(args, kwargs)
+                return cache, key, cache.get(key)
+
+            except TypeError:
+                # -- The arguments cannot be hashed, so this call
+                # -- cannot be cached
+                return None, None, _MISSING
+
+        # -- A coroutine can only be awaited once, so for asynchronous
+        # -- methods the result it is awaited to is cached instead
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def inner(self, *args, **kwargs):
+                cache, key, result = lookup(self, args, kwargs)
+
+                if result is _MISSING:
+                    result = await func(self, *args, **kwargs)
+
+                    if cache is not None:
+                        cache.set(key, result)
+
+                return result
+
+        else:
+            @functools.wraps(func)
+            def inner(self, *args, **kwargs):
+                cache, key, result = lookup(self, args, kwargs)
+
+                if result is _MISSING:
+                    result = func(self, *args, **kwargs)
+
+                    if cache is not None:
+                        cache.set(key, result)
+
+                return result
+
+        return tracing.name_after(inner, func)
+
+    return decorator
+
+
+# ------------------------------------------------------------------------------
+def cache_components(func):
+    """
+    This decorator marks a composite method as caching the result of each
+    component individually. It must sit atop of the xcomposite decorator.
+
+    :param func: Composite method
+
+    :return: The given method
+    """
+    func._cache_components = True
+    return func
+
+
+# ------------------------------------------------------------------------------
+class CachedMethod(object):
+    """
+    Wraps the bound method of a component, caching its results against
+    the arguments it is called with. Calls with arguments which cannot be
+    hashed are never cached.
+
+    :param component: The component the method belongs to
+    :param method: Bound method of the component
+    :param method_name: Name the method was looked up with
+    :param cache: Dictionary to store the results in. This is shared by
+        all the cached methods of the same component, so the component
+        can be marked dirty by clearing it.
+    """
+    __slots__ = ('__self__', 'method', 'method_name', 'cache')
+
+    # --------------------------------------------------------------------------
+    def __init__(self, component, method, method_name, cache):
+        self.__self__ = component
+        self.method = method
+        self.method_name = method_name
+        self.cache = cache
+
+    # --------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs):
+        try:
+            key = (self.method_name, _key(args, kwargs))
+            return self.cache[key]
+
+        except KeyError:
+            result = self.method(*args, **kwargs)
+            self.cache[key] = result
+            return result
+
+        except TypeError:
+            return self.method(*args, **kwargs)
@@ -1,54 +1,358 @@
+import bisect
+import contextlib
+import functools
+import inspect
+import types
+import weakref
+
+from . import caching
+from . import executors
+from . import instrumentation
+
+
+# -- Attributes of a composition which are specific to this process and
+# -- are therefore not included when it is pickled or copied
+_TRANSIENT = (
+    '_dispatch',
+    '_owners',
+    '_parents',
+    '_executor',
+    '_memo',
+    '_component_results',
+    '_types',
+    '_batch_depth',
+    '_stats',
+    '_plan',
+)
+
+# -- All the internal attributes of a composition. These are never
+# -- redirected to the components.
+_INTERNAL = frozenset(('_components', '_priorities') + _TRANSIENT)
 
 
 # ------------------------------------------------------------------------------
-class Composition(object):
+def _instance_dict(instance):
     """
-    This should be used as the base class for any class which needs to
-    be composited.
+    Returns the __dict__ of the given instance, or an empty dictionary if
+    it does not have one. This is read directly, as a slotted composition
+    would otherwise have the lookup redirected to one of its components.
 
-    When inheriting this class you must decorate any methods you want
-    to utilise the composition mechanism. The decorator you choose
-    to use defines the behaviour of how the results will be combined or
-    selected.
+    :param instance: Any object
 
-    If a method is not decorated it will be expected to exist on the
-    base class directly.
+    :return: dict
+    """
+    try:
+        return object.__getattribute__(instance, '__dict__')
 
-    >>> import xcomposite
-    >>>
-    >>>
-    >>> # -- Inheriting off the composition class means that your class can
-    >>> # -- immediately bind any other class which is of a Composition type.
-    >>> # -- You should declare (through composite decorators) what the
-    >>> # -- expactation is of any bound methods. This allows you to tailor
-    >>> # -- exactly how the results should be combined/returned.
-    >>> class Definition(xcomposite.Composition):
-    ...
-    ...     @xcomposite.extend_results
-    ...     def items(self):
-    ...         return ['a', 'b']
-    >>>
-    >>>
-    >>> class MyObject(object):
-    ...
-    ...     def items(self):
-    ...         return ['x', 'y']
-    >>>
-    >>>
-    >>> # -- Instance any one of the classes, and bind it to the instance
-    >>> # -- of the other
-    >>> definition = Definition()
-    >>> definition.bind(MyObject())
-    >>>
-    >>> # -- Call the items method, noting that the result is the expected
-    >>> # -- list of items from the 'items' call of both A and B
-    >>> print(definition.items())
-    ['a', 'b', 'x', 'y']
+    except AttributeError:
+        return dict()
+
+
+_MethodType = types.MethodType
+
+# -- Stands in for an attribute an instance does not hold in its __dict__
+_MISSING = object()
+
+# -- Attributes of these types always resolve when found on a class, so a
+# -- component class holding one can be said to implement it
+_STATIC_ATTRIBUTES = (
+    types.FunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    staticmethod,
+    classmethod,
+)
+
+
+# ------------------------------------------------------------------------------
+def _has_static_attribute(component_type, name):
+    """
+    Returns whether instances of the given class have an attribute with
+    the given name, judging by the class alone. This is True if the class
+    holds a method or plain value of that name, and False if it holds
+    nothing of that name (though an instance may still hold it in its
+    __dict__). None is returned where the class alone cannot tell, such
+    as for properties or classes which resolve attributes dynamically.
+
+    :param component_type: The class of a component
+    :param name: Name of the attribute
+
+    :return: bool or None
+    """
+    if component_type.__getattribute__ is not object.__getattribute__:
+        return None
+
+    for cls in component_type.__mro__:
+        try:
+            attribute = cls.__dict__[name]
+
+        except KeyError:
+            continue
+
+        if isinstance(attribute, _STATIC_ATTRIBUTES) or \
+                not hasattr(type(attribute), '__get__'):
+            return True
+
+        return None
+
+    if getattr(component_type, '__getattr__', None) is not None:
+        return None
+
+    return False
+
+
+# ------------------------------------------------------------------------------
+class _DispatchPlan(object):
+    """
+    Records which components implement each attribute name for one layout
+    of composition and component classes. As it depends only on the
+    classes, a single plan is shared by every composition with that
+    layout, so a new composition does not have to search its components
+    itself.
+
+    :param composition_type: The class of the composition
+    :param component_types: Tuple of the class of each component, in
+        component order
+    """
+    __slots__ = (
+        'composition_type',
+        'component_types',
+        'nested',
+        '_entries',
+        '_calls',
+    )
+
+    # --------------------------------------------------------------------------
+    def __init__(self, composition_type, component_types):
+        self.composition_type = composition_type
+        self.component_types = component_types
+
+        # -- Whether any of the components are compositions. The methods
+        # -- of these may be flattened, which depends on their own state,
+        # -- so such layouts are always resolved by the compositions.
+        self.nested = any(
+            issubclass(component_type, _CompositionBase)
+            for component_type in component_types
+        )
+
+        # -- Attribute name to a tuple of (component index, checked) pairs,
+        # -- or None if the name cannot be resolved through the plan
+        self._entries = dict()
+
+        # -- Method name to the calls to make (see calls)
+        self._calls = dict()
+
+    # --------------------------------------------------------------------------
+    def entries(self, name):
+        """
+        Returns the index of each component which may implement the given
+        name, along with whether the __dict__ of the component has to be
+        checked for it. None is returned if the plan cannot tell which
+        components implement the name.
+
+        :param name: Name of the attribute
+
+        :return: tuple((int, bool), ...) or None
+        """
+        try:
+            return self._entries[name]
+
+        except KeyError:
+            pass
+
+        if self.nested:
+            return None
+
+        entries = list()
+
+        for index, component_type in enumerate(self.component_types):
+            found = _has_static_attribute(component_type, name)
+
+            if found is None:
+                entries = None
+                break
+
+            # -- Instances without a __dict__ can only have the attributes
+            # -- their class gives them
+            if found or component_type.__dictoffset__:
+                entries.append((index, not found))
+
+        if entries is not None:
+            entries = tuple(entries)
+
+        self._entries[name] = entries
+        return entries
+
+    # --------------------------------------------------------------------------
+    def calls(self, method_name):
+        """
+        Returns how each component implementing the given method is to be
+        called, so that its bound method can be made when it is needed
+        rather than being kept. Each call is a tuple of the component
+        index, the plain function its class defines for the method (or
+        None if it has to be looked up on the instance), whether only
+        the instance can implement it, and whether the instance has a
+        __dict__ which may hold it.
+
+        None is returned where the plan cannot tell which components
+        implement the method, or where the decorated method caches the
+        results of each component.
+
+        :param method_name: Name of the method
+
+        :return: tuple((int, function, bool, bool), ...) or None
+        """
+        try:
+            return self._calls[method_name]
+
+        except KeyError:
+            pass
+
+        entries = self.entries(method_name)
+        decorated = getattr(self.composition_type, method_name, None)
+
+        if entries is None or getattr(decorated, '_cache_components', False):
+            calls = None
+
+        else:
+            calls = tuple(
+                (
+                    index,
+                    None if checked else _class_function(
+                        self.component_types[index],
+                        method_name,
+                    ),
+                    checked,
+                    bool(self.component_types[index].__dictoffset__),
+                )
+                for index, checked in entries
+            )
+
+        self._calls[method_name] = calls
+        return calls
+
+
+# ------------------------------------------------------------------------------
+def _class_function(component_type, method_name):
+    """
+    Returns the plain function the given class defines for the method,
+    which can be called with the instance as its first argument, or None
+    if the class defines it in any other way (or not at all).
+
+    :return: function or None
+    """
+    for cls in component_type.__mro__:
+        # -- Any value (even None) hides the methods of the base classes
+        if method_name in cls.__dict__:
+            attribute = cls.__dict__[method_name]
+
+            if isinstance(attribute, types.FunctionType):
+                return attribute
+
+            return None
+
+    return None
+
+
+# ------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
+def _dispatch_plan(composition_type, component_types):
+    """
+    Returns the plan shared by every composition with the given layout
+    of composition and component classes.
+
+    :param composition_type: The class of the composition
+    :param component_types: Tuple of the class of each component
+
+    :return: _DispatchPlan
+    """
+    return _DispatchPlan(composition_type, component_types)
+
+
+# ------------------------------------------------------------------------------
+def _same_reducer(reducer, other):
+    """
+    Returns True if the two reducers are of the same type and have the
+    same options (such as exhaustive).
+
+    :return: bool
     """
+    if reducer is other:
+        return True
+
+    return type(reducer) is type(other) and vars(reducer) == vars(other)
+
+
+# ------------------------------------------------------------------------------
+class _CompositionBase(object):
+    """
+    This holds all the behaviour of a composition. It declares its internal
+    state as slots, and does not assume the instance has a __dict__, so that
+    it can serve both Composition and SlottedComposition.
+
+    The caches are only created once they are first needed, so that a
+    composition which is never called holds as little as possible.
+    """
+    __slots__ = _INTERNAL
+
+    # -- The type used to hold the components
+    _component_store = list
 
     # --------------------------------------------------------------------------
     def __init__(self):
-        self._components = []
+        object.__setattr__(self, '_components', self._component_store())
+
+        # -- The priority of each component, in component order. This is
+        # -- None whilst every component has the default priority of zero.
+        object.__setattr__(self, '_priorities', None)
+
+        # -- Cache of method name to the tuple of bound component methods
+        # -- which implement it. This is rebuilt lazily whenever the
+        # -- component list changes.
+        object.__setattr__(self, '_dispatch', None)
+
+        # -- Any compositions this composition is bound into. These are
+        # -- held weakly and are informed whenever our component list
+        # -- changes so they can drop their own cached dispatch tables.
+        object.__setattr__(self, '_parents', None)
+
+        # -- Cache of attribute name to the first component which owns
+        # -- that attribute (or None if no component does). This is what
+        # -- the attribute redirection reads and writes are resolved
+        # -- against, and it is cleared whenever the component list changes.
+        object.__setattr__(self, '_owners', None)
+
+        # -- The executor used to call components concurrently, or None
+        # -- if components are called one after another
+        object.__setattr__(self, '_executor', None)
+
+        # -- Caches of memoized method results, keyed by method name. These
+        # -- are cleared whenever the component list changes.
+        object.__setattr__(self, '_memo', None)
+
+        # -- Caches of individual component results for methods decorated
+        # -- with cache_components, keyed by the id of the component.
+        object.__setattr__(self, '_component_results', None)
+
+        # -- Index of class to the bound instances of that class (including
+        # -- instances of its subclasses), in component order. This is only
+        # -- built once a lookup by type is made, and is then kept up to
+        # -- date by bind and unbind rather than being rebuilt.
+        object.__setattr__(self, '_types', None)
+
+        # -- How many batch_changes() blocks we are currently within. Whilst
+        # -- this is set the caches are not dropped on every change, but
+        # -- once when the outermost batch finishes.
+        object.__setattr__(self, '_batch_depth', None)
+
+        # -- The CallStats the component calls are recorded in, or None
+        # -- if instrumentation is switched off
+        object.__setattr__(self, '_stats', None)
+
+        # -- The _DispatchPlan shared by every composition with the same
+        # -- layout of component classes as this one. This is looked up
+        # -- lazily and dropped whenever the component list changes.
+        object.__setattr__(self, '_plan', None)
 
     # --------------------------------------------------------------------------
     def __getattr__(self, item):
@@ -62,12 +366,21 @@ class Composition(object):
 
         :return:
         """
+        # -- Internal attributes are never redirected. To get here means
+        # -- we have not been initialised yet (such as during copying or
+        # -- unpickling) so there are no components to redirect to.
+        if item in _INTERNAL:
+            raise AttributeError(
+                "%s has no attribute %s" % (self.__class__.__name__, item),
+            )
+
         # -- To be here means the attribute does not exist on the base
-        # -- class, therefore we need to cycle the components and see
-        # -- if any of those implement the attribute/method
-        for component in self.components():
-            if hasattr(component, item):
-                return getattr(component, item)
+        # -- class, therefore we need to find the component (if any)
+        # -- which implements the attribute/method
+        owner = self._owner(item)
+
+        if owner is not None:
+            return getattr(owner, item)
 
         # -- If we still have no match we raise an AttributeError
         # -- as python usually would
@@ -92,17 +405,69 @@ class Composition(object):
         """
         # -- To be here means the base class does not have it declared, so
         # -- attempt to check the components of the composite class, and
-        # -- set the first we find
-        if '_components' in self.__dict__:
-            for component in self.__dict__['_components']:
-                if hasattr(component, name):
-                    setattr(component, name, value)
-                    return
+        # -- set the first we find. Subclasses may set attributes before
+        # -- we are initialised, in which case there are no components.
+        if name not in _INTERNAL and self._initialised():
+            owner = self._owner(name)
+
+            if owner is not None:
+                setattr(owner, name, value)
+
+                # -- The component has changed, so any of its cached
+                # -- results may no longer be valid
+                self.mark_dirty(owner)
+                return
 
         # -- To get here means non of the components implement
         # -- the attribute, so we just apply the attribute to
         # -- ourselves.
-        self.__dict__[name] = value
+        object.__setattr__(self, name, value)
+
+    # --------------------------------------------------------------------------
+    def __getstate__(self):
+        """
+        The cached lookups, parent links and executor are specific to this
+        process, so they are excluded when the composition is pickled or
+        copied.
+
+        :return: dict
+        """
+        state = dict(_instance_dict(self))
+
+        for cls in self.__class__.__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name in _TRANSIENT or name.startswith('__'):
+                    continue
+
+                try:
+                    state[name] = object.__getattribute__(self, name)
+
+                except AttributeError:
+                    continue
+
+        return state
+
+    # --------------------------------------------------------------------------
+    def __setstate__(self, state):
+        """
+        Restores a pickled or copied composition, starting with empty
+        caches and no executor.
+
+        :param state: Dictionary as given by __getstate__
+
+        :return: None
+        """
+        for name in _TRANSIENT:
+            object.__setattr__(self, name, None)
+
+        object.__setattr__(self, '_priorities', None)
+
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        for component in self._components:
+            if isinstance(component, _CompositionBase):
+                component._add_parent(self)
 
     # --------------------------------------------------------------------------
     def __repr__(self):
@@ -140,43 +505,1110 @@ class Composition(object):
         return self._components
 
     # --------------------------------------------------------------------------
-    def bind(self, component):
+    def get_component(self, component_type):
         """
-        Adds a component to the class. From the point a component is added
-        it is melded to this class and all decorated calls will incorporate
-        this component.
+        Returns the first component (in component order) which is an
+        instance of the given type, or None if there is no such component.
 
-        :param component: Component to meld
-        :type component: Class
+        :param component_type: Class type (or tuple of types) to look for
+
+        :return: instance or None
+        """
+        bound = self._instances_of(component_type)
+        return bound[0] if bound else None
+
+    # --------------------------------------------------------------------------
+    def components_of(self, component_type):
+        """
+        Returns all the components which are instances of the given type,
+        in component order.
+
+        :param component_type: Class type (or tuple of types) to look for
+
+        :return: list(instance, instance, ...)
+        """
+        return list(self._instances_of(component_type))
+
+    # --------------------------------------------------------------------------
+    def _lookup_methods(self, method_name):
+        """
+        Returns the bound methods of all the components which implement
+        the given method name, in component order.
+
+        Where this composition and a nested composition combine the method
+        with the same associative reducer (such as take_sum), the methods
+        of the nested composition are given in its place. Deeply nested
+        compositions therefore cost a single flat loop to call.
+
+        Which components implement the method is read from a plan shared by
+        every composition whose components are of the same classes in the
+        same order, so a new composition with a common layout does not
+        need to search its components. The methods are bound from that
+        plan on each call rather than being cached, so a composition holds
+        nothing of its own for them. Only attributes held directly by the
+        component instances are checked for each composition.
+
+        Methods the plan cannot resolve (such as those of layouts holding
+        nested compositions, or whilst instrumentation is switched on) are
+        instead looked up by searching the components, and cached per
+        method name until the component list changes. Attributes added to
+        a component after such a lookup will not be picked up until then.
+        The same applies to attribute redirection through __getattr__ and
+        __setattr__. Methods added to a component class after it has been
+        used in a composition are not picked up at all.
+
+        :param method_name: Name of the method to look for
+        :type method_name: str
+
+        :return: tuple(bound method, bound method, ...)
+        """
+        methods = self._shared_methods(method_name)
+
+        if methods is not None:
+            return methods
+
+        try:
+            return self._dispatch[method_name]
+
+        except (KeyError, TypeError):
+            methods = self._resolve_methods(method_name)
+            self._lazy('_dispatch')[method_name] = methods
+            return methods
+
+    # --------------------------------------------------------------------------
+    def _resolve_methods(self, method_name, flatten=True):
+        """
+        Looks up the bound methods of all the components which implement
+        the given method name, without caching them (see _lookup_methods).
+
+        :param method_name: Name of the method to look for
+        :type method_name: str
+
+        :param flatten: If False the methods of nested compositions are
+            never replaced by the methods they dispatch to, so each nested
+            composition is called in its own right (as when tracing).
+
+        :return: tuple(bound method, bound method, ...)
+        """
+        components = self._planned(method_name)
+        planned = components is not None
+
+        if not planned:
+            components = [
+                component
+                for component in self._components
+                if hasattr(component, method_name)
+            ]
+
+        methods = tuple([
+            getattr(component, method_name)
+            for component in components
+        ])
+
+        decorated = getattr(self.__class__, method_name, None)
+
+        # -- If the method has opted in to caching the results of each
+        # -- component we wrap each method with that cache
+        if getattr(decorated, '_cache_components', False):
+            methods = tuple(
+                caching.CachedMethod(
+                    component,
+                    method,
+                    method_name,
+                    self._lazy('_component_results').setdefault(
+                        id(component),
+                        dict(),
+                    ),
+                )
+                for component, method in zip(components, methods)
+            )
+
+        # -- Layouts holding nested compositions are never planned, so
+        # -- only the unplanned methods can be flattened
+        elif flatten and not planned:
+            methods = self._flatten(method_name, components, methods)
+
+        # -- When instrumentation is switched on every method is timed.
+        # -- Otherwise the methods are called directly.
+        if self._stats is not None:
+            methods = tuple(
+                instrumentation.TimedMethod(
+                    method,
+                    method_name,
+                    self._stats,
+                )
+                for method in methods
+            )
+
+        return methods
+
+    # -- The lookup every decorated method calls through. This is kept apart
+    # -- from _lookup_methods so that it can be replaced (such as by the
+    # -- Tracer) without the replacement reaching the cached methods of
+    # -- any composition.
+    _dispatch_methods = _lookup_methods
+
+    # --------------------------------------------------------------------------
+    def _flatten(self, method_name, components, methods):
+        """
+        Replaces the methods of any nested compositions with the methods
+        they dispatch to, where this does not change the combined result.
+
+        :param method_name: Name the methods were looked up with
+        :param components: The components which implement the method
+        :param methods: The bound method of each of those components
+
+        :return: tuple(bound method, bound method, ...)
+        """
+        decorated = getattr(self.__class__, method_name, None)
+        reducer = getattr(decorated, '_composite_reducer', None)
+
+        if reducer is None or not reducer.flattenable or \
+                not hasattr(decorated, '_composite_inner') or \
+                self._executor is not None:
+            return methods
+
+        flattened = list()
+
+        for component, method in zip(components, methods):
+            nested = getattr(component.__class__, method_name, None)
+
+            # -- The nested composition must combine the method in exactly
+            # -- the same way, with nothing layered on top (such as its
+            # -- own executor, caching or an instance override)
+            if not isinstance(component, _CompositionBase) or \
+                    getattr(nested, '_composite_inner', None) is not nested or \
+                    not _same_reducer(nested._composite_reducer, reducer) or \
+                    component._executor is not None or \
+                    getattr(nested, '_cache_components', False) or \
+                    method_name in _instance_dict(component):
+                flattened.append(method)
+                continue
+
+            nested_methods = component._lookup_methods(method_name)
+
+            # -- A nested composition without any methods still gives its
+            # -- empty result (or error), so it is called as normal
+            if nested_methods:
+                flattened.extend(nested_methods)
+
+            else:
+                flattened.append(method)
+
+        return tuple(flattened)
+
+    # --------------------------------------------------------------------------
+    def set_executor(self, executor):
+        """
+        Sets the executor used by decorated methods to call the components
+        concurrently. The results are still combined in component order.
+
+        Note that when an executor is set, every component is submitted
+        up front, so decorators which can stop early (such as take_first)
+        will only cancel the calls which have not yet started.
+
+        :param executor: A concurrent.futures.Executor, True to use the
+            thread pool shared between all compositions, or None to call
+            the components one after another (the default).
 
         :return: None
         """
-        self._components.append(component)
+        if executor is True:
+            executor = executors.shared_executor()
 
+        object.__setattr__(self, '_executor', executor)
+
+        # -- Nested compositions are only flattened when no executor is
+        # -- involved, so the dispatch caches must be rebuilt
+        self._invalidate()
 
     # --------------------------------------------------------------------------
-    def unbind(self, component_or_type):
+    def call_batch(self, method_name, arg_sets, **kwargs):
         """
-        Removes a components of a given type from the component
-        list.
+        Calls a method once for each set of arguments given, returning
+        a list with the result for each set of arguments.
 
-        :param component_or_type: Class Type or instance to remove
+        For decorated methods the component methods are only looked up
+        once, and each component is called for every set of arguments
+        before moving on to the next component. If a component has a
+        method named <method_name>_batch it is called once with the full
+        list of argument sets instead, and must return a result for
+        each of them in the same order.
 
-        :return:
+        The results for each set of arguments are then combined using
+        the rule of the decorator. Note that every component is called
+        for every set of arguments, even for decorators such as
+        take_first which would normally stop early, and that any memoize
+        decorator is bypassed. Asynchronous methods (see xcomposite.aio)
+        cannot be called in a batch.
+
+        :param method_name: Name of the method to call
+        :type method_name: str
+
+        :param arg_sets: Sequence of tuples of positional arguments
+        :type arg_sets: list(tuple, tuple, ...)
+
+        :param kwargs: Keyword arguments passed to every call
+
+        :return: list
         """
-        for component in self._components[:]:
-            if component == component_or_type:
-                self._components.remove(component)
-                return True
+        arg_sets = [tuple(args) for args in arg_sets]
 
-            try:
-                if isinstance(component, component_or_type):
-                    self._components.remove(component)
-                    return True
+        function = getattr(self.__class__, method_name, None)
+        reducer = getattr(function, '_composite_reducer', None)
+
+        # -- Undecorated methods are simply called for each set
+        # -- of arguments
+        if reducer is None:
+            method = getattr(self, method_name)
+            return [method(*args, **kwargs) for args in arg_sets]
 
-            except TypeError:
+        # -- The results of asynchronous methods would be coroutines, which
+        # -- the reducer cannot combine
+        if inspect.iscoroutinefunction(function):
+            raise TypeError(
+                'Cannot call the asynchronous method %s in a batch'
+                % method_name,
+            )
+
+        methods = self._dispatch_methods(method_name)
+
+        if reducer.reverse:
+            methods = methods[::-1]
+
+        batch_name = method_name + '_batch'
+        columns = list()
+
+        for method in methods:
+            owner = getattr(method, '__self__', None)
+
+            # -- A nested composition combines the results of its own
+            # -- components, which may have batch methods of their own.
+            # -- Looking up the batch method on it directly would redirect
+            # -- to just one of its components.
+            if isinstance(owner, _CompositionBase):
+                columns.append(
+                    owner.call_batch(method_name, arg_sets, **kwargs),
+                )
                 continue
-        return False
+
+            batch = getattr(owner, batch_name, None)
+
+            if batch is not None:
+                column = list(batch(arg_sets, **kwargs))
+
+                if len(column) != len(arg_sets):
+                    raise ValueError(
+                        '%s gave %s results for %s sets of arguments' % (
+                            batch,
+                            len(column),
+                            len(arg_sets),
+                        ),
+                    )
+
+                columns.append(column)
+
+            else:
+                columns.append(
+                    [method(*args, **kwargs) for args in arg_sets]
+                )
+
+        # -- Each row holds the result of every component for a single
+        # -- set of arguments
+        rows = zip(*columns) if columns else [()] * len(arg_sets)
+
+        return [
+            reducer.reduce(
+                result
+                for result in row
+                if not isinstance(result, Ignore)
+            )
+            for row in rows
+        ]
+
+    # --------------------------------------------------------------------------
+    def cache_info(self):
+        """
+        Returns the statistics of the caches of any memoized methods
+        which have been called on this composition.
+
+        :return: dict(method_name: dict(hits, misses, size, maxsize, ttl))
+        """
+        return dict(
+            (method_name, cache.info())
+            for method_name, cache in (self._memo or dict()).items()
+        )
+
+    # --------------------------------------------------------------------------
+    def enable_stats(self):
+        """
+        Switches on the recording of the call count, timings and exception
+        count of each component method this composition dispatches to.
+        See xcomposite.instrumentation for details.
+
+        :return: None
+        """
+        if self._stats is None:
+            object.__setattr__(self, '_stats', instrumentation.CallStats())
+            self._invalidate()
+
+    # --------------------------------------------------------------------------
+    def disable_stats(self):
+        """
+        Switches off the recording of stats, dropping any stats recorded
+        so far.
+
+        :return: None
+        """
+        if self._stats is not None:
+            object.__setattr__(self, '_stats', None)
+            self._invalidate()
+
+    # --------------------------------------------------------------------------
+    def call_stats(self):
+        """
+        Returns the stats recorded for each pair of method name and
+        component class, such as:
+
+            {('speed', Legs): {'count': 2, 'total': 0.1, 'min': 0.04,
+            'max': 0.06, 'exceptions': 0}}
+
+        :return: dict
+        """
+        if self._stats is None:
+            return dict()
+
+        return self._stats.dump()
+
+    # --------------------------------------------------------------------------
+    def reset_stats(self):
+        """
+        Drops the stats recorded so far, leaving recording switched on if
+        it already is.
+
+        :return: None
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    # --------------------------------------------------------------------------
+    def mark_dirty(self, component=None):
+        """
+        Drops the cached results of the given component for any methods
+        decorated with cache_components, meaning it will be called again
+        the next time those methods are called. Components are marked
+        dirty automatically when an attribute is set on them through
+        this composition.
+
+        :param component: Component instance to mark as dirty, or None
+            to mark every component as dirty
+
+        :return: None
+        """
+        if not self._component_results:
+            return
+
+        if component is None:
+            for cache in self._component_results.values():
+                cache.clear()
+
+            return
+
+        cache = self._component_results.get(id(component))
+
+        if cache:
+            cache.clear()
+
+    # --------------------------------------------------------------------------
+    def _owner(self, name):
+        """
+        Returns the first component which has an attribute with the given
+        name, or None if no component has it. The result is cached per
+        name and only rebuilt when the component list changes.
+
+        :param name: Name of the attribute to look for
+        :type name: str
+
+        :return: instance or None
+        """
+        try:
+            return self._owners[name]
+
+        except (KeyError, TypeError):
+            owner = None
+            components = self._planned(name)
+
+            if components is None:
+                for component in self._components:
+                    if hasattr(component, name):
+                        owner = component
+                        break
+
+            elif components:
+                owner = components[0]
+
+            self._lazy('_owners')[name] = owner
+            return owner
+
+    # --------------------------------------------------------------------------
+    def _planned(self, name):
+        """
+        Returns the components which have an attribute with the given name
+        in component order, using the dispatch plan shared by every
+        composition with the same layout of component classes. None is
+        returned where the plan cannot tell which components have it.
+
+        :param name: Name of the attribute to look for
+        :type name: str
+
+        :return: list(instance, instance, ...) or None
+        """
+        components = self._components
+        entries = self._layout_plan().entries(name)
+
+        if entries is None:
+            return None
+
+        found = list()
+
+        for index, checked in entries:
+            component = components[index]
+
+            # -- Planned classes resolve attributes in the default way, so
+            # -- their __dict__ can be read directly
+            if not checked or name in component.__dict__:
+                found.append(component)
+
+        return found
+
+    # --------------------------------------------------------------------------
+    def _layout_plan(self):
+        """
+        Returns the dispatch plan shared by every composition with the
+        same layout of composition and component classes as this one.
+
+        :return: _DispatchPlan
+        """
+        plan = self._plan
+
+        # -- The component list may change within a batch without the
+        # -- plan being dropped, so it is only kept once it is settled
+        if plan is None or self._batch_depth:
+            plan = _dispatch_plan(
+                self.__class__,
+                tuple(map(type, self._components)),
+            )
+
+            if not self._batch_depth:
+                object.__setattr__(self, '_plan', plan)
+
+        return plan
+
+    # --------------------------------------------------------------------------
+    def _shared_methods(self, method_name):
+        """
+        Returns the bound methods of all the components which implement
+        the given method name, made from the shared dispatch plan rather
+        than being cached on this composition. None is returned where the
+        plan cannot give them, in which case they are looked up and cached
+        as normal.
+
+        :param method_name: Name of the method to look for
+        :type method_name: str
+
+        :return: tuple(bound method, bound method, ...) or None
+        """
+        if self._stats is not None:
+            return None
+
+        plan = self._plan
+
+        if plan is None or self._batch_depth:
+            plan = self._layout_plan()
+
+        try:
+            calls = plan._calls[method_name]
+
+        except KeyError:
+            calls = plan.calls(method_name)
+
+        if calls is None:
+            return None
+
+        components = self._components
+        methods = list()
+
+        for index, function, checked, has_dict in calls:
+            component = components[index]
+
+            # -- An instance attribute takes precedence over the class, and
+            # -- may be the only implementation. getattr resolves this without
+            # -- making the instance build its __dict__.
+            if has_dict:
+                method = getattr(component, method_name, _MISSING)
+
+                if method is not _MISSING:
+                    methods.append(method)
+
+            elif function is None:
+                methods.append(getattr(component, method_name))
+
+            else:
+                methods.append(_MethodType(function, component))
+
+        return tuple(methods)
+
+    # --------------------------------------------------------------------------
+    def _type_index(self):
+        """
+        Returns the index of class to the bound instances of that class,
+        building it if it does not yet exist.
+
+        :return: dict
+        """
+        types = self._types
+
+        if types is None:
+            types = dict()
+            object.__setattr__(self, '_types', types)
+
+            for component in self._components:
+                self._index_component(component)
+
+        return types
+
+    # --------------------------------------------------------------------------
+    def _index_component(self, component):
+        """
+        Adds the given component to the type index under every class it
+        inherits from. It is expected to be the last component.
+
+        :return: None
+        """
+        types = self._types
+
+        # -- Everything is an object, so that is served by the component
+        # -- list itself rather than being indexed
+        for cls in type(component).__mro__[:-1]:
+            try:
+                types[cls].append(component)
+
+            except KeyError:
+                types[cls] = [component]
+
+    # --------------------------------------------------------------------------
+    def _unindex_component(self, component):
+        """
+        Removes the given component from the type index.
+
+        :return: None
+        """
+        types = self._types
+
+        for cls in type(component).__mro__[:-1]:
+            bound = types[cls]
+            bound.remove(component)
+
+            if not bound:
+                del types[cls]
+
+    # --------------------------------------------------------------------------
+    def _instances_of(self, component_type):
+        """
+        Returns the bound instances of the given type in component order.
+        The returned list must not be modified.
+
+        :param component_type: Class type (or tuple of types)
+
+        :return: list(instance, instance, ...)
+        """
+        if component_type is object:
+            return self._components
+
+        # -- Types which customise isinstance (such as abstract base
+        # -- classes with registered subclasses) and tuples of types
+        # -- cannot be resolved through the index
+        if type(component_type) is type:
+            return self._type_index().get(component_type, ())
+
+        return [
+            component
+            for component in self._components
+            if isinstance(component, component_type)
+        ]
+
+    # --------------------------------------------------------------------------
+    def _initialised(self):
+        """
+        Returns True once the internal state has been set up by __init__
+        (or by unpickling).
+
+        :return: bool
+        """
+        try:
+            object.__getattribute__(self, '_components')
+
+        except AttributeError:
+            return False
+
+        return True
+
+    # --------------------------------------------------------------------------
+    def _lazy(self, name):
+        """
+        Returns the cache dictionary held in the given internal attribute,
+        creating it if it does not yet exist.
+
+        :param name: Name of the internal attribute
+
+        :return: dict
+        """
+        cache = object.__getattribute__(self, name)
+
+        if cache is None:
+            cache = dict()
+            object.__setattr__(self, name, cache)
+
+        return cache
+
+    # --------------------------------------------------------------------------
+    def _add_parent(self, parent):
+        """
+        Registers an object which should be told (through its _invalidate
+        method) whenever the components of this composition change.
+
+        :param parent: Composition or CompositionGroup
+
+        :return: None
+        """
+        if self._parents is None:
+            object.__setattr__(self, '_parents', weakref.WeakSet())
+
+        self._parents.add(parent)
+
+    # --------------------------------------------------------------------------
+    def _discard_parent(self, parent):
+        """
+        Stops the given object being told when the components of this
+        composition change.
+
+        :param parent: Composition or CompositionGroup
+
+        :return: None
+        """
+        if self._parents is not None:
+            self._parents.discard(parent)
+
+    # --------------------------------------------------------------------------
+    def _invalidate(self):
+        """
+        Drops all the cached dispatch data for this composition and any
+        composition this composition is bound into.
+
+        :return: None
+        """
+        # -- The batch will invalidate once all its changes are made
+        if self._batch_depth:
+            return
+
+        # -- Only the caches which exist are dropped, as most compositions
+        # -- are bound to before they are ever called
+        if self._dispatch is not None:
+            object.__setattr__(self, '_dispatch', None)
+
+        if self._owners is not None:
+            object.__setattr__(self, '_owners', None)
+
+        if self._component_results is not None:
+            object.__setattr__(self, '_component_results', None)
+
+        if self._plan is not None:
+            object.__setattr__(self, '_plan', None)
+
+        # -- The memoize caches are cleared rather than dropped, so their
+        # -- statistics are kept
+        if self._memo:
+            for cache in self._memo.values():
+                cache.clear()
+
+        if self._parents:
+            for parent in list(self._parents):
+                parent._invalidate()
+
+    # --------------------------------------------------------------------------
+    def bind(self, component, priority=0):
+        """
+        Adds a component to the class. From the point a component is added
+        it is melded to this class and all decorated calls will incorporate
+        this component.
+
+        Components are kept in order of their priority, lowest first, and
+        components of equal priority are kept in the order they were bound.
+        This is the order decorators such as take_first and take_last
+        resolve precedence by.
+
+        :param component: Component to meld
+        :type component: Class
+
+        :param priority: Where to place the component amongst the others
+        :type priority: int
+
+        :return: None
+        """
+        if isinstance(component, _CompositionBase) and \
+                self._is_within(component):
+            raise ValueError(
+                'Binding %s into %s would create a cycle' % (component, self),
+            )
+
+        index = self._insertion_index(priority)
+        self._insert_component(index, component)
+
+        if self._priorities is not None:
+            self._priorities.insert(index, priority)
+
+        if self._types is not None:
+            # -- The type index can only be appended to in order, so it
+            # -- is rebuilt if the component went anywhere but the end
+            if index == len(self._components) - 1:
+                self._index_component(component)
+
+            else:
+                object.__setattr__(self, '_types', None)
+
+        if isinstance(component, _CompositionBase):
+            component._add_parent(self)
+
+        self._invalidate()
+
+    # --------------------------------------------------------------------------
+    def set_priority(self, component, priority):
+        """
+        Moves a bound component to the position given by its new priority,
+        as if it had been unbound and bound again with that priority.
+
+        :param component: Bound component instance
+        :param priority: The new priority of the component
+
+        :return: None
+        """
+        index = self._components.index(component)
+        component = self._components[index]
+
+        with self.batch_changes():
+            self._remove(component, index)
+            self.bind(component, priority)
+
+    # --------------------------------------------------------------------------
+    def _is_within(self, composition):
+        """
+        Returns True if this is the given composition, or is bound within
+        it at any depth. This walks up through the parents, so only needs
+        to visit the compositions this one is nested within.
+
+        :param composition: xcomposite.Composition
+
+        :return: bool
+        """
+        pending = [self]
+        visited = set()
+
+        while pending:
+            current = pending.pop()
+
+            if current is composition:
+                return True
+
+            if id(current) in visited:
+                continue
+
+            visited.add(id(current))
+
+            # -- Parents may also be groups, which are not nested within
+            # -- anything
+            parents = getattr(current, '_parents', None)
+
+            if parents:
+                pending.extend(parents)
+
+        return False
+
+    # --------------------------------------------------------------------------
+    def _insertion_index(self, priority):
+        """
+        Returns the index a component with the given priority should be
+        inserted at.
+
+        :param priority: Priority of the component being bound
+
+        :return: int
+        """
+        priorities = self._priorities
+
+        if priorities is None:
+            # -- Every component has the default priority, so a default
+            # -- priority component is simply appended
+            if not priority:
+                return len(self._components)
+
+            priorities = [0] * len(self._components)
+            object.__setattr__(self, '_priorities', priorities)
+
+        return bisect.bisect_right(priorities, priority)
+
+    # --------------------------------------------------------------------------
+    def unbind(self, component_or_type):
+        """
+        Removes a components of a given type from the component
+        list. Components are found through the type index, so this does
+        not need to check every bound component.
+
+        :param component_or_type: Class Type or instance to remove
+
+        :return: True if a component was removed
+        """
+        # -- An instance is looked for amongst the components of its own
+        # -- type, rather than checking every component
+        bound = self._type_index().get(type(component_or_type), ())
+
+        for component in bound:
+            if component == component_or_type:
+                self._remove(component)
+                return True
+
+        # -- Instances the index cannot find (such as a plain object, or
+        # -- one which compares equal to a component of another type) are
+        # -- looked for amongst every component
+        if not isinstance(component_or_type, type):
+            for index, component in enumerate(self._components):
+                if component == component_or_type:
+                    self._remove(component, index)
+                    return True
+
+        try:
+            component = self.get_component(component_or_type)
+
+        except TypeError:
+            return False
+
+        if component is None:
+            return False
+
+        self._remove(component)
+        return True
+
+    # --------------------------------------------------------------------------
+    def _remove(self, component, index=None):
+        """
+        Removes the given component instance from the component list and
+        drops any cached dispatch data.
+
+        :param component: Component instance to remove
+        :param index: Index of the component, if it is already known
+
+        :return: None
+        """
+        if index is None:
+            index = self._components.index(component)
+
+        self._remove_component(index)
+
+        if self._priorities is not None:
+            del self._priorities[index]
+
+        if self._types is not None:
+            self._unindex_component(component)
+
+        if isinstance(component, _CompositionBase):
+            component._discard_parent(self)
+
+        self._invalidate()
+
+    # --------------------------------------------------------------------------
+    def bind_many(self, components, priority=0):
+        """
+        Binds all the given components, in order, dropping the cached
+        dispatch data only once rather than after each component.
+
+        :param components: Iterable of components to bind
+        :param priority: Priority to bind each of the components with
+
+        :return: None
+        """
+        with self.batch_changes():
+            for component in components:
+                self.bind(component, priority)
+
+    # --------------------------------------------------------------------------
+    def unbind_many(self, components_or_types):
+        """
+        Unbinds each of the given components or types in turn (see unbind),
+        dropping the cached dispatch data only once.
+
+        :param components_or_types: Iterable of class types or instances
+
+        :return: The number of components which were removed
+        """
+        removed = 0
+
+        with self.batch_changes():
+            for component_or_type in components_or_types:
+                removed += self.unbind(component_or_type)
+
+        return removed
+
+    # --------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def batch_changes(self):
+        """
+        Context manager which applies all the binds and unbinds made within
+        it at once. The cached dispatch data is dropped (and any parent
+        compositions informed) only when the outermost batch finishes, so
+        the composition should not be called until then.
+
+        >>> with composition.batch_changes():
+        ...     composition.unbind(Walking)
+        ...     composition.bind(Running())
+
+        :return: This composition
+        """
+        depth = self._batch_depth or 0
+        components = self._components
+
+        # -- Work on a list for the duration of the batch, so each change
+        # -- does not need to rebuild a tuple of components
+        if not depth and not isinstance(components, list):
+            object.__setattr__(self, '_components', list(components))
+
+        object.__setattr__(self, '_batch_depth', depth + 1)
+
+        try:
+            yield self
+
+        finally:
+            object.__setattr__(self, '_batch_depth', depth)
+
+            if not depth:
+                components = self._components
+
+                if not isinstance(components, self._component_store):
+                    object.__setattr__(
+                        self,
+                        '_components',
+                        self._component_store(components),
+                    )
+
+                self._invalidate()
+
+    # --------------------------------------------------------------------------
+    def _insert_component(self, index, component):
+        """
+        Inserts a component into the component store at the given index.
+
+        :return: None
+        """
+        components = self._components
+
+        if isinstance(components, list):
+            components.insert(index, component)
+            return
+
+        object.__setattr__(
+            self,
+            '_components',
+            components[:index] + (component,) + components[index:],
+        )
+
+    # --------------------------------------------------------------------------
+    def _remove_component(self, index):
+        """
+        Removes the component at the given index from the component store.
+
+        :return: None
+        """
+        components = self._components
+
+        if isinstance(components, list):
+            del components[index]
+            return
+
+        object.__setattr__(
+            self,
+            '_components',
+            components[:index] + components[index + 1:],
+        )
+
+
+# ------------------------------------------------------------------------------
+class Composition(_CompositionBase):
+    """
+    This should be used as the base class for any class which needs to
+    be composited.
+
+    When inheriting this class you must decorate any methods you want
+    to utilise the composition mechanism. The decorator you choose
+    to use defines the behaviour of how the results will be combined or
+    selected.
+
+    If a method is not decorated it will be expected to exist on the
+    base class directly.
+
+    >>> import xcomposite
+    >>>
+    >>>
+    >>> # -- Inheriting off the composition class means that your class can
+    >>> # -- immediately bind any other class which is of a Composition type.
+    >>> # -- You should declare (through composite decorators) what the
+    >>> # -- expactation is of any bound methods. This allows you to tailor
+    >>> # -- exactly how the results should be combined/returned.
+    >>> class Definition(xcomposite.Composition):
+    ...
+    ...     @xcomposite.extend_results
+    ...     def items(self):
+    ...         return ['a', 'b']
+    >>>
+    >>>
+    >>> class MyObject(object):
+    ...
+    ...     def items(self):
+    ...         return ['x', 'y']
+    >>>
+    >>>
+    >>> # -- Instance any one of the classes, and bind it to the instance
+    >>> # -- of the other
+    >>> definition = Definition()
+    >>> definition.bind(MyObject())
+    >>>
+    >>> # -- Call the items method, noting that the result is the expected
+    >>> # -- list of items from the 'items' call of both A and B
+    >>> print(definition.items())
+    ['a', 'b', 'x', 'y']
+    """
+
+
+# ------------------------------------------------------------------------------
+class SlottedComposition(_CompositionBase):
+    """
+    A compact equivalent of Composition, intended for when there are a very
+    large number of compositions. This does not have a __dict__ and holds
+    its components in a tuple, so each instance uses a fraction of the
+    memory of a Composition whilst binding, unbinding and the composite
+    decorators all behave in the same way.
+
+    Because there is no __dict__, any attribute which is not owned by a
+    component must be declared in the __slots__ of the subclass:
+
+    >>> class Entity(xcomposite.SlottedComposition):
+    ...
+    ...     __slots__ = ('name',)
+    ...
+    ...     @xcomposite.take_sum
+    ...     def speed(self):
+    ...         return 0
+    """
+    __slots__ = ('__weakref__',)
+
+    _component_store = tuple
 
 
 # ------------------------------------------------------------------------------
@@ -1,81 +1,239 @@
+import concurrent.futures
+import functools
+
+from . import executors
+from . import reducers
+from . import tracing
 from .core import Ignore
 
 
 # ------------------------------------------------------------------------------
-def _methods(composition_class, method_name):
+def _results(composition, method_name, methods, args, kwargs):
     """
-    Convenience function for getting a list of all the methods
-    which require calling.
+    Convenience function which calls each of the given methods, yielding
+    every result which is not an Ignore instance in the order of the
+    methods given.
+
+    If the composition has an executor the methods are all submitted to
+    it up front, otherwise each method is only called as the results are
+    consumed - so a caller which stops iterating early will not call
+    the remaining methods.
+
+    :param composition: xcomposite.Composition the methods belong to
+    :param method_name: Name the methods were looked up with
+    :param methods: Sequence of bound methods to call
+    :param args: Tuple of args to pass to each call
+    :param kwargs: Dictionary of keyword arguments to pass to each call
+
+    :return: Generator of results
     """
-    return [
-        getattr(component, method_name)
-        for component in composition_class.components()
-        if hasattr(component, method_name)
-    ]
+    executor = composition._executor
+
+    if executor is None or executors.running_in(executor):
+        return _serial_results(methods, args, kwargs)
+
+    return _concurrent_results(executor, method_name, methods, args, kwargs)
 
 
 # ------------------------------------------------------------------------------
-def _results(composition_class, method_name, *args, **kwargs):
+def _hedged_results(composition, method_name, methods, args, kwargs):
     """
-    Convenience function for return all teh results for the methods
-    with the given name on the class.
+    Variation of _results which always calls the methods concurrently,
+    using the shared executor where the composition has none of its own.
+
+    As the results are still yielded in method order a reducer which
+    stops early receives the first valid result as soon as every method
+    ahead of it has answered, and any calls which have not started by
+    then are cancelled.
 
-    :param composition_class: xcomposite.Composition 
-    :param method_name: Name of method to call
-    :param args: Args to pass to call
-    :param kwargs: Keyword arguments to pass
+    :param composition: xcomposite.Composition the methods belong to
+    :param method_name: Name the methods were looked up with
+    :param methods: Sequence of bound methods to call
+    :param args: Tuple of args to pass to each call
+    :param kwargs: Dictionary of keyword arguments to pass to each call
 
-    :return: List of results 
+    :return: Generator of results
     """
-    results = list()
+    executor = composition._executor or executors.shared_executor()
 
-    for method in _methods(composition_class, method_name):
-        result = method(*args[1:], **kwargs)
+    # -- Waiting on the pool from within one of its own workers could
+    # -- leave every worker waiting, so those calls are made serially
+    if len(methods) < 2 or executors.running_in(executor):
+        return _serial_results(methods, args, kwargs)
 
-        if not isinstance(result, Ignore):
-            results.append(result)
+    return _concurrent_results(executor, method_name, methods, args, kwargs)
 
-    return results
+
+# ------------------------------------------------------------------------------
+def _serial_results(methods, args, kwargs):
+    """
+    Calls each method in turn, yielding each result which is not
+    an Ignore instance.
+    """
+    for method in methods:
+        result = method(*args, **kwargs)
+
+        if not isinstance(result, Ignore):
+            yield result
 
 
 # ------------------------------------------------------------------------------
-def take_min(func):
+def _concurrent_results(executor, method_name, methods, args, kwargs):
     """
-    This decorator assumes a numeric return from each method and will
-    return the smallest value.
+    Submits all the methods to the executor and yields each result
+    which is not an Ignore instance in method order. Any calls which
+    have not started when the consumer stops iterating are cancelled.
+
+    If the call is made within a Deadline, the results of any methods
+    which do not finish in time are skipped and recorded on the deadline.
     """
+    futures = executors.submit(executor, method_name, methods, args, kwargs)
+    deadline = executors.current_deadline()
+
+    try:
+        for method, future in zip(methods, futures):
+            if deadline is None:
+                result = future.result()
+
+            else:
+                # -- Calls which have already finished are still used once
+                # -- the deadline has passed, as waiting costs nothing
+                try:
+                    result = future.result(timeout=deadline.remaining())
 
-    def inner(*args, **kwargs):
-        return min(
-            _results(
-                args[0],
-                func.__name__,
-                *args,
-                **kwargs
+                except concurrent.futures.TimeoutError:
+                    deadline.drop(method_name, method)
+                    continue
+
+            if not isinstance(result, Ignore):
+                yield result
+
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+# ------------------------------------------------------------------------------
+def _composite(func, reducer, hedged=False):
+    """
+    Builds the callable which replaces a decorated method. The callable
+    looks up the component methods with the same name as the decorated
+    function and feeds the stream of their results to the reducer, whose
+    outcome is given back to the caller.
+
+    The reducer is also recorded on the callable, allowing the composition
+    to apply the same rule outside of a normal call (such as in
+    Composition.call_batch).
+
+    :param func: The function being decorated
+    :param reducer: xcomposite.Reducer instance
+    :param hedged: If True the components are always called concurrently
+        (see _hedged_results)
+
+    :return: function
+    """
+    method_name = func.__name__
+    reduce = reducer.reduce
+    results = _hedged_results if hedged else _results
+
+    if reducer.reverse:
+        @functools.wraps(func)
+        def inner(self, *args, **kwargs):
+            return reduce(
+                results(
+                    self,
+                    method_name,
+                    self._dispatch_methods(method_name)[::-1],
+                    args,
+                    kwargs,
+                ),
             )
-        )
 
+    else:
+        @functools.wraps(func)
+        def inner(self, *args, **kwargs):
+            return reduce(
+                results(
+                    self,
+                    method_name,
+                    self._dispatch_methods(method_name),
+                    args,
+                    kwargs,
+                ),
+            )
+
+    # -- Name the closure after the decorated method, so it can be told
+    # -- apart from every other decorated method when profiling
+    tracing.name_after(inner, func)
+    inner._composite_reducer = reducer
+
+    # -- Wrappers of this callable (such as memoize) copy its attributes,
+    # -- so this lets a composition tell an undecorated use of the reducer
+    # -- apart from one with further behaviour layered on top
+    inner._composite_inner = inner
     return inner
 
 
 # ------------------------------------------------------------------------------
-def take_max(func):
+def composite(reducer):
+    """
+    This decorator combines the results using the given reducer, allowing
+    custom ways of combining results to be defined. See xcomposite.Reducer
+    for details of the protocol.
+
+        @xcomposite.composite(reducer=BitwiseOr())
+        def flags(self):
+            return 0
+
+    :param reducer: xcomposite.Reducer instance (or class, which will be
+        instanced with no arguments)
+
+    :return: decorator
+    """
+    if isinstance(reducer, type):
+        reducer = reducer()
+
+    def decorator(func):
+        return _composite(func, reducer)
+
+    return decorator
+
+
+# -- The reducers used by the built in decorators. These hold no state
+# -- so they are shared between every decorated method.
+_MIN = reducers.MinReducer()
+_MAX = reducers.MaxReducer()
+_SUM = reducers.SumReducer()
+_AVERAGE = reducers.AverageReducer()
+_RANGE = reducers.RangeReducer()
+_FIRST = reducers.FirstReducer()
+_FIRST_TRUE = reducers.FirstTrueReducer()
+_LAST = reducers.LastReducer()
+_APPEND = reducers.AppendReducer()
+_APPEND_UNIQUE = reducers.AppendUniqueReducer()
+_EXTEND = reducers.ExtendReducer()
+_EXTEND_UNIQUE = reducers.ExtendUniqueReducer()
+_UPDATE = reducers.UpdateReducer()
+_ITER = reducers.IterReducer()
+_CHAIN = reducers.ChainReducer()
+
+
+# ------------------------------------------------------------------------------
+def take_min(func):
     """
     This decorator assumes a numeric return from each method and will
-    return the highest value.
+    return the smallest value.
     """
+    return _composite(func, _MIN)
 
-    def inner(*args, **kwargs):
-        return max(
-            _results(
-                args[0],
-                func.__name__,
-                *args,
-                **kwargs
-            )
-        )
 
-    return inner
+# ------------------------------------------------------------------------------
+def take_max(func):
+    """
+    This decorator assumes a numeric return from each method and will
+    return the highest value.
+    """
+    return _composite(func, _MAX)
 
 
 # ------------------------------------------------------------------------------
@@ -84,18 +242,7 @@ def take_sum(func):
     This decorator assumes a numeric return from each method and will
     return the sum of all the values. 
     """
-
-    def inner(*args, **kwargs):
-        return sum(
-            _results(
-                args[0],
-                func.__name__,
-                *args,
-                **kwargs
-            )
-        )
-
-    return inner
+    return _composite(func, _SUM)
 
 
 # ------------------------------------------------------------------------------
@@ -104,77 +251,136 @@ def take_average(func):
     This decorator assumes a numeric return from each method and will
     return the average (mean) of all the values.
     """
-
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-
-        sum_of_results = sum(results)
-
-        if sum_of_results == 0:
-            return sum_of_results
-
-        return sum_of_results / len(results)
-
-    return inner
+    return _composite(func, _AVERAGE)
 
 
 # ------------------------------------------------------------------------------
-def take_first(func):
+def take_first(func=None, hedged=False):
     """
     This decorator will return the first item returned from any of the
     composited methods.
+
+    Pass hedged=True to call all the components concurrently, so that
+    a slow component does not hold up those which follow it:
+
+        @xcomposite.take_first(hedged=True)
+
+    The result is the same as when the components are called one after
+    another, but it is given back as soon as every component ahead of the
+    winning one has answered. Calls which have not started by then are
+    cancelled, though calls which are already running are left to finish.
     """
-    def inner(*args, **kwargs):
-        for method in _methods(args[0], func.__name__):
-            result = method(*args[1:], **kwargs)
+    if func is None:
+        return functools.partial(take_first, hedged=hedged)
+
+    if hedged:
+        return _composite(func, _FIRST, hedged=True)
+
+    method_name = func.__name__
+    composed = _composite(func, _FIRST)
+
+    # -- When calling the components one after another we can avoid the
+    # -- overhead of the reducer entirely
+    @functools.wraps(composed)
+    def inner(self, *args, **kwargs):
+        if self._executor is not None:
+            return composed(self, *args, **kwargs)
+
+        for method in self._dispatch_methods(method_name):
+            result = method(*args, **kwargs)
+
             if not isinstance(result, Ignore):
                 return result
 
         return None
 
-    return inner
+    return tracing.name_after(inner, func)
 
 
 # ------------------------------------------------------------------------------
-def first_true(func):
+def first_true(func=None, hedged=False):
     """
     This decorator will return the first item returned from any of the
     composited methods.
+
+    Pass hedged=True to call all the components concurrently, so that
+    a slow component does not hold up those which follow it:
+
+        @xcomposite.first_true(hedged=True)
+
+    The result is the same as when the components are called one after
+    another, but it is given back as soon as every component ahead of the
+    winning one has answered. Calls which have not started by then are
+    cancelled, though calls which are already running are left to finish.
     """
-    def inner(*args, **kwargs):
-        for method in _methods(args[0], func.__name__):
-            result = method(*args[1:], **kwargs)
+    if func is None:
+        return functools.partial(first_true, hedged=hedged)
+
+    if hedged:
+        return _composite(func, _FIRST_TRUE, hedged=True)
+
+    method_name = func.__name__
+    composed = _composite(func, _FIRST_TRUE)
+
+    # -- When calling the components one after another we can avoid the
+    # -- overhead of the reducer entirely
+    @functools.wraps(composed)
+    def inner(self, *args, **kwargs):
+        if self._executor is not None:
+            return composed(self, *args, **kwargs)
+
+        for method in self._dispatch_methods(method_name):
+            result = method(*args, **kwargs)
 
             if result and not isinstance(result, Ignore):
                 return result
 
         return None
 
-    return inner
+    return tracing.name_after(inner, func)
 
 
 # ------------------------------------------------------------------------------
-def take_last(func):
+def take_last(func=None, hedged=False):
     """
     This decorator will return the last item returned from any of the
     composited methods.
+
+    Pass hedged=True to call all the components concurrently, so that
+    a slow component does not hold up those which follow it:
+
+        @xcomposite.take_last(hedged=True)
+
+    The result is the same as when the components are called one after
+    another, but it is given back as soon as every component after the
+    winning one has answered. Calls which have not started by then are
+    cancelled, though calls which are already running are left to finish.
     """
+    if func is None:
+        return functools.partial(take_last, hedged=hedged)
+
+    if hedged:
+        return _composite(func, _LAST, hedged=True)
 
-    def inner(*args, **kwargs):
-        for method in reversed(_methods(args[0], func.__name__)):
-            result = method(*args[1:], **kwargs)
+    method_name = func.__name__
+    composed = _composite(func, _LAST)
+
+    # -- When calling the components one after another we can avoid the
+    # -- overhead of the reducer entirely
+    @functools.wraps(composed)
+    def inner(self, *args, **kwargs):
+        if self._executor is not None:
+            return composed(self, *args, **kwargs)
+
+        for method in reversed(self._dispatch_methods(method_name)):
+            result = method(*args, **kwargs)
 
             if not isinstance(result, Ignore):
                 return result
 
         return None
 
-    return inner
+    return tracing.name_after(inner, func)
 
 
 # ------------------------------------------------------------------------------
@@ -183,23 +389,7 @@ def extend_results(func):
     This decorator assumes all returns are lists and will use list.extend
     on each list given resulting in a single list of all results.
     """
-
-    def inner(*args, **kwargs):
-        extended_results = list()
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-
-        for result in results:
-            if not isinstance(result, Ignore):
-                extended_results.extend(result)
-
-        return extended_results
-
-    return inner
+    return _composite(func, _EXTEND)
 
 
 # ------------------------------------------------------------------------------
@@ -208,23 +398,7 @@ def extend_unique(func):
     This decorator assumes all returns are lists and will use list.extend
     on each list given resulting in a single list of all results.
     """
-
-    def inner(*args, **kwargs):
-        extended_results = list()
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-
-        for result in results:
-            if not isinstance(result, Ignore):
-                extended_results.extend(result)
-
-        return list(dict.fromkeys(extended_results))
-
-    return inner
+    return _composite(func, _EXTEND_UNIQUE)
 
 
 # ------------------------------------------------------------------------------
@@ -232,113 +406,68 @@ def update_dictionary(func):
     """
     This decorator will update each dictionary results in order
     """
-
-    def inner(*args, **kwargs):
-        output = dict()
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-
-        for result in results:
-            if not isinstance(result, Ignore):
-                output.update(result)
-
-        return output
-
-    return inner
+    return _composite(func, _UPDATE)
 
 
 # ------------------------------------------------------------------------------
-def absolute_false(func):
+def absolute_false(func=None, exhaustive=False):
     """
     Returns False if all elements evaluate to False, otherwise True
     is returned.
-    """
-
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
 
-        for result in results:
-            if result:
-                return True
-        return False
+    Like any_true, this stops calling components once the answer is
+    known unless exhaustive=True is given.
+    """
+    if func is None:
+        return functools.partial(absolute_false, exhaustive=exhaustive)
 
-    return inner
+    return _composite(func, reducers.AnyReducer(exhaustive=exhaustive))
 
 
 # ------------------------------------------------------------------------------
-def absolute_true(func):
+def absolute_true(func=None, exhaustive=False):
     """
     Returns True if all elements evaluate to True, otherwise False
     is returned.
-    """
-
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
 
-        for result in results:
-            if not result:
-                return False
-        return True
+    Like any_true, this stops calling components once the answer is
+    known unless exhaustive=True is given.
+    """
+    if func is None:
+        return functools.partial(absolute_true, exhaustive=exhaustive)
 
-    return inner
+    return _composite(func, reducers.AllReducer(exhaustive=exhaustive))
 
 
 # ------------------------------------------------------------------------------
-def any_false(func):
+def any_false(func=None, exhaustive=False):
     """
     If any items are False, then false is returned.
-    """
-
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
 
-        for result in results:
-            if not result:
-                return False
-        return True
+    Like any_true, this stops calling components once the answer is
+    known unless exhaustive=True is given.
+    """
+    if func is None:
+        return functools.partial(any_false, exhaustive=exhaustive)
 
-    return inner
+    return _composite(func, reducers.AllReducer(exhaustive=exhaustive))
 
 
 # ------------------------------------------------------------------------------
-def any_true(func):
+def any_true(func=None, exhaustive=False):
     """
     If any items are True, then True is returned.
-    """
 
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
+    Components are called in order and no further components are called
+    once the answer is known. Pass exhaustive=True to always call every
+    component, such as when they are relied upon for their side effects:
 
-        for result in results:
-            if result:
-                return True
-        return False
+        @xcomposite.any_true(exhaustive=True)
+    """
+    if func is None:
+        return functools.partial(any_true, exhaustive=exhaustive)
 
-    return inner
+    return _composite(func, reducers.AnyReducer(exhaustive=exhaustive))
 
 
 # ------------------------------------------------------------------------------
@@ -347,16 +476,7 @@ def append_results(func):
     This decorator will append each result - regardless of type - into a
     list.
     """
-
-    def inner(*args, **kwargs):
-        return _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-
-    return inner
+    return _composite(func, _APPEND)
 
 
 # ------------------------------------------------------------------------------
@@ -365,16 +485,7 @@ def append_unique(func):
     This decorator will append each result - regardless of type - into a
     list.
     """
-
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
-        return list(dict.fromkeys(results))
-    return inner
+    return _composite(func, _APPEND_UNIQUE)
 
 
 # ------------------------------------------------------------------------------
@@ -383,15 +494,25 @@ def take_range(func):
     Returns the range of all the values (max - min). If only one value
     is given the range will be zero.
     """
+    return _composite(func, _RANGE)
 
-    def inner(*args, **kwargs):
-        results = _results(
-            args[0],
-            func.__name__,
-            *args,
-            **kwargs
-        )
 
-        return float(max(results)) - float(min(results))
+# ------------------------------------------------------------------------------
+def iter_results(func):
+    """
+    This decorator is the lazy equivalent of append_results. It returns
+    a generator which yields each result in turn, and each component
+    method is only called when the consumer of the generator reaches it.
+    """
+    return _composite(func, _ITER)
 
-    return inner
+
+# ------------------------------------------------------------------------------
+def chain_results(func):
+    """
+    This decorator is the lazy equivalent of extend_results. It returns
+    a generator which yields the items of each result in turn. Each
+    component method is only called when the consumer reaches it, and
+    results which are themselves generators are consumed lazily.
+    """
+    return _composite(func, _CHAIN)
@@ -0,0 +1,366 @@
+"""
+This module holds the executors which compositions can use to call
+their components concurrently rather than one after another.
+
+    .. code-block:: python
+
+        >>> composition = Definition()
+        >>> composition.bind(FileReader())
+        >>> composition.bind(SocketReader())
+        >>>
+        >>> # -- Use the thread pool shared by all compositions
+        >>> composition.set_executor(True)
+        >>>
+        >>> # -- Or provide a specific executor
+        >>> composition.set_executor(ThreadPoolExecutor(max_workers=4))
+
+Results are always combined in component order, regardless of the order
+in which the component calls complete.
+
+For components which are CPU bound a ComponentProcessPool can be used
+instead. This pickles the components into each worker process once, after
+which only the method name and arguments are sent for each call:
+
+    .. code-block:: python
+
+        >>> composition.set_executor(ComponentProcessPool(composition))
+
+A time budget can be given to any composite calls made within a Deadline.
+Components which have not answered in time are treated as if they had
+returned Ignore, so the result is combined from those which did answer,
+and the components which were dropped are recorded on the deadline:
+
+    .. code-block:: python
+
+        >>> with Deadline(0.05) as deadline:
+        ...     items = composition.items()
+        >>>
+        >>> deadline.dropped
+        [('items', <SocketReader object at 0x...>)]
+"""
+import contextvars
+import pickle
+import threading
+import time
+
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+
+# -- The executor shared by all compositions which do not provide their
+# -- own. This is only created when it is first asked for.
+_SHARED_EXECUTOR = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
+# -- Tracks which executor (if any) the current thread is running a
+# -- component call for, so nested compositions do not wait on the
+# -- pool they are running in.
+_LOCAL = threading.local()
+
+# -- The innermost Deadline the current code is running within, if any
+_DEADLINE = contextvars.ContextVar('xcomposite_deadline', default=None)
+
+# -- Within a worker process of a ComponentProcessPool this holds the
+# -- unpickled components the calls are made against
+_WORKER_COMPONENTS = None
+
+
+# ------------------------------------------------------------------------------
+def shared_executor():
+    """
+    Returns the thread pool which is shared between all compositions,
+    creating it if it does not yet exist.
+
+    :return: concurrent.futures.ThreadPoolExecutor
+    """
+    global _SHARED_EXECUTOR
+
+    if _SHARED_EXECUTOR is None:
+        with _SHARED_EXECUTOR_LOCK:
+            if _SHARED_EXECUTOR is None:
+                _SHARED_EXECUTOR = ThreadPoolExecutor(
+                    thread_name_prefix='xcomposite',
+                )
+
+    return _SHARED_EXECUTOR
+
+
+# ------------------------------------------------------------------------------
+def set_shared_executor(executor):
+    """
+    Replaces the executor which is shared between all compositions. The
+    previous executor is not shut down.
+
+    :param executor: concurrent.futures.Executor
+
+    :return: None
+    """
+    global _SHARED_EXECUTOR
+    _SHARED_EXECUTOR = executor
+
+
+# ------------------------------------------------------------------------------
+def running_in(executor):
+    """
+    Returns True if the current thread is running a component call
+    which was submitted to the given executor.
+
+    :param executor: concurrent.futures.Executor
+
+    :return: bool
+    """
+    return getattr(_LOCAL, 'executor', None) is executor
+
+
+# ------------------------------------------------------------------------------
+def _call(executor, method, args, kwargs):
+    """
+    Calls the given method, recording the executor it is running in
+    for the duration of the call.
+    """
+    previous = getattr(_LOCAL, 'executor', None)
+    _LOCAL.executor = executor
+
+    try:
+        return method(*args, **kwargs)
+
+    finally:
+        _LOCAL.executor = previous
+
+
+# ------------------------------------------------------------------------------
+def submit(executor, method_name, methods, args, kwargs):
+    """
+    Submits a call to each of the given methods to the executor.
+
+    :param executor: concurrent.futures.Executor
+    :param method_name: Name the methods were looked up with
+    :param methods: Iterable of bound methods to call
+    :param args: Tuple of args to pass to each call
+    :param kwargs: Dictionary of keyword arguments to pass to each call
+
+    :return: list(concurrent.futures.Future, ...)
+    """
+    if isinstance(executor, ComponentProcessPool):
+        return [
+            executor.submit_method(method_name, method, args, kwargs)
+            for method in methods
+        ]
+
+    # -- Each call runs within a copy of the caller's context, so any
+    # -- deadline (or trace) the caller is within also applies to it
+    return [
+        executor.submit(
+            contextvars.copy_context().run,
+            _call,
+            executor,
+            method,
+            args,
+            kwargs,
+        )
+        for method in methods
+    ]
+
+
+# ------------------------------------------------------------------------------
+def current_deadline():
+    """
+    Returns the innermost Deadline the current code is running within, or
+    None if there is no deadline.
+
+    :return: Deadline or None
+    """
+    return _DEADLINE.get()
+
+
+# ------------------------------------------------------------------------------
+class Deadline(object):
+    """
+    Context manager which gives a time budget to all the composite calls
+    made within it which run their components concurrently - either on an
+    executor (see Composition.set_executor) or as coroutines (see
+    xcomposite.aio). Components called one after another are not subject
+    to the deadline.
+
+    Components which have not answered once the time is up are treated as
+    if they had returned Ignore, and are recorded in the dropped list as
+    a tuple of the method name and component. Calls which have not started
+    are cancelled, but calls which are already running on a thread cannot
+    be interrupted and are left to finish in the background.
+
+    Deadlines may be nested, in which case the earliest applies and the
+    dropped components are recorded on every enclosing deadline.
+
+    :param timeout: Number of seconds the calls have
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.dropped = list()
+
+        self._expires = None
+        self._parent = None
+        self._token = None
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        self._expires = time.monotonic() + self.timeout
+        self._parent = _DEADLINE.get()
+        self._token = _DEADLINE.set(self)
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        _DEADLINE.reset(self._token)
+
+    # --------------------------------------------------------------------------
+    def remaining(self):
+        """
+        Returns the number of seconds left before the deadline, which is
+        zero once it has passed.
+
+        :return: float
+        """
+        remaining = max(0.0, self._expires - time.monotonic())
+
+        if self._parent is not None:
+            return min(remaining, self._parent.remaining())
+
+        return remaining
+
+    # --------------------------------------------------------------------------
+    def drop(self, method_name, method):
+        """
+        Records that the component of the given method missed the deadline.
+
+        :param method_name: Name the method was looked up with
+        :param method: Bound method of the component
+
+        :return: None
+        """
+        self.dropped.append(
+            (method_name, getattr(method, '__self__', method)),
+        )
+
+        if self._parent is not None:
+            self._parent.drop(method_name, method)
+
+
+# ------------------------------------------------------------------------------
+def _initialise_worker(payload):
+    """
+    Unpickles the components a worker process makes its calls against.
+    """
+    global _WORKER_COMPONENTS
+    _WORKER_COMPONENTS = pickle.loads(payload)
+
+
+# ------------------------------------------------------------------------------
+def _call_in_worker(index, method_name, args, kwargs):
+    """
+    Calls the method with the given name on the component at the given
+    index within a worker process.
+    """
+    return getattr(_WORKER_COMPONENTS[index], method_name)(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+class ComponentProcessPool(object):
+    """
+    A process pool which holds a copy of the components of a composition
+    in each of its worker processes. The components are pickled once, when
+    the pool is created, and each call then only sends the index of the
+    component, the method name and the arguments to a worker.
+
+    Because each worker holds its own copy of the components, any changes
+    made to the components after the pool is created are not seen by the
+    workers (and changes made within a worker are not seen by anything
+    else). This is therefore best suited to CPU bound components whose
+    methods do not alter their state.
+
+    The components, arguments and results must all be picklable. Calling
+    a component which was bound after the pool was created will raise
+    a ValueError.
+
+    :param composition: xcomposite.Composition whose components should
+        be held by the workers
+    :param max_workers: Number of worker processes, which defaults to the
+        number of processors
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, composition, max_workers=None):
+
+        # -- Holding the components ensures their ids cannot be reused
+        # -- by other objects whilst the pool is alive
+        self._components = tuple(composition.components())
+        self._indices = dict(
+            (id(component), index)
+            for index, component in enumerate(self._components)
+        )
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialise_worker,
+            initargs=(pickle.dumps(self._components),),
+        )
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.shutdown()
+
+    # --------------------------------------------------------------------------
+    def submit_method(self, method_name, method, args, kwargs):
+        """
+        Submits a call of the given bound component method to a worker.
+
+        :param method_name: Name the method was looked up with
+        :param method: Bound method of one of the components
+        :param args: Tuple of args to pass to the call
+        :param kwargs: Dictionary of keyword arguments to pass to the call
+
+        :return: concurrent.futures.Future
+        """
+        try:
+            index = self._indices[id(method.__self__)]
+
+        except (AttributeError, KeyError):
+            raise ValueError(
+                '%s is not a method of a component held by this pool' % method,
+            )
+
+        return self._pool.submit(
+            _call_in_worker,
+            index,
+            method_name,
+            args,
+            kwargs,
+        )
+
+    # --------------------------------------------------------------------------
+    def submit(self, fn, *args, **kwargs):
+        """
+        Submits an arbitrary picklable callable to the worker processes.
+
+        :return: concurrent.futures.Future
+        """
+        return self._pool.submit(fn, *args, **kwargs)
+
+    # --------------------------------------------------------------------------
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker processes.
+
+        :param wait: If True this will block until all pending calls
+            have completed
+
+        :return: None
+        """
+        self._pool.shutdown(wait=wait)
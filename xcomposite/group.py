@@ -0,0 +1,302 @@
+"""
+This module holds the CompositionGroup, which allows the same method to be
+called on a large number of compositions in a single pass.
+
+    .. code-block:: python
+
+        >>> group = xcomposite.CompositionGroup(entities)
+        >>> speeds = group.call('speed', delta_time)
+
+Compositions in a group are bucketed by their layout - which is the class
+of the composition along with the classes of its components, in order.
+The work of resolving which components implement a method is done once
+per layout rather than once per composition. Each component slot of a
+layout is then called across all the compositions sharing that layout
+in one loop, and where a component implements the method as a plain
+function on its class that function is called directly rather than being
+looked up on every instance.
+"""
+import inspect
+
+from . import tracing
+from .core import Ignore
+from .core import _class_function
+from .core import _has_static_attribute
+
+
+# -- Stands in for the result of a component which does not implement the
+# -- method, so it is dropped along with any other ignored results
+_SKIPPED = Ignore()
+
+
+# ------------------------------------------------------------------------------
+class CompositionGroup(object):
+    """
+    Holds a collection of compositions and allows a method to be called
+    across all of them, returning a list of the results in the order the
+    compositions were added.
+
+    Which components implement a method is resolved from their classes
+    once per layout. Components which implement a method through instance
+    attributes are still supported, as the instance of each component is
+    checked on every call. Layouts whose components resolve the method in
+    a way their class cannot tell (such as through properties) are called
+    one composition at a time.
+
+    :param compositions: Optional iterable of compositions to hold
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, compositions=None):
+        self._compositions = list()
+
+        # -- Plans keyed by (layout, method_name). See _plan for
+        # -- what each holds.
+        self._plans = dict()
+
+        # -- The compositions bucketed by layout. This is rebuilt lazily
+        # -- whenever a composition is added or removed, or the components
+        # -- of any of the compositions change.
+        self._buckets = None
+
+        for composition in compositions or []:
+            self.add(composition)
+
+    # --------------------------------------------------------------------------
+    def __len__(self):
+        return len(self._compositions)
+
+    # --------------------------------------------------------------------------
+    def __iter__(self):
+        return iter(self._compositions)
+
+    # --------------------------------------------------------------------------
+    def add(self, composition):
+        """
+        Adds a composition to the group
+
+        :param composition: xcomposite.Composition
+
+        :return: None
+        """
+        self._compositions.append(composition)
+
+        # -- Registering as a parent means the composition will tell us
+        # -- whenever its components change
+        composition._add_parent(self)
+        self._buckets = None
+
+    # --------------------------------------------------------------------------
+    def remove(self, composition):
+        """
+        Removes a composition from the group
+
+        :param composition: xcomposite.Composition
+
+        :return: None
+        """
+        self._compositions.remove(composition)
+
+        if composition not in self._compositions:
+            composition._discard_parent(self)
+
+        self._buckets = None
+
+    # --------------------------------------------------------------------------
+    def compositions(self):
+        """
+        Accessor for the compositions held by the group
+
+        :return: list(xcomposite.Composition, ...)
+        """
+        return self._compositions
+
+    # --------------------------------------------------------------------------
+    def call(self, method_name, *args, **kwargs):
+        """
+        Calls the given method on every composition in the group, with
+        the same arguments, using the combining rule of each composition's
+        decorator.
+
+        Note that every component is called for every composition, even
+        for decorators such as take_first which would normally stop early.
+        Any executor set on the compositions is not used, and any memoize
+        decorator is bypassed. Compositions with stats switched on, and
+        all compositions whilst a Tracer is active, are called in turn so
+        their calls are recorded. Methods decorated with cache_components are
+        called on each composition in turn, so the cached component results
+        are still used. Asynchronous methods (see xcomposite.aio) are also
+        called on each composition in turn, giving a list of the coroutines
+        to be awaited.
+
+        :param method_name: Name of the method to call
+        :type method_name: str
+
+        :return: list of results, one per composition
+        """
+        results = [None] * len(self._compositions)
+
+        for layout, bucket in self._layouts().items():
+            positions, compositions, component_lists = bucket
+
+            try:
+                plan = self._plans[(layout, method_name)]
+
+            except KeyError:
+                plan = self._plan(layout, method_name)
+                self._plans[(layout, method_name)] = plan
+
+            # -- Undecorated methods, and those which cannot be resolved
+            # -- for the whole layout, are called as normal. So are those
+            # -- being traced or timed, which have to go through the
+            # -- dispatch of each composition to be recorded.
+            if plan is None or tracing._tracer is not None or any(
+                composition._stats is not None
+                for composition in compositions
+            ):
+                for position, composition in zip(positions, compositions):
+                    results[position] = getattr(
+                        composition,
+                        method_name,
+                    )(*args, **kwargs)
+
+                continue
+
+            reducer, calls = plan
+
+            # -- Call each component slot across every composition in
+            # -- the bucket, giving a column of results per slot
+            columns = list()
+
+            for index, function, checked, has_dict in calls:
+                column = list()
+
+                for components in component_lists:
+                    component = components[index]
+
+                    # -- An instance attribute takes precedence over the
+                    # -- class, and may be the only implementation
+                    if has_dict and method_name in component.__dict__:
+                        column.append(
+                            getattr(component, method_name)(*args, **kwargs)
+                        )
+
+                    elif checked:
+                        column.append(_SKIPPED)
+
+                    elif function is None:
+                        column.append(
+                            getattr(component, method_name)(*args, **kwargs)
+                        )
+
+                    else:
+                        column.append(function(component, *args, **kwargs))
+
+                columns.append(column)
+
+            rows = zip(*columns) if columns else [()] * len(positions)
+
+            for position, row in zip(positions, rows):
+                results[position] = reducer.reduce(
+                    [
+                        result
+                        for result in row
+                        if not isinstance(result, Ignore)
+                    ]
+                )
+
+        return results
+
+    # --------------------------------------------------------------------------
+    def _layouts(self):
+        """
+        Returns the compositions bucketed by layout, building the buckets
+        if they are not cached.
+
+        :return: dict(layout: (positions, compositions, component lists))
+        """
+        if self._buckets is not None:
+            return self._buckets
+
+        buckets = dict()
+
+        for position, composition in enumerate(self._compositions):
+            components = composition.components()
+            layout = (composition.__class__, tuple(map(type, components)))
+
+            if layout not in buckets:
+                buckets[layout] = (list(), list(), list())
+
+            positions, compositions, component_lists = buckets[layout]
+            positions.append(position)
+            compositions.append(composition)
+            component_lists.append(components)
+
+        self._buckets = buckets
+        return buckets
+
+    # --------------------------------------------------------------------------
+    def _invalidate(self):
+        """
+        Called by the compositions in the group whenever their components
+        change, dropping the cached buckets.
+
+        :return: None
+        """
+        self._buckets = None
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _plan(layout, method_name):
+        """
+        Resolves how the given method should be called for compositions
+        with the given layout.
+
+        :return: None if the method is not a synchronous composite method,
+            caches the results of each component, or cannot be resolved
+            from the classes of the layout. Otherwise a tuple
+            of the reducer and a tuple of (component index, function,
+            checked, has_dict) in call order. The function is None where
+            the method has to be looked up on the instance, checked is
+            True where only the instance can implement the method, and
+            has_dict is True where the instance may hold the method in
+            its __dict__.
+        """
+        composition_type, component_types = layout
+
+        decorated = getattr(composition_type, method_name, None)
+        reducer = getattr(decorated, '_composite_reducer', None)
+
+        # -- Asynchronous methods give a coroutine per composition, and the
+        # -- results of cached components are held by each composition, so
+        # -- both are left to each composition
+        if reducer is None or inspect.iscoroutinefunction(decorated) or \
+                getattr(decorated, '_cache_components', False):
+            return None
+
+        calls = list()
+
+        for index, component_type in enumerate(component_types):
+            found = _has_static_attribute(component_type, method_name)
+
+            if found is None:
+                return None
+
+            has_dict = bool(component_type.__dictoffset__)
+
+            if not found and not has_dict:
+                continue
+
+            calls.append(
+                (
+                    index,
+                    _class_function(component_type, method_name),
+                    not found,
+                    has_dict,
+                )
+            )
+
+        if reducer.reverse:
+            calls.reverse()
+
+        return reducer, tuple(calls)
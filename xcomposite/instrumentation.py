@@ -0,0 +1,165 @@
+"""
+This module holds the instrumentation which records how long each
+component takes to answer a composite method.
+
+Instrumentation is switched on per composition. Whilst it is switched on
+every component method the composition dispatches to is wrapped so that
+its calls are timed, and whilst it is switched off the component methods
+are called directly, so it costs nothing at all:
+
+    .. code-block:: python
+
+        >>> entity.enable_stats()
+        >>> entity.speed()
+        >>>
+        >>> entity.call_stats()
+        {('speed', Legs): {'count': 1, 'total': 1.2e-06, 'min': 1.2e-06,
+        'max': 1.2e-06, 'exceptions': 0}}
+        >>>
+        >>> entity.reset_stats()
+        >>> entity.disable_stats()
+
+The stats are keyed by the name of the method and the class of the
+component which implements it. Where nested compositions are flattened
+(see Composition._lookup_methods) the components of the nested
+compositions are recorded individually.
+
+Note that components called through a ComponentProcessPool are called in
+the worker processes, so are not recorded.
+"""
+import inspect
+import threading
+import time
+
+
+# ------------------------------------------------------------------------------
+class CallStats(object):
+    """
+    Holds the call count, timings and exception count of each pair of
+    method name and component class.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        # -- Each record is a list of the count, total time, minimum time,
+        # -- maximum time and the number of exceptions raised
+        self._records = dict()
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------------------------
+    def record(self, key, duration, failed=False):
+        """
+        Records a single call.
+
+        :param key: Tuple of the method name and component class
+        :param duration: Number of seconds the call took
+        :param failed: True if the call raised an exception
+
+        :return: None
+        """
+        with self._lock:
+            record = self._records.get(key)
+
+            if record is None:
+                self._records[key] = [
+                    1,
+                    duration,
+                    duration,
+                    duration,
+                    int(failed),
+                ]
+                return
+
+            record[0] += 1
+            record[1] += duration
+
+            if duration < record[2]:
+                record[2] = duration
+
+            if duration > record[3]:
+                record[3] = duration
+
+            if failed:
+                record[4] += 1
+
+    # --------------------------------------------------------------------------
+    def dump(self):
+        """
+        Returns the stats recorded so far.
+
+        :return: dict((method name, component class): dict, ...)
+        """
+        with self._lock:
+            return dict(
+                (
+                    key,
+                    dict(
+                        count=record[0],
+                        total=record[1],
+                        min=record[2],
+                        max=record[3],
+                        exceptions=record[4],
+                    ),
+                )
+                for key, record in self._records.items()
+            )
+
+    # --------------------------------------------------------------------------
+    def reset(self):
+        """
+        Drops all the stats recorded so far.
+
+        :return: None
+        """
+        with self._lock:
+            self._records.clear()
+
+
+# ------------------------------------------------------------------------------
+class TimedMethod(object):
+    """
+    Wraps the bound method of a component, recording the time each call
+    takes. Where the method is a coroutine function the time is recorded
+    once the coroutine has been awaited.
+
+    :param method: Bound method of the component
+    :param method_name: Name the method was looked up with
+    :param stats: CallStats instance to record the calls in
+    """
+    __slots__ = ('__self__', 'method', 'key', 'stats')
+
+    # --------------------------------------------------------------------------
+    def __init__(self, method, method_name, stats):
+        self.__self__ = getattr(method, '__self__', None)
+        self.method = method
+        self.key = (method_name, type(self.__self__))
+        self.stats = stats
+
+    # --------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            result = self.method(*args, **kwargs)
+
+        except Exception:
+            self.stats.record(self.key, time.perf_counter() - start, True)
+            raise
+
+        if inspect.iscoroutine(result):
+            return self._await(result, start)
+
+        self.stats.record(self.key, time.perf_counter() - start)
+        return result
+
+    # --------------------------------------------------------------------------
+    async def _await(self, coroutine, start):
+        try:
+            result = await coroutine
+
+        except Exception:
+            self.stats.record(self.key, time.perf_counter() - start, True)
+            raise
+
+        self.stats.record(self.key, time.perf_counter() - start)
+        return result
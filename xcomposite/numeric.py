@@ -0,0 +1,219 @@
+"""
+This module holds NumPy backed equivalents of the numeric composite
+decorators. Rather than reducing the results with the python builtins,
+the results of all the components are stacked into a single array and
+reduced elementwise in one vectorised call. This means components can
+return arrays (or long numeric sequences) of the same shape.
+
+    .. code-block:: python
+
+        >>> from xcomposite import numeric
+        >>>
+        >>>
+        >>> class Body(xcomposite.Composition):
+        ...
+        ...     @numeric.take_sum
+        ...     def forces(self):
+        ...         return numpy.zeros(3)
+
+Results which are Ignore instances are filtered out as usual. This module
+can be imported without NumPy being installed, but an ImportError is
+raised when a decorated method is called.
+"""
+from .decorators import _composite
+from .reducers import (
+    _MISSING,
+    Reducer,
+)
+
+
+# ------------------------------------------------------------------------------
+def _numpy():
+    """
+    Returns the numpy module, raising a descriptive ImportError if it is
+    not available.
+    """
+    try:
+        import numpy
+
+    except ImportError:
+        raise ImportError(
+            'NumPy is required to use the xcomposite.numeric decorators',
+        )
+
+    return numpy
+
+
+# ------------------------------------------------------------------------------
+def _stack(results):
+    """
+    Stacks the results into a single array, with one row per result.
+    """
+    numpy = _numpy()
+    results = list(results)
+
+    if not results:
+        raise ValueError('There are no results to reduce')
+
+    return numpy.stack([numpy.asarray(result) for result in results])
+
+
+# ------------------------------------------------------------------------------
+class SumReducer(Reducer):
+    """
+    Returns the elementwise sum of the results, or 0 if there are none
+    """
+
+    def init(self):
+        return 0
+
+    def update(self, accumulator, result):
+        return _numpy().add(accumulator, result)
+
+    def reduce(self, results):
+        results = list(results)
+
+        if not results:
+            return 0
+
+        return _stack(results).sum(axis=0)
+
+
+# ------------------------------------------------------------------------------
+class MinReducer(Reducer):
+    """
+    Returns the elementwise minimum of the results
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        if accumulator is _MISSING:
+            return _numpy().asarray(result)
+
+        return _numpy().minimum(accumulator, result)
+
+    def finish(self, accumulator):
+        if accumulator is _MISSING:
+            raise ValueError('There are no results to reduce')
+
+        return accumulator
+
+    def reduce(self, results):
+        return _stack(results).min(axis=0)
+
+
+# ------------------------------------------------------------------------------
+class MaxReducer(MinReducer):
+    """
+    Returns the elementwise maximum of the results
+    """
+
+    def update(self, accumulator, result):
+        if accumulator is _MISSING:
+            return _numpy().asarray(result)
+
+        return _numpy().maximum(accumulator, result)
+
+    def reduce(self, results):
+        return _stack(results).max(axis=0)
+
+
+# ------------------------------------------------------------------------------
+class AverageReducer(Reducer):
+    """
+    Returns the elementwise mean of the results
+    """
+
+    def init(self):
+        return 0, 0
+
+    def update(self, accumulator, result):
+        return _numpy().add(accumulator[0], result), accumulator[1] + 1
+
+    def finish(self, accumulator):
+        if not accumulator[1]:
+            raise ValueError('There are no results to reduce')
+
+        return _numpy().true_divide(accumulator[0], accumulator[1])
+
+    def reduce(self, results):
+        return _stack(results).mean(axis=0)
+
+
+# ------------------------------------------------------------------------------
+class RangeReducer(Reducer):
+    """
+    Returns the elementwise difference between the largest and smallest
+    results, as floats
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        numpy = _numpy()
+
+        if accumulator is _MISSING:
+            return numpy.asarray(result), numpy.asarray(result)
+
+        return (
+            numpy.minimum(accumulator[0], result),
+            numpy.maximum(accumulator[1], result),
+        )
+
+    def finish(self, accumulator):
+        if accumulator is _MISSING:
+            raise ValueError('There are no results to reduce')
+
+        return (accumulator[1] - accumulator[0]).astype(float)
+
+    def reduce(self, results):
+        stacked = _stack(results)
+        return (stacked.max(axis=0) - stacked.min(axis=0)).astype(float)
+
+
+# ------------------------------------------------------------------------------
+def take_sum(func):
+    """
+    NumPy equivalent of xcomposite.take_sum, returning the elementwise
+    sum of the results.
+    """
+    return _composite(func, SumReducer())
+
+
+# ------------------------------------------------------------------------------
+def take_min(func):
+    """
+    NumPy equivalent of xcomposite.take_min, returning the elementwise
+    minimum of the results.
+    """
+    return _composite(func, MinReducer())
+
+
+# ------------------------------------------------------------------------------
+def take_max(func):
+    """
+    NumPy equivalent of xcomposite.take_max, returning the elementwise
+    maximum of the results.
+    """
+    return _composite(func, MaxReducer())
+
+
+# ------------------------------------------------------------------------------
+def take_average(func):
+    """
+    NumPy equivalent of xcomposite.take_average, returning the elementwise
+    mean of the results.
+    """
+    return _composite(func, AverageReducer())
+
+
+# ------------------------------------------------------------------------------
+def take_range(func):
+    """
+    NumPy equivalent of xcomposite.take_range, returning the elementwise
+    difference between the largest and smallest results.
+    """
+    return _composite(func, RangeReducer())
@@ -0,0 +1,497 @@
+"""
+This module holds the reducer protocol which defines how the results of
+the components are combined into a single result, along with the reducers
+used by the built in decorators.
+
+A reducer is fed each result (which is not an Ignore instance) in turn,
+as soon as the component returns it, so only the accumulated value is held
+in memory. A reducer may also stop the components from being called once
+it knows its answer. Custom reducers can be used through the composite
+decorator:
+
+    .. code-block:: python
+
+        >>> class BitwiseOr(xcomposite.Reducer):
+        ...
+        ...     def init(self):
+        ...         return 0
+        ...
+        ...     def update(self, accumulator, result):
+        ...         return accumulator | result
+        >>>
+        >>>
+        >>> class Entity(xcomposite.Composition):
+        ...
+        ...     @xcomposite.composite(reducer=BitwiseOr())
+        ...     def flags(self):
+        ...         return 0
+
+Reducer instances are shared by every call of the decorated method, so
+any per call state must be held in the accumulator rather than on the
+reducer itself.
+"""
+
+
+# -- Denotes an accumulator which has not yet received a result, as None
+# -- is a legitimate result
+_MISSING = object()
+
+
+# ------------------------------------------------------------------------------
+class Reducer(object):
+    """
+    Base class of all reducers. Subclasses must implement update, and
+    may implement init, done and finish.
+
+    Subclasses may also override reduce to combine an iterable of results
+    in one go (for instance by using a python builtin), providing this has
+    the same outcome as feeding the results to update one at a time.
+    """
+
+    # -- If True the components are called last to first
+    reverse = False
+
+    # -- If True, reducing the results of a nested composition and then
+    # -- reducing that alongside the other results gives the same outcome
+    # -- as reducing all the results together - including when the nested
+    # -- composition has no results at all. This allows the methods of
+    # -- nested compositions to be called directly (see
+    # -- Composition._lookup_methods).
+    flattenable = False
+
+    # --------------------------------------------------------------------------
+    def init(self):
+        """
+        Returns the accumulator to start each call with
+
+        :return: object
+        """
+        return None
+
+    # --------------------------------------------------------------------------
+    def update(self, accumulator, result):
+        """
+        Combines a result into the accumulator, returning the new
+        accumulator.
+
+        :param accumulator: The accumulator so far
+        :param result: The result of a component
+
+        :return: object
+        """
+        raise NotImplementedError()
+
+    # --------------------------------------------------------------------------
+    def done(self, accumulator):
+        """
+        Returns True if no further results can change the outcome, in
+        which case no further components are called.
+
+        :param accumulator: The accumulator so far
+
+        :return: bool
+        """
+        return False
+
+    # --------------------------------------------------------------------------
+    def finish(self, accumulator):
+        """
+        Returns the result of the call from the final accumulator
+
+        :param accumulator: The final accumulator
+
+        :return: object
+        """
+        return accumulator
+
+    # --------------------------------------------------------------------------
+    def reduce(self, results):
+        """
+        Combines an iterable of results into a single result. The results
+        are only consumed up to the point the reducer is done.
+
+        :param results: Iterable of results
+
+        :return: object
+        """
+        accumulator = self.init()
+
+        for result in results:
+            accumulator = self.update(accumulator, result)
+
+            if self.done(accumulator):
+                break
+
+        return self.finish(accumulator)
+
+
+# ------------------------------------------------------------------------------
+class MinReducer(Reducer):
+    """
+    Returns the smallest result
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        if accumulator is _MISSING or result < accumulator:
+            return result
+
+        return accumulator
+
+    def finish(self, accumulator):
+        if accumulator is _MISSING:
+            raise ValueError('There are no results to take the minimum of')
+
+        return accumulator
+
+    def reduce(self, results):
+        return min(results)
+
+
+# ------------------------------------------------------------------------------
+class MaxReducer(Reducer):
+    """
+    Returns the largest result
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        if accumulator is _MISSING or result > accumulator:
+            return result
+
+        return accumulator
+
+    def finish(self, accumulator):
+        if accumulator is _MISSING:
+            raise ValueError('There are no results to take the maximum of')
+
+        return accumulator
+
+    def reduce(self, results):
+        return max(results)
+
+
+# ------------------------------------------------------------------------------
+class SumReducer(Reducer):
+    """
+    Returns the sum of all the results
+    """
+    flattenable = True
+
+    def init(self):
+        return 0
+
+    def update(self, accumulator, result):
+        return accumulator + result
+
+    def reduce(self, results):
+        return sum(results)
+
+
+# ------------------------------------------------------------------------------
+class AverageReducer(Reducer):
+    """
+    Returns the mean of all the results
+    """
+
+    def init(self):
+        return 0, 0
+
+    def update(self, accumulator, result):
+        return accumulator[0] + result, accumulator[1] + 1
+
+    def finish(self, accumulator):
+        sum_of_results, count = accumulator
+
+        if sum_of_results == 0:
+            return sum_of_results
+
+        return sum_of_results / count
+
+
+# ------------------------------------------------------------------------------
+class RangeReducer(Reducer):
+    """
+    Returns the difference between the largest and smallest results
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        if accumulator is _MISSING:
+            return result, result
+
+        smallest, largest = accumulator
+        return min(smallest, result), max(largest, result)
+
+    def finish(self, accumulator):
+        if accumulator is _MISSING:
+            raise ValueError('There are no results to take the range of')
+
+        return float(accumulator[1]) - float(accumulator[0])
+
+
+# ------------------------------------------------------------------------------
+class FirstReducer(Reducer):
+    """
+    Returns the first result, or None if there are no results
+    """
+
+    def init(self):
+        return _MISSING
+
+    def update(self, accumulator, result):
+        return result
+
+    def done(self, accumulator):
+        return accumulator is not _MISSING
+
+    def finish(self, accumulator):
+        return None if accumulator is _MISSING else accumulator
+
+    def reduce(self, results):
+        for result in results:
+            return result
+
+        return None
+
+
+# ------------------------------------------------------------------------------
+class FirstTrueReducer(FirstReducer):
+    """
+    Returns the first result which evaluates to True, or None if there is
+    no such result
+    """
+
+    def update(self, accumulator, result):
+        return result if result else _MISSING
+
+    def reduce(self, results):
+        for result in results:
+            if result:
+                return result
+
+        return None
+
+
+# ------------------------------------------------------------------------------
+class LastReducer(FirstReducer):
+    """
+    Returns the last result, or None if there are no results. The
+    components are called last to first, so only the components after
+    the last result are called.
+    """
+    reverse = True
+
+
+# ------------------------------------------------------------------------------
+class AnyReducer(Reducer):
+    """
+    Returns True if any result evaluates to True
+
+    :param exhaustive: If True every result is consumed, rather than
+        stopping at the first result which evaluates to True
+    """
+    flattenable = True
+
+    def __init__(self, exhaustive=False):
+        self.exhaustive = exhaustive
+
+    def init(self):
+        return False
+
+    def update(self, accumulator, result):
+        return accumulator or bool(result)
+
+    def done(self, accumulator):
+        return accumulator and not self.exhaustive
+
+    def reduce(self, results):
+        if self.exhaustive:
+            return any(list(results))
+
+        return any(results)
+
+
+# ------------------------------------------------------------------------------
+class AllReducer(Reducer):
+    """
+    Returns True if every result evaluates to True
+
+    :param exhaustive: If True every result is consumed, rather than
+        stopping at the first result which evaluates to False
+    """
+    flattenable = True
+
+    def __init__(self, exhaustive=False):
+        self.exhaustive = exhaustive
+
+    def init(self):
+        return True
+
+    def update(self, accumulator, result):
+        return accumulator and bool(result)
+
+    def done(self, accumulator):
+        return not accumulator and not self.exhaustive
+
+    def reduce(self, results):
+        if self.exhaustive:
+            return all(list(results))
+
+        return all(results)
+
+
+# ------------------------------------------------------------------------------
+class AppendReducer(Reducer):
+    """
+    Returns a list of all the results
+    """
+
+    def init(self):
+        return list()
+
+    def update(self, accumulator, result):
+        accumulator.append(result)
+        return accumulator
+
+    def reduce(self, results):
+        return list(results)
+
+
+# ------------------------------------------------------------------------------
+class AppendUniqueReducer(Reducer):
+    """
+    Returns a list of all the results, with any duplicates removed
+    """
+
+    def init(self):
+        return dict()
+
+    def update(self, accumulator, result):
+        accumulator[result] = None
+        return accumulator
+
+    def finish(self, accumulator):
+        return list(accumulator)
+
+    def reduce(self, results):
+        return list(dict.fromkeys(results))
+
+
+# ------------------------------------------------------------------------------
+class ExtendReducer(Reducer):
+    """
+    Returns a single list made by extending each result into it
+    """
+    flattenable = True
+
+    def init(self):
+        return list()
+
+    def update(self, accumulator, result):
+        accumulator.extend(result)
+        return accumulator
+
+    def reduce(self, results):
+        extended_results = list()
+
+        for result in results:
+            extended_results.extend(result)
+
+        return extended_results
+
+
+# ------------------------------------------------------------------------------
+class ExtendUniqueReducer(Reducer):
+    """
+    Returns a single list made by extending each result into it, with
+    any duplicates removed
+    """
+    flattenable = True
+
+    def init(self):
+        return dict()
+
+    def update(self, accumulator, result):
+        accumulator.update(dict.fromkeys(result))
+        return accumulator
+
+    def finish(self, accumulator):
+        return list(accumulator)
+
+
+# ------------------------------------------------------------------------------
+class UpdateReducer(Reducer):
+    """
+    Returns a single dictionary updated with each result in turn
+    """
+    flattenable = True
+
+    def init(self):
+        return dict()
+
+    def update(self, accumulator, result):
+        accumulator.update(result)
+        return accumulator
+
+    def reduce(self, results):
+        output = dict()
+
+        for result in results:
+            output.update(result)
+
+        return output
+
+
+# ------------------------------------------------------------------------------
+class IterReducer(Reducer):
+    """
+    Returns an iterator over the results. When given an iterable of
+    results through reduce, nothing is consumed until the returned
+    iterator is.
+    """
+
+    def init(self):
+        return list()
+
+    def update(self, accumulator, result):
+        accumulator.append(result)
+        return accumulator
+
+    def finish(self, accumulator):
+        return iter(accumulator)
+
+    def reduce(self, results):
+        return iter(results)
+
+
+# ------------------------------------------------------------------------------
+class ChainReducer(IterReducer):
+    """
+    Returns an iterator over the items of each result in turn. When given
+    an iterable of results through reduce, nothing is consumed until the
+    returned iterator is.
+    """
+
+    def finish(self, accumulator):
+        return _chain(accumulator)
+
+    def reduce(self, results):
+        return _chain(results)
+
+
+# ------------------------------------------------------------------------------
+def _chain(results):
+    """
+    Yields each item of each result in turn, without building a list
+    of either the results or their items.
+    """
+    for result in results:
+        for item in result:
+            yield item
@@ -2,8 +2,13 @@
 This holds a series of classes specifically designed to test
 results in a deterministic way.
 """
+import asyncio
+import os
+
 import xcomposite
 
+from xcomposite import aio
+
 
 class DecoratorBase(xcomposite.Composition):
     """
@@ -51,6 +56,14 @@ class DecoratorBase(xcomposite.Composition):
     def update(self):
         return dict(foo=1)
 
+    @xcomposite.iter_results
+    def iterate(self):
+        return 'A'
+
+    @xcomposite.chain_results
+    def chain(self):
+        return ['A']
+
 
 class DecoratorTesterA(DecoratorBase):
     """
@@ -88,6 +101,12 @@ class DecoratorTesterA(DecoratorBase):
     def update(self):
         return dict(foo=1)
 
+    def iterate(self):
+        return 'A'
+
+    def chain(self):
+        return (item for item in 'A')
+
 
 class DecoratorTesterB(xcomposite.Composition):
     """
@@ -125,6 +144,12 @@ class DecoratorTesterB(xcomposite.Composition):
     def update(self):
         return dict(bar=1)
 
+    def iterate(self):
+        return 'B'
+
+    def chain(self):
+        return ['B']
+
 
 # ------------------------------------------------------------------------------
 class UndecoratedTesterA(xcomposite.Composition):
@@ -153,3 +178,555 @@ class PartiallyDecoratedTesterB(xcomposite.Composition):
 
     def test(self):
         return 2
+
+
+# ------------------------------------------------------------------------------
+class IgnoreTester(xcomposite.Composition):
+    """
+    Each method returns an Ignore instance and therefore should never
+    contribute to a result.
+    """
+
+    def min(self):
+        return xcomposite.Ignore()
+
+    def max(self):
+        return xcomposite.Ignore()
+
+    def sum(self):
+        return xcomposite.Ignore()
+
+    def first(self):
+        return xcomposite.Ignore()
+
+    def last(self):
+        return xcomposite.Ignore()
+
+    def append(self):
+        return xcomposite.Ignore()
+
+    def append_unique(self):
+        return xcomposite.Ignore()
+
+    def extend_list(self):
+        return xcomposite.Ignore()
+
+    def average(self):
+        return xcomposite.Ignore()
+
+    def update(self):
+        return xcomposite.Ignore()
+
+
+# ------------------------------------------------------------------------------
+class RaisingTester(object):
+    """
+    Each method raises an exception, allowing tests to check whether
+    a method is ever called.
+    """
+
+    def iterate(self):
+        raise RuntimeError('iterate was called')
+
+    def chain(self):
+        raise RuntimeError('chain was called')
+
+    def valid(self):
+        raise RuntimeError('valid was called')
+
+    def valid_exhaustive(self):
+        raise RuntimeError('valid_exhaustive was called')
+
+    def invalid(self):
+        raise RuntimeError('invalid was called')
+
+
+# ------------------------------------------------------------------------------
+class BooleanBase(xcomposite.Composition):
+    """
+    Holds the boolean decorators, allowing tests to check when they
+    stop calling components.
+    """
+
+    @xcomposite.any_true
+    def valid(self):
+        return True
+
+    @xcomposite.any_true(exhaustive=True)
+    def valid_exhaustive(self):
+        return True
+
+    @xcomposite.absolute_true
+    def invalid(self):
+        return False
+
+
+# ------------------------------------------------------------------------------
+class BooleanTester(object):
+
+    def valid(self):
+        return True
+
+    def valid_exhaustive(self):
+        return True
+
+    def invalid(self):
+        return False
+
+
+# ------------------------------------------------------------------------------
+class BarrierTester(object):
+    """
+    Each method waits on a shared barrier before returning, meaning
+    the methods can only succeed if they are called concurrently.
+    """
+
+    def __init__(self, barrier, value):
+        self.barrier = barrier
+        self.value = value
+
+    def min(self):
+        self.barrier.wait()
+        return self.value
+
+    def first(self):
+        self.barrier.wait()
+        return self.value
+
+    def last(self):
+        self.barrier.wait()
+        return self.value
+
+    def truthy(self):
+        self.barrier.wait()
+        return self.value
+
+    def extend_list(self):
+        self.barrier.wait()
+        return [self.value]
+
+
+# ------------------------------------------------------------------------------
+class AsyncBase(xcomposite.Composition):
+    """
+    Holds asynchronous decorated methods
+    """
+
+    @aio.take_sum
+    async def sum(self):
+        return 1
+
+    @aio.extend_results
+    async def extend_list(self):
+        return ['A']
+
+    @aio.take_last
+    async def last(self):
+        return 'A'
+
+    @aio.update_dictionary
+    async def update(self):
+        return dict(foo=1)
+
+
+# ------------------------------------------------------------------------------
+class AsyncTesterA(object):
+    """
+    Asynchronous methods which can only complete once AsyncTesterB
+    has been awaited alongside them.
+    """
+
+    def __init__(self, event):
+        self.event = event
+
+    async def sum(self):
+        await asyncio.wait_for(self.event.wait(), 1)
+        return 1
+
+    async def extend_list(self):
+        await asyncio.wait_for(self.event.wait(), 1)
+        return ['A']
+
+    async def last(self):
+        return 'A'
+
+    async def update(self):
+        return xcomposite.Ignore()
+
+
+# ------------------------------------------------------------------------------
+class AsyncTesterB(object):
+    """
+    A mixture of synchronous and asynchronous methods
+    """
+
+    def __init__(self, event):
+        self.event = event
+
+    async def sum(self):
+        self.event.set()
+        return 2
+
+    async def extend_list(self):
+        self.event.set()
+        return ['B']
+
+    def last(self):
+        return 'B'
+
+    def update(self):
+        return dict(bar=1)
+
+
+# ------------------------------------------------------------------------------
+class ProcessTester(object):
+    """
+    Returns the id of the process the methods are called in.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def extend_list(self):
+        return [os.getpid()]
+
+    def sum(self):
+        return self.value
+
+
+# ------------------------------------------------------------------------------
+class MemoizedBase(xcomposite.Composition):
+    """
+    Holds memoized composite methods
+    """
+
+    @xcomposite.memoize(maxsize=2)
+    @xcomposite.extend_results
+    def items(self, value):
+        return []
+
+    @xcomposite.memoize(ttl=0)
+    @xcomposite.take_sum
+    def total(self):
+        return 0
+
+    @xcomposite.cache_components
+    @xcomposite.extend_results
+    def cached_items(self, value):
+        return []
+
+    @xcomposite.memoize()
+    @aio.take_sum
+    async def async_total(self):
+        return 0
+
+
+# ------------------------------------------------------------------------------
+class CountingTester(object):
+    """
+    Records how many times each method has been called
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def items(self, value):
+        self.calls += 1
+        return [value]
+
+    def total(self):
+        self.calls += 1
+        return 1
+
+    def cached_items(self, value):
+        self.calls += 1
+        return [value * self.multiplier]
+
+    async def async_total(self):
+        self.calls += 1
+        return 1
+
+    multiplier = 1
+
+
+# ------------------------------------------------------------------------------
+class ScoreBase(xcomposite.Composition):
+    """
+    Holds methods which take arguments, for batched calls
+    """
+
+    @xcomposite.take_sum
+    def score(self, value):
+        return 0
+
+    @xcomposite.take_last
+    def label(self, value):
+        return ''
+
+    def undecorated(self, value):
+        return value
+
+
+# ------------------------------------------------------------------------------
+class ScoreListBase(xcomposite.Composition):
+    """
+    Gathers the scores of its components, for batched calls through
+    nested compositions
+    """
+
+    @xcomposite.append_results
+    def score(self, value):
+        return 0
+
+
+# ------------------------------------------------------------------------------
+class ScoreTesterA(object):
+
+    def score(self, value):
+        return value
+
+    def label(self, value):
+        return 'A%s' % value
+
+
+# ------------------------------------------------------------------------------
+class KeyTester(object):
+    """
+    Compares equal to any object with the same key, whatever its type
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        return getattr(other, 'key', None) == self.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+# ------------------------------------------------------------------------------
+class DisabledScoreTester(ScoreTesterA):
+    """
+    Disables the score method it inherits
+    """
+    score = None
+
+
+# ------------------------------------------------------------------------------
+class ScoreTesterB(object):
+    """
+    Provides a native batch implementation of score
+    """
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def score(self, value):
+        raise RuntimeError('score_batch should have been called')
+
+    def score_batch(self, arg_sets):
+        self.batch_calls += 1
+        return [args[0] * 10 for args in arg_sets]
+
+    def label(self, value):
+        return xcomposite.Ignore()
+
+
+# ------------------------------------------------------------------------------
+class BitwiseOrReducer(xcomposite.Reducer):
+    """
+    Combines integer flags, stopping once every flag is set
+    """
+
+    def init(self):
+        return 0
+
+    def update(self, accumulator, result):
+        return accumulator | result
+
+    def done(self, accumulator):
+        return accumulator == 0b111
+
+
+# ------------------------------------------------------------------------------
+class FlagsBase(xcomposite.Composition):
+
+    @xcomposite.composite(reducer=BitwiseOrReducer())
+    def flags(self):
+        return 0
+
+
+# ------------------------------------------------------------------------------
+class FlagsTester(object):
+
+    def __init__(self, flags):
+        self.value = flags
+
+    def flags(self):
+        if self.value is None:
+            raise RuntimeError('flags was called')
+
+        return self.value
+
+
+# ------------------------------------------------------------------------------
+class SlottedBase(xcomposite.SlottedComposition):
+    """
+    A compact composition, which declares its own attributes as slots
+    """
+    __slots__ = ('name',)
+
+    @xcomposite.take_sum
+    def score(self, value):
+        return 0
+
+    @xcomposite.extend_results
+    def items(self):
+        return ['base']
+
+
+# ------------------------------------------------------------------------------
+class EarlyAttributeBase(xcomposite.Composition):
+    """
+    Sets an attribute before the composition has been initialised
+    """
+
+    def __init__(self):
+        self.name = 'early'
+        super(EarlyAttributeBase, self).__init__()
+
+
+# ------------------------------------------------------------------------------
+class EarlySlottedBase(SlottedBase):
+    """
+    Sets a slotted attribute before the composition has been initialised
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        self.name = 'early'
+        super(EarlySlottedBase, self).__init__()
+
+
+# ------------------------------------------------------------------------------
+class MethodsBase(xcomposite.Composition):
+    """
+    Declares a composite method with the same name as a method the
+    composition itself could be expected to have
+    """
+
+    @xcomposite.extend_results
+    def methods(self):
+        return ['base']
+
+    @xcomposite.take_sum
+    def sum(self):
+        return 1
+
+
+# ------------------------------------------------------------------------------
+class MethodsTester(object):
+    """
+    Has attributes with generic names, which should be reachable through
+    the composition it is bound to
+    """
+
+    def __init__(self):
+        self.stats = dict(health=10)
+        self.batch = 3
+
+    def methods(self):
+        return ['component']
+
+    def sum(self):
+        return 2
+
+
+# ------------------------------------------------------------------------------
+class LabelTester(object):
+    """
+    Returns a fixed label, so the order of components can be seen
+    """
+
+    def __init__(self, label):
+        self.text = label
+
+    def label(self, value):
+        return self.text
+
+
+# ------------------------------------------------------------------------------
+class PropertyTester(object):
+    """
+    Only has a label once it has been given text, so whether it has one
+    cannot be told from its class alone
+    """
+
+    def __init__(self, text=None):
+        self.text = text
+
+    @property
+    def label(self):
+        if self.text is None:
+            raise AttributeError('label')
+
+        return lambda value: self.text
+
+
+# ------------------------------------------------------------------------------
+class HedgedBase(xcomposite.Composition):
+    """
+    Holds the decorators which can call their components in parallel
+    """
+
+    @xcomposite.take_first(hedged=True)
+    def first(self):
+        return 'A'
+
+    @xcomposite.take_last(hedged=True)
+    def last(self):
+        return 'A'
+
+    @xcomposite.first_true(hedged=True)
+    def truthy(self):
+        return 'A'
+
+
+# ------------------------------------------------------------------------------
+class SlowTester(object):
+    """
+    Each method waits for the event to be set before returning, so it
+    can be made to miss a deadline.
+    """
+
+    def __init__(self, event, value):
+        self.event = event
+        self.value = value
+
+    def sum(self):
+        self.event.wait(5)
+        return self.value
+
+    def extend_list(self):
+        self.event.wait(5)
+        return [self.value]
+
+    def first(self):
+        self.event.wait(5)
+        return self.value
+
+    def truthy(self):
+        self.event.wait(5)
+        return self.value
+
+
+# ------------------------------------------------------------------------------
+class AsyncSlowTester(object):
+    """
+    Asynchronous methods which take longer than any test deadline
+    """
+
+    async def sum(self):
+        await asyncio.sleep(5)
+        return 10
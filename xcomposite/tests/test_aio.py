@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from xcomposite import executors
+from xcomposite.tests.classes import (
+    AsyncBase,
+    AsyncSlowTester,
+    AsyncTesterA,
+    AsyncTesterB,
+)
+
+
+# ------------------------------------------------------------------------------
+class AsyncTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_sum(self):
+        """
+        Checks that the component coroutines are awaited together and
+        their results summed
+
+        :return:
+        """
+        self.assertEqual(3, self._run('sum'))
+
+    # --------------------------------------------------------------------------
+    def test_extend(self):
+        """
+        Checks that the results are combined in component order
+
+        :return:
+        """
+        self.assertEqual(['A', 'B'], self._run('extend_list'))
+
+    # --------------------------------------------------------------------------
+    def test_mixed_synchronous_methods(self):
+        """
+        Checks that synchronous component methods are combined alongside
+        asynchronous ones
+
+        :return:
+        """
+        self.assertEqual('B', self._run('last'))
+
+    # --------------------------------------------------------------------------
+    def test_ignored_results(self):
+        """
+        Checks that Ignore results do not contribute to the result
+
+        :return:
+        """
+        self.assertEqual(dict(bar=1), self._run('update'))
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _run(method_name):
+        """
+        Binds the asynchronous testers and runs the given method
+
+        :return:
+        """
+        async def run():
+            event = asyncio.Event()
+
+            bound_class = AsyncBase()
+            bound_class.bind(AsyncTesterA(event))
+            bound_class.bind(AsyncTesterB(event))
+
+            return await getattr(bound_class, method_name)()
+
+        return asyncio.run(run())
+
+    # --------------------------------------------------------------------------
+    def test_deadline_drops_late_coroutines(self):
+        """
+        Checks that coroutines which miss the deadline are cancelled and
+        their results skipped
+
+        :return:
+        """
+        slow_component = AsyncSlowTester()
+
+        bound_class = AsyncBase()
+        bound_class.bind(AsyncTesterB(asyncio.Event()))
+        bound_class.bind(slow_component)
+
+        with executors.Deadline(0.05) as deadline:
+            self.assertEqual(2, asyncio.run(bound_class.sum()))
+
+        self.assertEqual([('sum', slow_component)], deadline.dropped)
@@ -0,0 +1,179 @@
+import asyncio
+import unittest
+
+import xcomposite
+from xcomposite.tests.classes import (
+    CountingTester,
+    MemoizedBase,
+)
+
+
+# ------------------------------------------------------------------------------
+class MemoizeTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_results_are_cached(self):
+        """
+        Checks that repeated calls with the same arguments do not call
+        the components again
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        self.assertEqual([1], bound_class.items(1))
+        self.assertEqual([1], bound_class.items(1))
+        self.assertEqual([2], bound_class.items(2))
+
+        self.assertEqual(2, component.calls)
+        self.assertEqual(
+            dict(hits=1, misses=2, size=2, maxsize=2, ttl=None),
+            bound_class.cache_info()['items'],
+        )
+
+    # --------------------------------------------------------------------------
+    def test_least_recently_used_is_dropped(self):
+        """
+        Checks that the cache does not grow beyond its maximum size
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        bound_class.items(1)
+        bound_class.items(2)
+        bound_class.items(3)
+        bound_class.items(1)
+
+        self.assertEqual(4, component.calls)
+        self.assertEqual(2, bound_class.cache_info()['items']['size'])
+
+    # --------------------------------------------------------------------------
+    def test_binding_clears_the_cache(self):
+        """
+        Checks that changing the components drops the cached results
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        self.assertEqual([1], bound_class.items(1))
+
+        bound_class.bind(CountingTester())
+        self.assertEqual([1, 1], bound_class.items(1))
+
+    # --------------------------------------------------------------------------
+    def test_expired_results_are_recomputed(self):
+        """
+        Checks that results are not returned beyond their time to live
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        bound_class.total()
+        bound_class.total()
+
+        self.assertEqual(2, component.calls)
+
+    # --------------------------------------------------------------------------
+    def test_unhashable_arguments_are_not_cached(self):
+        """
+        Checks that calls with unhashable arguments still work
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        self.assertEqual([[1]], bound_class.items([1]))
+        self.assertEqual([[1]], bound_class.items([1]))
+        self.assertEqual(2, component.calls)
+
+    # --------------------------------------------------------------------------
+    def test_coroutine_results_are_cached(self):
+        """
+        Checks that memoized asynchronous methods cache the awaited result,
+        rather than a coroutine which cannot be awaited again
+
+        :return:
+        """
+        bound_class, component = self._bound_class()
+
+        self.assertEqual(1, asyncio.run(bound_class.async_total()))
+        self.assertEqual(1, asyncio.run(bound_class.async_total()))
+        self.assertEqual(1, component.calls)
+
+    # --------------------------------------------------------------------------
+    def test_iterators_cannot_be_memoized(self):
+        """
+        Checks that methods returning iterators, which could only be
+        consumed once, are refused
+
+        :return:
+        """
+        for decorator in (xcomposite.iter_results, xcomposite.chain_results):
+            with self.assertRaises(TypeError):
+                xcomposite.memoize()(decorator(lambda self: 5))
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _bound_class():
+        """
+        Returns a memoized composition with a counting component bound
+
+        :return:
+        """
+        component = CountingTester()
+
+        bound_class = MemoizedBase()
+        bound_class.bind(component)
+
+        return bound_class, component
+
+
+# ------------------------------------------------------------------------------
+class ComponentCacheTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_only_dirty_components_are_called(self):
+        """
+        Checks that cached component results are reused, and only the
+        components marked as dirty are called again
+
+        :return:
+        """
+        bound_class = MemoizedBase()
+        first_component = CountingTester()
+        second_component = CountingTester()
+
+        bound_class.bind(first_component)
+        bound_class.bind(second_component)
+
+        self.assertEqual([1, 1], bound_class.cached_items(1))
+        self.assertEqual([1, 1], bound_class.cached_items(1))
+        self.assertEqual(1, first_component.calls)
+
+        second_component.multiplier = 2
+        bound_class.mark_dirty(second_component)
+
+        self.assertEqual([1, 2], bound_class.cached_items(1))
+        self.assertEqual(1, first_component.calls)
+        self.assertEqual(2, second_component.calls)
+
+    # --------------------------------------------------------------------------
+    def test_setting_attributes_marks_dirty(self):
+        """
+        Checks that setting an attribute through the composition marks
+        the owning component as dirty
+
+        :return:
+        """
+        bound_class = MemoizedBase()
+        component = CountingTester()
+        bound_class.bind(component)
+
+        self.assertEqual([1], bound_class.cached_items(1))
+
+        bound_class.multiplier = 3
+        self.assertEqual([3], bound_class.cached_items(1))
+        self.assertEqual(2, component.calls)
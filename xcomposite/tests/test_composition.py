@@ -1,8 +1,24 @@
+import pickle
 import unittest
 from xcomposite.tests.classes import (
+    AsyncBase,
     DecoratorBase,
     DecoratorTesterA,
     DecoratorTesterB,
+    EarlyAttributeBase,
+    EarlySlottedBase,
+    IgnoreTester,
+    KeyTester,
+    LabelTester,
+    MemoizedBase,
+    MethodsBase,
+    MethodsTester,
+    PropertyTester,
+    ScoreBase,
+    ScoreListBase,
+    ScoreTesterA,
+    ScoreTesterB,
+    SlottedBase,
 )
 
 
@@ -135,3 +151,760 @@ class CompositionTests(unittest.TestCase):
 
         except (AttributeError, NotImplementedError):
             pass
+
+    # --------------------------------------------------------------------------
+    def test_dispatch_is_rebuilt_on_bind(self):
+        """
+        Checks that the cached method lookup picks up newly bound and
+        unbound components
+
+        :return:
+        """
+        base_class = DecoratorBase()
+        base_class.bind(DecoratorTesterA())
+
+        self.assertEqual(1, base_class.sum())
+
+        base_class.bind(DecoratorTesterB())
+        self.assertEqual(3, base_class.sum())
+
+        base_class.unbind(DecoratorTesterA)
+        self.assertEqual(2, base_class.sum())
+
+    # --------------------------------------------------------------------------
+    def test_nested_dispatch_is_rebuilt_on_bind(self):
+        """
+        Checks that binding into a nested composition invalidates the
+        cached method lookup of the composition it is bound into
+
+        :return:
+        """
+        outer_class = DecoratorBase()
+        inner_class = DecoratorBase()
+        outer_class.bind(inner_class)
+
+        self.assertEqual(0, outer_class.sum())
+
+        inner_class.bind(DecoratorTesterB())
+        self.assertEqual(2, outer_class.sum())
+
+    # --------------------------------------------------------------------------
+    def test_attribute_redirection(self):
+        """
+        Checks that attributes are read from and written to the owning
+        component, and that this follows changes to the component list
+
+        :return:
+        """
+        first_class = DecoratorBase()
+        second_class = DecoratorTesterB()
+        second_class.value = 1
+
+        first_class.value = 0
+        self.assertEqual(0, first_class.value)
+
+        first_class.bind(second_class)
+        first_class.value = 2
+
+        self.assertEqual(2, second_class.value)
+        self.assertEqual(0, first_class.__dict__['value'])
+
+        first_class.unbind(second_class)
+        first_class.value = 3
+
+        self.assertEqual(2, second_class.value)
+        self.assertEqual(3, first_class.value)
+
+    # --------------------------------------------------------------------------
+    def test_attributes_set_before_initialising(self):
+        """
+        Checks that subclasses can set attributes before calling the
+        __init__ of the composition
+
+        :return:
+        """
+        for composition_type in (EarlyAttributeBase, EarlySlottedBase):
+            base_class = composition_type()
+            self.assertEqual('early', base_class.name)
+
+            base_class.bind(LabelTester('A'))
+            base_class.name = 'late'
+            self.assertEqual('late', base_class.name)
+
+    # --------------------------------------------------------------------------
+    def test_generic_names_are_not_reserved(self):
+        """
+        Checks that a composition can declare, and its components can
+        provide, methods with generic names such as methods
+
+        :return:
+        """
+        base_class = MethodsBase()
+        base_class.bind(MethodsTester())
+
+        self.assertEqual(['component'], base_class.methods())
+        self.assertEqual(2, base_class.sum())
+
+        base_class = DecoratorBase()
+        component = MethodsTester()
+        base_class.bind(component)
+
+        self.assertEqual(['component'], base_class.methods())
+        self.assertEqual(dict(health=10), base_class.stats)
+        self.assertEqual(3, base_class.batch)
+
+    # --------------------------------------------------------------------------
+    def test_call_batch(self):
+        """
+        Checks that batched calls combine the results for each set of
+        arguments, using native batch methods where available
+
+        :return:
+        """
+        base_class = ScoreBase()
+        batch_component = ScoreTesterB()
+
+        base_class.bind(ScoreTesterA())
+        base_class.bind(batch_component)
+
+        self.assertEqual(
+            [11, 22, 33],
+            base_class.call_batch('score', [(1,), (2,), (3,)]),
+        )
+        self.assertEqual(1, batch_component.batch_calls)
+
+        self.assertEqual(
+            ['A1', 'A2'],
+            base_class.call_batch('label', [(1,), (2,)]),
+        )
+
+        self.assertEqual(
+            [1, 2],
+            base_class.call_batch('undecorated', [(1,), (2,)]),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_call_batch_through_nested_compositions(self):
+        """
+        Checks that a nested composition combines the batched results of
+        all its components, rather than those of the first to have a
+        batch method
+
+        :return:
+        """
+        inner_class = ScoreBase()
+        inner_class.bind(ScoreTesterA())
+        inner_class.bind(ScoreTesterB())
+
+        outer_class = ScoreListBase()
+        outer_class.bind(inner_class)
+
+        self.assertEqual(
+            [[11], [22]],
+            outer_class.call_batch('score', [(1,), (2,)]),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_call_batch_rejects_mismatched_results(self):
+        """
+        Checks that a batch method giving the wrong number of results
+        is reported, rather than argument sets being dropped
+
+        :return:
+        """
+        base_class = ScoreBase()
+        batch_component = ScoreTesterB()
+        batch_component.score_batch = lambda arg_sets: [2]
+
+        base_class.bind(ScoreTesterA())
+        base_class.bind(batch_component)
+
+        with self.assertRaises(ValueError):
+            base_class.call_batch('score', [(1,), (2,), (3,)])
+
+    # --------------------------------------------------------------------------
+    def test_call_batch_rejects_asynchronous_methods(self):
+        """
+        Checks that asynchronous methods, whose results the reducer cannot
+        combine, are refused
+
+        :return:
+        """
+        base_class = AsyncBase()
+        base_class.bind(DecoratorTesterB())
+
+        with self.assertRaises(TypeError):
+            base_class.call_batch('sum', [(), ()])
+
+    # --------------------------------------------------------------------------
+    def test_call_batch_without_components(self):
+        """
+        Checks that batched calls return a result for each set of
+        arguments even when no components implement the method
+
+        :return:
+        """
+        base_class = ScoreBase()
+
+        self.assertEqual(
+            [0, 0],
+            base_class.call_batch('score', [(1,), (2,)]),
+        )
+
+
+# ------------------------------------------------------------------------------
+class SlottedCompositionTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_has_no_instance_dict(self):
+        """
+        Checks that the slotted composition does not carry a __dict__
+
+        :return:
+        """
+        self.assertFalse(hasattr(SlottedBase(), '__dict__'))
+
+    # --------------------------------------------------------------------------
+    def test_binding_and_unbinding(self):
+        """
+        Checks that components can be bound and unbound, and that the
+        decorated methods follow those changes
+
+        :return:
+        """
+        base_class = SlottedBase()
+        component = ScoreTesterA()
+
+        base_class.bind(component)
+        self.assertEqual(3, base_class.score(3))
+        self.assertEqual((component,), tuple(base_class.components()))
+
+        base_class.unbind(component)
+        self.assertEqual(0, base_class.score(3))
+        self.assertEqual((), tuple(base_class.components()))
+
+    # --------------------------------------------------------------------------
+    def test_methods_are_not_cached_per_instance(self):
+        """
+        Checks that calling a composition does not build a cache of its
+        own, whilst still picking up methods held by instances
+
+        :return:
+        """
+        for composition_type in (ScoreBase, SlottedBase):
+            base_class = composition_type()
+            base_class.bind_many([ScoreTesterA(), LabelTester('A')])
+
+            self.assertEqual(3, base_class.score(3))
+            self.assertIsNone(base_class._dispatch)
+
+            component = LabelTester('B')
+            component.score = lambda value: 10
+
+            other_class = composition_type()
+            other_class.bind_many([ScoreTesterA(), component])
+
+            self.assertEqual(13, other_class.score(3))
+            self.assertIs(base_class._plan, other_class._plan)
+
+            # -- Timed methods are cached, as they hold the stats
+            other_class.enable_stats()
+            self.assertEqual(13, other_class.score(3))
+            self.assertEqual(
+                1,
+                other_class.call_stats()[('score', ScoreTesterA)]['count'],
+            )
+
+    # --------------------------------------------------------------------------
+    def test_nesting_within_a_composition(self):
+        """
+        Checks that a slotted composition can be bound into a regular
+        composition and still informs it of changes to its components
+
+        :return:
+        """
+        outer_class = ScoreBase()
+        inner_class = SlottedBase()
+        outer_class.bind(inner_class)
+
+        self.assertEqual(0, outer_class.score(2))
+
+        inner_class.bind(ScoreTesterA())
+        self.assertEqual(2, outer_class.score(2))
+
+    # --------------------------------------------------------------------------
+    def test_attribute_redirection(self):
+        """
+        Checks that attributes are redirected to components, and that
+        declared slots are written to the composition itself
+
+        :return:
+        """
+        base_class = SlottedBase()
+        component = DecoratorTesterB()
+        component.value = 1
+
+        base_class.bind(component)
+        base_class.value = 2
+        base_class.name = 'entity'
+
+        self.assertEqual(2, component.value)
+        self.assertEqual('entity', base_class.name)
+
+        with self.assertRaises(AttributeError):
+            base_class.undeclared = True
+
+    # --------------------------------------------------------------------------
+    def test_pickling(self):
+        """
+        Checks that a slotted composition survives a pickle round trip
+
+        :return:
+        """
+        base_class = SlottedBase()
+        base_class.name = 'entity'
+        base_class.bind(ScoreTesterA())
+
+        restored = pickle.loads(pickle.dumps(base_class))
+
+        self.assertEqual('entity', restored.name)
+        self.assertEqual(4, restored.score(4))
+
+
+# ------------------------------------------------------------------------------
+class ComponentLookupTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_get_component(self):
+        """
+        Checks that the first component of a type (or subclass of that
+        type) is returned, and None when there is no such component
+
+        :return:
+        """
+        base_class = ScoreBase()
+        first_class = DecoratorTesterA()
+        second_class = DecoratorTesterB()
+
+        self.assertIsNone(base_class.get_component(DecoratorBase))
+
+        base_class.bind(second_class)
+        base_class.bind(first_class)
+
+        self.assertIs(first_class, base_class.get_component(DecoratorBase))
+        self.assertIs(
+            second_class,
+            base_class.get_component((DecoratorBase, DecoratorTesterB)),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_components_of(self):
+        """
+        Checks that all the components of a type are returned in component
+        order, and that this follows binds and unbinds
+
+        :return:
+        """
+        base_class = ScoreBase()
+        first_class = DecoratorTesterA()
+        second_class = DecoratorBase()
+
+        base_class.bind(first_class)
+        base_class.bind(ScoreTesterA())
+        self.assertEqual(
+            [first_class],
+            base_class.components_of(DecoratorBase),
+        )
+
+        base_class.bind(second_class)
+        self.assertEqual(
+            [first_class, second_class],
+            base_class.components_of(DecoratorBase),
+        )
+
+        base_class.unbind(DecoratorBase)
+        self.assertEqual(
+            [second_class],
+            base_class.components_of(DecoratorBase),
+        )
+        self.assertEqual([], base_class.components_of(DecoratorTesterA))
+
+    # --------------------------------------------------------------------------
+    def test_unbind_by_instance_and_type(self):
+        """
+        Checks that unbinding removes the given instance, or the first
+        instance of the given type, and reports whether anything was removed
+
+        :return:
+        """
+        base_class = ScoreBase()
+        components = [ScoreTesterA() for _ in range(3)]
+
+        for component in components:
+            base_class.bind(component)
+
+        self.assertTrue(base_class.unbind(components[1]))
+        self.assertTrue(base_class.unbind(ScoreTesterA))
+        self.assertEqual([components[2]], base_class.components())
+
+        self.assertFalse(base_class.unbind(DecoratorBase))
+        self.assertFalse(base_class.unbind(components[0]))
+        self.assertFalse(base_class.unbind('not a component'))
+
+    # --------------------------------------------------------------------------
+    def test_unbind_plain_and_equal_instances(self):
+        """
+        Checks that instances which cannot be found by their type, such as
+        plain objects or those comparing equal to a component of another
+        type, are still unbound
+
+        :return:
+        """
+        base_class = ScoreBase()
+        plain = object()
+        keyed = KeyTester('a')
+
+        base_class.bind(plain)
+        base_class.bind(keyed)
+
+        self.assertTrue(base_class.unbind(plain))
+        self.assertEqual([keyed], base_class.components())
+
+        self.assertFalse(base_class.unbind(ScoreTesterA()))
+
+        other = ScoreTesterA()
+        other.key = 'a'
+
+        self.assertTrue(base_class.unbind(other))
+        self.assertEqual([], base_class.components())
+
+
+# ------------------------------------------------------------------------------
+class BatchTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_bind_many_and_unbind_many(self):
+        """
+        Checks that components can be bound and unbound in bulk, for both
+        regular and slotted compositions
+
+        :return:
+        """
+        for composition_type in (ScoreBase, SlottedBase):
+            base_class = composition_type()
+            components = [ScoreTesterA() for _ in range(4)]
+
+            self.assertEqual(0, base_class.score(1))
+
+            base_class.bind_many(components)
+            self.assertEqual(4, base_class.score(1))
+            self.assertEqual(components, list(base_class.components()))
+
+            self.assertEqual(
+                3,
+                base_class.unbind_many(
+                    [components[0], ScoreTesterA, DecoratorBase, components[3]],
+                ),
+            )
+            self.assertEqual([components[2]], list(base_class.components()))
+            self.assertEqual(1, base_class.score(1))
+
+    # --------------------------------------------------------------------------
+    def test_batch_invalidates_once(self):
+        """
+        Checks that parent compositions are only told of the changes once
+        the outermost batch has finished
+
+        :return:
+        """
+        outer_class = ScoreBase()
+        inner_class = SlottedBase()
+        outer_class.bind(inner_class)
+
+        self.assertEqual(0, outer_class.score(1))
+        dispatch = outer_class._dispatch
+
+        with inner_class.batch_changes():
+            with inner_class.batch_changes():
+                inner_class.bind(ScoreTesterA())
+
+            inner_class.bind(ScoreTesterA())
+            self.assertIs(dispatch, outer_class._dispatch)
+
+        self.assertIsNone(outer_class._dispatch)
+        self.assertEqual(2, outer_class.score(1))
+        self.assertIsInstance(inner_class.components(), tuple)
+
+
+# ------------------------------------------------------------------------------
+class PriorityTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_bind_with_priority(self):
+        """
+        Checks that components are ordered by priority, and by bind order
+        for equal priorities
+
+        :return:
+        """
+        for composition_type in (ScoreBase, SlottedBase):
+            base_class = composition_type()
+
+            base_class.bind(LabelTester('a'))
+            base_class.bind(LabelTester('b'), priority=-1)
+            base_class.bind(LabelTester('c'), priority=1)
+            base_class.bind(LabelTester('d'))
+
+            self.assertEqual(
+                ['b', 'a', 'd', 'c'],
+                [component.text for component in base_class.components()],
+            )
+
+    # --------------------------------------------------------------------------
+    def test_set_priority_refreshes_dispatch(self):
+        """
+        Checks that changing the priority of a component reorders it and
+        that decorated methods follow the new order
+
+        :return:
+        """
+        base_class = ScoreBase()
+        first_class = LabelTester('a')
+        second_class = LabelTester('b')
+
+        base_class.bind_many([first_class, second_class])
+        self.assertEqual('b', base_class.label(0))
+
+        base_class.set_priority(second_class, -1)
+        self.assertEqual('a', base_class.label(0))
+        self.assertIs(second_class, base_class.get_component(LabelTester))
+
+        base_class.unbind(first_class)
+        self.assertEqual('b', base_class.label(0))
+
+        with self.assertRaises(ValueError):
+            base_class.set_priority(first_class, 0)
+
+    # --------------------------------------------------------------------------
+    def test_priorities_survive_pickling(self):
+        """
+        Checks that components keep their priorities when pickled
+
+        :return:
+        """
+        base_class = SlottedBase()
+        base_class.bind(LabelTester('a'), priority=2)
+        base_class.bind(LabelTester('b'), priority=1)
+
+        restored = pickle.loads(pickle.dumps(base_class))
+        restored.bind(LabelTester('c'), priority=3)
+        restored.bind(LabelTester('d'))
+
+        self.assertEqual(
+            ['d', 'b', 'a', 'c'],
+            [component.text for component in restored.components()],
+        )
+
+
+# ------------------------------------------------------------------------------
+class DispatchPlanTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_plans_are_shared(self):
+        """
+        Checks that compositions with the same layout of component classes
+        share a plan, and those with a different layout do not
+
+        :return:
+        """
+        first_class = ScoreBase()
+        first_class.bind_many([ScoreTesterA(), LabelTester('X')])
+
+        second_class = ScoreBase()
+        second_class.bind_many([ScoreTesterA(), LabelTester('Y')])
+
+        self.assertEqual('X', first_class.label(1))
+        self.assertEqual('Y', second_class.label(1))
+        self.assertEqual(2, second_class.score(2))
+        self.assertIs(first_class._plan, second_class._plan)
+
+        second_class.unbind(ScoreTesterA)
+        self.assertEqual('Y', second_class.label(1))
+        self.assertIsNot(first_class._plan, second_class._plan)
+
+    # --------------------------------------------------------------------------
+    def test_instance_attributes_are_found(self):
+        """
+        Checks that methods held by a component instance rather than its
+        class are still found, and only for that instance
+
+        :return:
+        """
+        component = LabelTester('X')
+        component.score = lambda value: 5
+
+        first_class = ScoreBase()
+        first_class.bind_many([ScoreTesterA(), component])
+
+        second_class = ScoreBase()
+        second_class.bind_many([ScoreTesterA(), LabelTester('Y')])
+
+        self.assertEqual(6, first_class.score(1))
+        self.assertEqual(1, second_class.score(1))
+        self.assertEqual('X', first_class.text)
+        self.assertIs(first_class._plan, second_class._plan)
+
+    # --------------------------------------------------------------------------
+    def test_dynamic_attributes_are_found(self):
+        """
+        Checks that attributes which cannot be told from the class of a
+        component are looked up on each instance
+
+        :return:
+        """
+        base_class = ScoreBase()
+        base_class.bind_many([LabelTester('B'), PropertyTester()])
+        self.assertEqual('B', base_class.label(1))
+
+        base_class = ScoreBase()
+        base_class.bind_many([LabelTester('B'), PropertyTester('A')])
+        self.assertEqual('A', base_class.label(1))
+
+    # --------------------------------------------------------------------------
+    def test_plans_follow_changes_within_a_batch(self):
+        """
+        Checks that attribute lookups made within a batch see the
+        components bound within it
+
+        :return:
+        """
+        base_class = ScoreBase()
+        base_class.bind(LabelTester('A'))
+        self.assertEqual('A', base_class.label(1))
+
+        component = ScoreTesterB()
+
+        with base_class.batch_changes():
+            base_class.bind(component)
+            self.assertEqual(
+                [20],
+                base_class.score_batch([(2,)]),
+            )
+
+
+# ------------------------------------------------------------------------------
+class NestingTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_nested_methods_are_flattened(self):
+        """
+        Checks that nested compositions using the same associative reducer
+        are replaced by their own methods, giving the same result
+
+        :return:
+        """
+        outer_class = DecoratorBase()
+        middle_class = DecoratorBase()
+        inner_class = DecoratorBase()
+
+        inner_class.bind_many([DecoratorTesterB(), DecoratorTesterB()])
+        middle_class.bind_many([inner_class, DecoratorTesterB()])
+        outer_class.bind_many([DecoratorTesterB(), middle_class])
+
+        self.assertEqual(4, len(outer_class._dispatch_methods('sum')))
+        self.assertEqual(8, outer_class.sum())
+        self.assertEqual(2, outer_class.min())
+
+        # -- Reducers which are not associative are called as normal
+        self.assertEqual(2, len(outer_class._dispatch_methods('append')))
+
+        # -- Changes to the nested compositions are still followed
+        inner_class.bind(DecoratorTesterB())
+        self.assertEqual(5, len(outer_class._dispatch_methods('sum')))
+        self.assertEqual(10, outer_class.sum())
+
+    # --------------------------------------------------------------------------
+    def test_empty_nested_compositions_are_called(self):
+        """
+        Checks that a nested composition without components still gives
+        its own result, rather than being flattened away
+
+        :return:
+        """
+        outer_class = DecoratorBase()
+        outer_class.bind(DecoratorTesterB())
+        outer_class.bind(DecoratorBase())
+
+        self.assertEqual(2, outer_class.sum())
+
+        with self.assertRaises(ValueError):
+            outer_class.min()
+
+        # -- A nested composition whose components all ignore the call
+        # -- has no results of its own either
+        inner_class = DecoratorBase()
+        inner_class.bind(IgnoreTester())
+
+        outer_class = DecoratorBase()
+        outer_class.bind(DecoratorTesterB())
+        outer_class.bind(inner_class)
+
+        self.assertEqual(2, outer_class.sum())
+        self.assertEqual(['B'], outer_class.extend_list())
+
+        with self.assertRaises(ValueError):
+            outer_class.min()
+
+        with self.assertRaises(ValueError):
+            outer_class.max()
+
+    # --------------------------------------------------------------------------
+    def test_nested_extras_are_not_flattened(self):
+        """
+        Checks that nested compositions with behaviour layered on top of
+        the reducer, or an executor, are called as normal
+
+        :return:
+        """
+        outer_class = MemoizedBase()
+        inner_class = MemoizedBase()
+        inner_class.bind(ScoreTesterA())
+        outer_class.bind(inner_class)
+
+        self.assertEqual(
+            (inner_class.total,),
+            outer_class._dispatch_methods('total'),
+        )
+
+        outer_class = DecoratorBase()
+        inner_class = DecoratorBase()
+        inner_class.bind(DecoratorTesterB())
+        outer_class.bind(inner_class)
+
+        inner_class.set_executor(True)
+        self.assertEqual(
+            (inner_class.sum,),
+            outer_class._dispatch_methods('sum'),
+        )
+        self.assertEqual(2, outer_class.sum())
+
+    # --------------------------------------------------------------------------
+    def test_cycles_are_rejected(self):
+        """
+        Checks that a composition cannot be bound within itself, directly
+        or through another composition
+
+        :return:
+        """
+        outer_class = DecoratorBase()
+        inner_class = DecoratorBase()
+        outer_class.bind(inner_class)
+
+        with self.assertRaises(ValueError):
+            outer_class.bind(outer_class)
+
+        with self.assertRaises(ValueError):
+            inner_class.bind(outer_class)
+
+        self.assertEqual([inner_class], outer_class.components())
+        self.assertEqual([], inner_class.components())
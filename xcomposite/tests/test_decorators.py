@@ -1,8 +1,12 @@
 import unittest
 from xcomposite.tests.classes import (
+    BooleanBase,
+    BooleanTester,
     DecoratorBase,
     DecoratorTesterA,
     DecoratorTesterB,
+    IgnoreTester,
+    RaisingTester,
     UndecoratedTesterA,
     UndecoratedTesterB,
     PartiallyDecoratedTesterA,
@@ -192,6 +196,88 @@ class CompositionTests(unittest.TestCase):
         except Exception:
             pass
 
+    # --------------------------------------------------------------------------
+    def test_iterate(self):
+        """
+        Checks that each result is yielded in turn
+
+        :return:
+        """
+        bound_class = self._bound_class()
+
+        self.assertEqual(
+            ['A', 'B'],
+            list(bound_class.iterate()),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_chain(self):
+        """
+        Checks that the items of each result are yielded in turn
+
+        :return:
+        """
+        bound_class = self._bound_class()
+
+        self.assertEqual(
+            ['A', 'B'],
+            list(bound_class.chain()),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_lazy_decorators_only_call_when_consumed(self):
+        """
+        Checks that the lazy decorators do not call a component until
+        the consumer reaches it
+
+        :return:
+        """
+        bound_class = self._bound_class()
+        bound_class.bind(RaisingTester())
+
+        self.assertEqual('A', next(bound_class.iterate()))
+        self.assertEqual('A', next(bound_class.chain()))
+
+        self.assertRaises(RuntimeError, list, bound_class.iterate())
+
+    # --------------------------------------------------------------------------
+    def test_boolean_short_circuit(self):
+        """
+        Checks that the boolean decorators stop calling components once
+        the answer is known, unless they are marked as exhaustive
+
+        :return:
+        """
+        bound_class = BooleanBase()
+        bound_class.bind(BooleanTester())
+        bound_class.bind(RaisingTester())
+
+        self.assertTrue(bound_class.valid())
+        self.assertFalse(bound_class.invalid())
+
+        self.assertRaises(RuntimeError, bound_class.valid_exhaustive)
+
+    # --------------------------------------------------------------------------
+    def test_ignored_results(self):
+        """
+        Checks that components returning Ignore do not contribute to
+        any of the results
+
+        :return:
+        """
+        bound_class = self._bound_class()
+        bound_class.unbind(DecoratorTesterA)
+        bound_class.bind(IgnoreTester())
+
+        self.assertEqual(2, bound_class.min())
+        self.assertEqual(2, bound_class.sum())
+        self.assertEqual('B', bound_class.first())
+        self.assertEqual('B', bound_class.last())
+        self.assertEqual(['B'], bound_class.append())
+        self.assertEqual(['B'], bound_class.extend_list())
+        self.assertEqual(2.0, bound_class.average())
+        self.assertEqual(dict(bar=1), bound_class.update())
+
     # --------------------------------------------------------------------------
     def _bound_class(self):
         """
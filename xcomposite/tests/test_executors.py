@@ -0,0 +1,240 @@
+import os
+import pickle
+import threading
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from xcomposite import executors
+from xcomposite.tests.classes import (
+    BarrierTester,
+    DecoratorBase,
+    DecoratorTesterB,
+    HedgedBase,
+    IgnoreTester,
+    ProcessTester,
+    SlowTester,
+)
+
+
+# ------------------------------------------------------------------------------
+class ExecutorTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_components_are_called_concurrently(self):
+        """
+        Checks that the components are called concurrently and the results
+        are still combined in component order
+
+        :return:
+        """
+        bound_class = self._bound_class(ThreadPoolExecutor(max_workers=2))
+
+        self.assertEqual(['A', 'B'], bound_class.extend_list())
+        self.assertEqual('A', bound_class.min())
+        self.assertEqual('A', bound_class.first())
+        self.assertEqual('B', bound_class.last())
+
+    # --------------------------------------------------------------------------
+    def test_shared_executor(self):
+        """
+        Checks that passing True uses the shared thread pool
+
+        :return:
+        """
+        bound_class = self._bound_class(True)
+
+        self.assertIs(executors.shared_executor(), bound_class._executor)
+        self.assertEqual(['A', 'B'], bound_class.extend_list())
+
+    # --------------------------------------------------------------------------
+    def test_components_are_called_serially_by_default(self):
+        """
+        Checks that without an executor the components are called one
+        after another, which the barrier cannot get past
+
+        :return:
+        """
+        bound_class = self._bound_class(None, timeout=0.1)
+
+        self.assertRaises(
+            threading.BrokenBarrierError,
+            bound_class.extend_list,
+        )
+
+    # --------------------------------------------------------------------------
+    def test_component_process_pool(self):
+        """
+        Checks that components are called within the worker processes
+        and their results combined as normal
+
+        :return:
+        """
+        bound_class = DecoratorBase()
+        bound_class.bind(ProcessTester(1))
+        bound_class.bind(ProcessTester(2))
+
+        pool = executors.ComponentProcessPool(bound_class, max_workers=2)
+
+        with pool:
+            bound_class.set_executor(pool)
+
+            self.assertEqual(3, bound_class.sum())
+            self.assertNotIn(os.getpid(), bound_class.extend_list())
+
+            # -- Components bound after the pool was made are not known
+            # -- to the workers
+            bound_class.bind(ProcessTester(3))
+            self.assertRaises(ValueError, bound_class.sum)
+
+    # --------------------------------------------------------------------------
+    def test_compositions_can_be_pickled(self):
+        """
+        Checks that a composition holding an executor and nested
+        compositions can be pickled
+
+        :return:
+        """
+        bound_class = DecoratorBase()
+        bound_class.bind(DecoratorTesterB())
+        bound_class.set_executor(True)
+
+        restored_class = pickle.loads(pickle.dumps(bound_class))
+
+        self.assertEqual(2, restored_class.sum())
+        self.assertIsNone(restored_class._executor)
+
+    # --------------------------------------------------------------------------
+    def test_deadline_drops_late_components(self):
+        """
+        Checks that components which miss the deadline are treated as
+        ignored, and are recorded on the deadline
+
+        :return:
+        """
+        event = threading.Event()
+        slow_component = SlowTester(event, 5)
+
+        bound_class = DecoratorBase()
+        bound_class.bind(DecoratorTesterB())
+        bound_class.bind(slow_component)
+        bound_class.set_executor(ThreadPoolExecutor(max_workers=2))
+
+        try:
+            with executors.Deadline(10) as outer_deadline:
+                with executors.Deadline(0.05) as deadline:
+                    self.assertEqual(2, bound_class.sum())
+                    self.assertEqual(['B'], bound_class.extend_list())
+
+        finally:
+            event.set()
+
+        self.assertEqual(
+            [('sum', slow_component), ('extend_list', slow_component)],
+            deadline.dropped,
+        )
+        self.assertEqual(deadline.dropped, outer_deadline.dropped)
+
+        # -- Components which answer in time are all used
+        with executors.Deadline(5) as deadline:
+            self.assertEqual(7, bound_class.sum())
+
+        self.assertEqual([], deadline.dropped)
+
+    # --------------------------------------------------------------------------
+    def test_hedged_calls_are_concurrent(self):
+        """
+        Checks that hedged methods call their components concurrently
+        without an executor being set
+
+        :return:
+        """
+        barrier = threading.Barrier(2, timeout=5)
+
+        bound_class = HedgedBase()
+        bound_class.bind(BarrierTester(barrier, 0))
+        bound_class.bind(BarrierTester(barrier, 'B'))
+
+        self.assertEqual(0, bound_class.first())
+        self.assertEqual('B', bound_class.last())
+        self.assertEqual('B', bound_class.truthy())
+
+    # --------------------------------------------------------------------------
+    def test_hedged_calls_keep_component_order(self):
+        """
+        Checks that hedged methods wait on the components ahead of the
+        winning one, but not on those which follow it
+
+        :return:
+        """
+        event = threading.Event()
+
+        bound_class = HedgedBase()
+        bound_class.bind(IgnoreTester())
+        bound_class.bind(SlowTester(event, 'A'))
+        bound_class.bind(DecoratorTesterB())
+
+        timer = threading.Timer(0.05, event.set)
+        timer.start()
+
+        try:
+            self.assertEqual('A', bound_class.first())
+
+        finally:
+            timer.join()
+
+        # -- A later component which is still running does not hold up
+        # -- the answer of an earlier one
+        event = threading.Event()
+
+        bound_class = HedgedBase()
+        bound_class.bind(DecoratorTesterB())
+        bound_class.bind(SlowTester(event, 'C'))
+
+        start = time.perf_counter()
+
+        try:
+            self.assertEqual('B', bound_class.first())
+            self.assertLess(time.perf_counter() - start, 1)
+
+        finally:
+            event.set()
+
+    # --------------------------------------------------------------------------
+    def test_nested_hedged_calls(self):
+        """
+        Checks that hedged compositions nested within one another give
+        the same answer as when called serially
+
+        :return:
+        """
+        inner_class = HedgedBase()
+        inner_class.bind(IgnoreTester())
+        inner_class.bind(DecoratorTesterB())
+
+        bound_class = HedgedBase()
+        bound_class.bind(IgnoreTester())
+        bound_class.bind(inner_class)
+        bound_class.bind(DecoratorTesterB())
+
+        self.assertEqual('B', bound_class.first())
+        self.assertEqual('B', bound_class.last())
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _bound_class(executor, timeout=1):
+        """
+        Returns a composition bound with two components which have to
+        be called concurrently to return
+
+        :return:
+        """
+        barrier = threading.Barrier(2, timeout=timeout)
+
+        bound_class = DecoratorBase()
+        bound_class.bind(BarrierTester(barrier, 'A'))
+        bound_class.bind(BarrierTester(barrier, 'B'))
+        bound_class.set_executor(executor)
+
+        return bound_class
@@ -0,0 +1,247 @@
+import asyncio
+import unittest
+
+import xcomposite
+
+from xcomposite.tests.classes import (
+    AsyncBase,
+    CountingTester,
+    DecoratorBase,
+    DecoratorTesterA,
+    DecoratorTesterB,
+    DisabledScoreTester,
+    IgnoreTester,
+    LabelTester,
+    MemoizedBase,
+    PropertyTester,
+    ScoreBase,
+    SlottedBase,
+    UndecoratedTesterA,
+)
+
+
+# ------------------------------------------------------------------------------
+class CompositionGroupTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_call_matches_individual_calls(self):
+        """
+        Checks that calling a method across the group gives the same
+        results as calling it on each composition in turn
+
+        :return:
+        """
+        group = self._group()
+
+        for method_name in ('sum', 'first', 'last', 'extend_list', 'update'):
+            self.assertEqual(
+                [
+                    getattr(composition, method_name)()
+                    for composition in group
+                ],
+                group.call(method_name),
+            )
+
+    # --------------------------------------------------------------------------
+    def test_instance_attributes_are_used(self):
+        """
+        Checks that methods provided by instance attributes rather than
+        the component class are still called
+
+        :return:
+        """
+        group = self._group()
+
+        component = DecoratorTesterA()
+        component.sum = lambda: 10
+
+        composition = DecoratorBase()
+        composition.bind(component)
+        group.add(composition)
+
+        self.assertEqual(10, group.call('sum')[-1])
+
+        # -- Compositions sharing a layout may still differ in their
+        # -- instance attributes
+        component = DecoratorTesterA()
+        component.sum = lambda: 100
+
+        composition = DecoratorBase()
+        composition.bind(component)
+        group.add(composition)
+
+        self.assertEqual(
+            [composition.sum() for composition in group],
+            group.call('sum'),
+        )
+        self.assertEqual([10, 100], group.call('sum')[-2:])
+
+        # -- As may methods only held by instances
+        group = xcomposite.CompositionGroup()
+
+        for label in (None, 'A'):
+            component = LabelTester('B')
+
+            if label:
+                component.first = lambda: label
+
+            composition = DecoratorBase()
+            composition.bind(component)
+            group.add(composition)
+
+        self.assertEqual([None, 'A'], group.call('first'))
+
+    # --------------------------------------------------------------------------
+    def test_dynamic_attributes_are_used(self):
+        """
+        Checks that layouts whose components cannot be resolved from
+        their class are still called correctly
+
+        :return:
+        """
+        group = xcomposite.CompositionGroup()
+
+        for text in (None, 'A'):
+            composition = ScoreBase()
+            composition.bind(LabelTester('B'))
+            composition.bind(PropertyTester(text))
+            group.add(composition)
+
+        self.assertEqual(['B', 'A'], group.call('label', 1))
+
+    # --------------------------------------------------------------------------
+    def test_binding_is_reflected(self):
+        """
+        Checks that changes to the components of a composition in the
+        group are reflected in later calls
+
+        :return:
+        """
+        group = self._group()
+        self.assertEqual([3, 3, 2, 1, 0], group.call('sum'))
+
+        group.compositions()[-1].bind(DecoratorTesterB())
+        self.assertEqual([3, 3, 2, 1, 2], group.call('sum'))
+
+    # --------------------------------------------------------------------------
+    def test_undecorated_methods(self):
+        """
+        Checks that undecorated methods are called as normal
+
+        :return:
+        """
+        group = xcomposite.CompositionGroup(
+            [UndecoratedTesterA(), UndecoratedTesterA()],
+        )
+
+        self.assertEqual([1, 1], group.call('undecorated'))
+
+    # --------------------------------------------------------------------------
+    def test_disabled_methods_are_not_inherited(self):
+        """
+        Checks that a component class which disables a method it inherits
+        is not called through the method of its base class
+
+        :return:
+        """
+        for composition_type in (ScoreBase, SlottedBase):
+            composition = composition_type()
+            composition.bind(DisabledScoreTester())
+            group = xcomposite.CompositionGroup([composition])
+
+            with self.assertRaises(TypeError):
+                composition.score(1)
+
+            with self.assertRaises(TypeError):
+                group.call('score', 1)
+
+    # --------------------------------------------------------------------------
+    def test_cached_component_results_are_used(self):
+        """
+        Checks that methods caching the results of each component use
+        those cached results when called across the group
+
+        :return:
+        """
+        composition = MemoizedBase()
+        component = CountingTester()
+        composition.bind(component)
+        group = xcomposite.CompositionGroup([composition])
+
+        self.assertEqual([1], composition.cached_items(1))
+        self.assertEqual([[1]], group.call('cached_items', 1))
+        self.assertEqual([[1]], group.call('cached_items', 1))
+        self.assertEqual(1, component.calls)
+
+    # --------------------------------------------------------------------------
+    def test_calls_are_recorded(self):
+        """
+        Checks that calls made across the group are recorded by the stats
+        of each composition and by an active tracer
+
+        :return:
+        """
+        group = self._group()
+        composition = group.compositions()[0]
+        composition.enable_stats()
+
+        self.assertEqual([3, 3, 2, 1, 0], group.call('sum'))
+        self.assertEqual(
+            {('sum', DecoratorTesterA), ('sum', DecoratorTesterB)},
+            set(composition.call_stats()),
+        )
+
+        composition.disable_stats()
+
+        with xcomposite.Tracer() as tracer:
+            self.assertEqual([3, 3, 2, 1, 0], group.call('sum'))
+
+        calls = tracer.calls()
+        path = ('DecoratorBase.sum', 'DecoratorTesterB.sum')
+        self.assertEqual(3, calls[path]['count'])
+
+    # --------------------------------------------------------------------------
+    def test_asynchronous_methods(self):
+        """
+        Checks that asynchronous methods give the coroutine of each
+        composition to be awaited
+
+        :return:
+        """
+        group = xcomposite.CompositionGroup()
+
+        for _ in range(2):
+            composition = AsyncBase()
+            composition.bind(DecoratorTesterB())
+            group.add(composition)
+
+        async def gather():
+            return await asyncio.gather(*group.call('sum'))
+
+        self.assertEqual([2, 2], asyncio.run(gather()))
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _group():
+        """
+        Returns a group of compositions with a mixture of layouts
+
+        :return:
+        """
+        group = xcomposite.CompositionGroup()
+
+        for components in (
+            (DecoratorTesterA, DecoratorTesterB),
+            (DecoratorTesterA, DecoratorTesterB),
+            (DecoratorTesterB, IgnoreTester),
+            (IgnoreTester, DecoratorTesterA),
+            (),
+        ):
+            composition = DecoratorBase()
+
+            for component in components:
+                composition.bind(component())
+
+            group.add(composition)
+
+        return group
@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+
+from xcomposite.tests.classes import (
+    AsyncBase,
+    AsyncTesterA,
+    AsyncTesterB,
+    DecoratorBase,
+    DecoratorTesterA,
+    DecoratorTesterB,
+    FlagsBase,
+    FlagsTester,
+)
+
+
+# ------------------------------------------------------------------------------
+class InstrumentationTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_calls_are_recorded_per_component_class(self):
+        """
+        Checks that each component call is recorded against the method
+        name and the class of the component
+
+        :return:
+        """
+        base_class = DecoratorBase()
+        base_class.bind(DecoratorTesterA())
+        base_class.bind(DecoratorTesterB())
+        base_class.enable_stats()
+
+        base_class.sum()
+        base_class.sum()
+        base_class.first()
+
+        stats = base_class.call_stats()
+
+        self.assertEqual(
+            {
+                ('sum', DecoratorTesterA),
+                ('sum', DecoratorTesterB),
+                ('first', DecoratorTesterA),
+            },
+            set(stats),
+        )
+
+        record = stats[('sum', DecoratorTesterB)]
+        self.assertEqual(2, record['count'])
+        self.assertEqual(0, record['exceptions'])
+        self.assertLessEqual(record['min'], record['max'])
+        self.assertLessEqual(record['max'], record['total'])
+
+    # --------------------------------------------------------------------------
+    def test_exceptions_are_counted(self):
+        """
+        Checks that calls which raise are recorded, and still raise
+
+        :return:
+        """
+        base_class = FlagsBase()
+        base_class.bind(FlagsTester(None))
+        base_class.enable_stats()
+
+        with self.assertRaises(RuntimeError):
+            base_class.flags()
+
+        record = base_class.call_stats()[('flags', FlagsTester)]
+        self.assertEqual(1, record['count'])
+        self.assertEqual(1, record['exceptions'])
+
+    # --------------------------------------------------------------------------
+    def test_switching_off_removes_the_timing(self):
+        """
+        Checks that the components are called directly when instrumentation
+        is switched off, and that stats can be reset
+
+        :return:
+        """
+        base_class = DecoratorBase()
+        component = DecoratorTesterB()
+        base_class.bind(component)
+
+        self.assertEqual((component.sum,), base_class._dispatch_methods('sum'))
+
+        base_class.enable_stats()
+        base_class.sum()
+        self.assertEqual(1, len(base_class.call_stats()))
+
+        base_class.reset_stats()
+        self.assertEqual(dict(), base_class.call_stats())
+
+        base_class.sum()
+        base_class.disable_stats()
+
+        self.assertEqual(dict(), base_class.call_stats())
+        self.assertEqual((component.sum,), base_class._dispatch_methods('sum'))
+
+    # --------------------------------------------------------------------------
+    def test_coroutines_are_timed_once_awaited(self):
+        """
+        Checks that coroutine methods are recorded once they are awaited
+
+        :return:
+        """
+        event = asyncio.Event()
+        base_class = AsyncBase()
+        base_class.bind(AsyncTesterA(event))
+        base_class.bind(AsyncTesterB(event))
+        base_class.enable_stats()
+
+        self.assertEqual(3, asyncio.run(base_class.sum()))
+
+        stats = base_class.call_stats()
+        self.assertEqual(1, stats[('sum', AsyncTesterA)]['count'])
+        self.assertEqual(1, stats[('sum', AsyncTesterB)]['count'])
@@ -0,0 +1,94 @@
+import unittest
+
+import xcomposite
+
+from xcomposite import numeric
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+# ------------------------------------------------------------------------------
+class NumericBase(xcomposite.Composition):
+
+    @numeric.take_sum
+    def sum(self):
+        return None
+
+    @numeric.take_min
+    def min(self):
+        return None
+
+    @numeric.take_max
+    def max(self):
+        return None
+
+    @numeric.take_average
+    def average(self):
+        return None
+
+    @numeric.take_range
+    def range(self):
+        return None
+
+
+# ------------------------------------------------------------------------------
+class NumericTester(object):
+
+    def __init__(self, values):
+        self.values = values
+
+    def sum(self):
+        return self.values
+
+    def min(self):
+        return self.values
+
+    def max(self):
+        return self.values
+
+    def average(self):
+        return self.values
+
+    def range(self):
+        return self.values
+
+
+# ------------------------------------------------------------------------------
+class NumericTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_elementwise_reduction(self):
+        """
+        Checks that the results are reduced elementwise
+
+        :return:
+        """
+        bound_class = NumericBase()
+        bound_class.bind(NumericTester(numpy.array([1, 5, 3])))
+        bound_class.bind(NumericTester([4, 2, 6]))
+        bound_class.bind(NumericTester(xcomposite.Ignore()))
+
+        self.assertEqual([5, 7, 9], bound_class.sum().tolist())
+        self.assertEqual([1, 2, 3], bound_class.min().tolist())
+        self.assertEqual([4, 5, 6], bound_class.max().tolist())
+        self.assertEqual([2.5, 3.5, 4.5], bound_class.average().tolist())
+        self.assertEqual([3.0, 3.0, 3.0], bound_class.range().tolist())
+
+    # --------------------------------------------------------------------------
+    @unittest.skipIf(numpy is not None, 'NumPy is installed')
+    def test_missing_numpy(self):
+        """
+        Checks that a descriptive ImportError is raised when NumPy is
+        not available
+
+        :return:
+        """
+        bound_class = NumericBase()
+        bound_class.bind(NumericTester([1]))
+
+        self.assertRaises(ImportError, bound_class.sum)
@@ -0,0 +1,73 @@
+import unittest
+
+from xcomposite import reducers
+from xcomposite.tests.classes import (
+    FlagsBase,
+    FlagsTester,
+)
+
+
+# ------------------------------------------------------------------------------
+class ReducerTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_custom_reducer(self):
+        """
+        Checks that a custom reducer combines the results and stops
+        calling components once it is done
+
+        :return:
+        """
+        bound_class = FlagsBase()
+        bound_class.bind(FlagsTester(0b001))
+        bound_class.bind(FlagsTester(0b010))
+
+        self.assertEqual(0b011, bound_class.flags())
+
+        bound_class.bind(FlagsTester(0b100))
+        bound_class.bind(FlagsTester(None))
+
+        self.assertEqual(0b111, bound_class.flags())
+
+    # --------------------------------------------------------------------------
+    def test_builtin_reducers_match_protocol(self):
+        """
+        Checks that the built in reducers give the same outcome when
+        reduced in one go as when fed results one at a time
+
+        :return:
+        """
+        cases = [
+            (reducers.MinReducer(), [3, 1, 2]),
+            (reducers.MaxReducer(), [3, 1, 2]),
+            (reducers.SumReducer(), [3, 1, 2]),
+            (reducers.SumReducer(), []),
+            (reducers.AverageReducer(), [3, 1, 2]),
+            (reducers.AverageReducer(), [0, 0]),
+            (reducers.RangeReducer(), [3, 1, 2]),
+            (reducers.FirstReducer(), ['A', 'B']),
+            (reducers.FirstReducer(), []),
+            (reducers.FirstTrueReducer(), ['', 'B', 'C']),
+            (reducers.AnyReducer(), [0, 1, 0]),
+            (reducers.AnyReducer(exhaustive=True), [0, 0]),
+            (reducers.AllReducer(), [1, 0, 1]),
+            (reducers.AllReducer(exhaustive=True), [1, 1]),
+            (reducers.AppendReducer(), ['A', 'B']),
+            (reducers.AppendUniqueReducer(), ['A', 'B', 'A']),
+            (reducers.ExtendReducer(), [['A'], ['B', 'C']]),
+            (reducers.ExtendUniqueReducer(), [['A'], ['B', 'A']]),
+            (reducers.UpdateReducer(), [dict(a=1), dict(a=2, b=1)]),
+        ]
+
+        for reducer, results in cases:
+            self.assertEqual(
+                reducers.Reducer.reduce(reducer, iter(results)),
+                reducer.reduce(iter(results)),
+                msg=reducer.__class__.__name__,
+            )
+
+        for reducer in (reducers.IterReducer(), reducers.ChainReducer()):
+            self.assertEqual(
+                list(reducers.Reducer.reduce(reducer, iter(['AB', 'C']))),
+                list(reducer.reduce(iter(['AB', 'C']))),
+            )
@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import unittest
+
+import xcomposite
+from xcomposite.tests.classes import (
+    AsyncBase,
+    AsyncTesterA,
+    AsyncTesterB,
+    BarrierTester,
+    DecoratorBase,
+    DecoratorTesterB,
+    MemoizedBase,
+)
+
+
+# ------------------------------------------------------------------------------
+class TracingTests(unittest.TestCase):
+
+    # --------------------------------------------------------------------------
+    def test_decorated_methods_are_named(self):
+        """
+        Checks that the closures made by the decorators carry the name of
+        the method they decorate, so they show up in profilers
+
+        :return:
+        """
+        self.assertEqual('sum', DecoratorBase.sum.__code__.co_name)
+        self.assertEqual('first', DecoratorBase.first.__code__.co_name)
+        self.assertEqual('items', MemoizedBase.items.__code__.co_name)
+        self.assertEqual('sum', AsyncBase.sum.__code__.co_name)
+
+    # --------------------------------------------------------------------------
+    def test_nested_calls_are_recorded(self):
+        """
+        Checks that the calls are recorded with their full path through
+        nested compositions
+
+        :return:
+        """
+        outer_class = DecoratorBase()
+        inner_class = DecoratorBase()
+        inner_class.bind(DecoratorTesterB())
+        outer_class.bind(DecoratorTesterB())
+        outer_class.bind(inner_class)
+
+        with xcomposite.Tracer() as tracer:
+            self.assertEqual(['B', ['B']], outer_class.append())
+            outer_class.append()
+
+        calls = tracer.calls()
+
+        self.assertEqual(
+            {
+                ('DecoratorBase.append', 'DecoratorTesterB.append'),
+                ('DecoratorBase.append', 'DecoratorBase.append'),
+                (
+                    'DecoratorBase.append',
+                    'DecoratorBase.append',
+                    'DecoratorTesterB.append',
+                ),
+            },
+            set(calls),
+        )
+        self.assertEqual(
+            2,
+            calls[('DecoratorBase.append', 'DecoratorTesterB.append')]['count'],
+        )
+
+        lines = tracer.collapsed().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[0].startswith('DecoratorBase.append '))
+
+        for line in lines:
+            path, microseconds = line.rsplit(' ', 1)
+            self.assertGreaterEqual(int(microseconds), 0)
+
+        # -- Methods whose nested compositions are normally flattened
+        # -- still record the nested composition in the path
+        self.assertEqual(4, outer_class.sum())
+
+        with xcomposite.Tracer() as tracer:
+            self.assertEqual(4, outer_class.sum())
+            self.assertEqual(['B', 'B'], outer_class.extend_list())
+
+        self.assertEqual(
+            {
+                ('DecoratorBase.sum', 'DecoratorTesterB.sum'),
+                ('DecoratorBase.sum', 'DecoratorBase.sum'),
+                (
+                    'DecoratorBase.sum',
+                    'DecoratorBase.sum',
+                    'DecoratorTesterB.sum',
+                ),
+                ('DecoratorBase.extend_list', 'DecoratorTesterB.extend_list'),
+                ('DecoratorBase.extend_list', 'DecoratorBase.extend_list'),
+                (
+                    'DecoratorBase.extend_list',
+                    'DecoratorBase.extend_list',
+                    'DecoratorTesterB.extend_list',
+                ),
+            },
+            set(tracer.calls()),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_tracing_is_removed_afterwards(self):
+        """
+        Checks that the components are called directly once the tracer
+        has finished, and that only one tracer may be active
+
+        :return:
+        """
+        base_class = DecoratorBase()
+        component = DecoratorTesterB()
+        base_class.bind(component)
+
+        with xcomposite.Tracer() as tracer:
+            with self.assertRaises(RuntimeError):
+                with xcomposite.Tracer():
+                    pass
+
+            base_class.sum()
+
+        self.assertEqual((component.sum,), base_class._dispatch_methods('sum'))
+        base_class.sum()
+
+        self.assertEqual(1, len(tracer.calls()))
+
+        # -- The methods of flattened nested compositions are cached by
+        # -- the outer composition, so must not be left traced either
+        inner_class = DecoratorBase()
+        inner_class.bind(component)
+
+        outer_class = DecoratorBase()
+        outer_class.bind(inner_class)
+
+        with xcomposite.Tracer() as tracer:
+            self.assertEqual(2, outer_class.sum())
+
+        self.assertEqual(
+            (component.sum,),
+            outer_class._dispatch_methods('sum'),
+        )
+        self.assertEqual(
+            (component.sum,),
+            inner_class._dispatch_methods('sum'),
+        )
+
+        outer_class.sum()
+
+        self.assertEqual(
+            {
+                ('DecoratorBase.sum', 'DecoratorBase.sum'): 1,
+                (
+                    'DecoratorBase.sum',
+                    'DecoratorBase.sum',
+                    'DecoratorTesterB.sum',
+                ): 1,
+            },
+            dict(
+                (path, record['count'])
+                for path, record in tracer.calls().items()
+            ),
+        )
+
+    # --------------------------------------------------------------------------
+    def test_concurrent_calls_keep_their_path(self):
+        """
+        Checks that calls made on an executor or as coroutines are recorded
+        beneath the method which made them
+
+        :return:
+        """
+        barrier = threading.Barrier(2, timeout=5)
+        base_class = DecoratorBase()
+        base_class.bind(BarrierTester(barrier, 1))
+        base_class.bind(BarrierTester(barrier, 2))
+        base_class.set_executor(True)
+
+        event = asyncio.Event()
+        async_class = AsyncBase()
+        async_class.bind(AsyncTesterA(event))
+        async_class.bind(AsyncTesterB(event))
+
+        with xcomposite.Tracer() as tracer:
+            base_class.extend_list()
+            asyncio.run(async_class.sum())
+
+        self.assertEqual(
+            {
+                ('DecoratorBase.extend_list', 'BarrierTester.extend_list'),
+                ('AsyncBase.sum', 'AsyncTesterA.sum'),
+                ('AsyncBase.sum', 'AsyncTesterB.sum'),
+            },
+            set(tracer.calls()),
+        )
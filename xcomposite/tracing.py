@@ -0,0 +1,274 @@
+"""
+This module holds the tracing mode, which records the tree of calls made
+through composite methods and exports it for flamegraph tools.
+
+Whilst a Tracer is active every component call made through a decorated
+method is timed and recorded against its full path - the composition
+class and decorated method, followed by the component class, and so on
+down through any nested compositions. Nested compositions are never
+flattened whilst tracing, so each keeps its own frame in the path. Outside
+of a Tracer nothing is recorded and there is no overhead at all.
+
+    .. code-block:: python
+
+        >>> with xcomposite.Tracer() as tracer:
+        ...     entity.update()
+        >>>
+        >>> # -- Write the calls in the collapsed stack format, which can
+        >>> # -- be given to flamegraph.pl, speedscope and similar tools
+        >>> with open('entity.folded', 'w') as stream:
+        ...     stream.write(tracer.collapsed())
+
+The decorated methods are also named after the function they decorate
+(rather than the closure within the decorator) so that standard profilers
+such as cProfile show which composite method is being called.
+"""
+import contextvars
+import inspect
+import threading
+import time
+
+
+# -- The Tracer which is currently recording, if any
+_tracer = None
+
+# -- The path of frames leading to the code currently running. This is a
+# -- context variable so it follows asyncio tasks correctly.
+_path = contextvars.ContextVar('xcomposite_path', default=())
+
+
+# ------------------------------------------------------------------------------
+def name_after(function, func):
+    """
+    Renames the code of the given function after func, so that profilers
+    show the name of the decorated method rather than that of the closure
+    which replaces it.
+
+    :param function: The function created by a decorator
+    :param func: The function being decorated
+
+    :return: function
+    """
+    code = function.__code__
+    names = dict(co_name=func.__name__)
+
+    if hasattr(code, 'co_qualname'):
+        names['co_qualname'] = func.__qualname__
+
+    function.__code__ = code.replace(**names)
+    return function
+
+
+# ------------------------------------------------------------------------------
+def _label(instance, method_name):
+    return '%s.%s' % (instance.__class__.__qualname__, method_name)
+
+
+# ------------------------------------------------------------------------------
+class Tracer(object):
+    """
+    Records the calls made through composite methods whilst it is active.
+    Only one Tracer can be active at a time. A Tracer may be used more
+    than once, adding to the calls already recorded.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        # -- Each record is a list of the number of calls and the total
+        # -- time spent within the path, including any calls below it
+        self._records = dict()
+        self._lock = threading.Lock()
+
+        # -- The dispatch lookup which is replaced whilst tracing
+        self._methods = None
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        global _tracer
+
+        from .core import _CompositionBase
+
+        if _tracer is not None:
+            raise RuntimeError('A Tracer is already active')
+
+        # -- Tracing replaces the dispatch lookup which every decorator
+        # -- reads from, so nothing needs to be checked when not tracing.
+        # -- The methods are looked up afresh without flattening, so each
+        # -- nested composition is called (and recorded) in its own right
+        # -- and the traced methods never end up in a cache.
+        self._methods = _CompositionBase.__dict__['_dispatch_methods']
+
+        def methods(composition, method_name):
+            return self.wrap(
+                composition,
+                method_name,
+                composition._resolve_methods(method_name, flatten=False),
+            )
+
+        methods.__doc__ = self._methods.__doc__
+
+        _tracer = self
+        _CompositionBase._dispatch_methods = methods
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        global _tracer
+
+        from .core import _CompositionBase
+
+        _CompositionBase._dispatch_methods = self._methods
+        _tracer = None
+
+    # --------------------------------------------------------------------------
+    def wrap(self, composition, method_name, methods):
+        """
+        Wraps each of the given component methods, so their calls are
+        recorded beneath the current path.
+
+        :param composition: The composition the methods were looked up on
+        :param method_name: Name the methods were looked up with
+        :param methods: The component methods to wrap
+
+        :return: tuple(TracedMethod, ...)
+        """
+        path = _path.get()
+        label = _label(composition, method_name)
+
+        # -- A nested composition is called as a component, so its own
+        # -- frame is already the last in the path
+        if not path or path[-1] != label:
+            path = path + (label,)
+
+        return tuple(
+            TracedMethod(method, method_name, path, self)
+            for method in methods
+        )
+
+    # --------------------------------------------------------------------------
+    def record(self, path, duration):
+        """
+        Records a call of the given path.
+
+        :param path: Tuple of frame labels
+        :param duration: Number of seconds the call took
+
+        :return: None
+        """
+        with self._lock:
+            record = self._records.get(path)
+
+            if record is None:
+                self._records[path] = [1, duration]
+
+            else:
+                record[0] += 1
+                record[1] += duration
+
+    # --------------------------------------------------------------------------
+    def calls(self):
+        """
+        Returns the number of calls and total time (in seconds) of every
+        path recorded. The total time includes the time spent in any
+        paths beneath it.
+
+        :return: dict(tuple(label, ...): dict(count=int, total=float))
+        """
+        with self._lock:
+            return dict(
+                (path, dict(count=record[0], total=record[1]))
+                for path, record in self._records.items()
+            )
+
+    # --------------------------------------------------------------------------
+    def collapsed(self):
+        """
+        Returns the recorded calls in the collapsed stack format used by
+        flamegraph tools. Each line holds a path, with the frames separated
+        by semicolons, followed by the number of microseconds spent in that
+        path and not in any path beneath it.
+
+        :return: str
+        """
+        calls = self.calls()
+        totals = dict()
+
+        for path, record in calls.items():
+            totals[path] = totals.get(path, 0) + record['total']
+
+            # -- The frame of the decorated method is never a call in its
+            # -- own right, so it takes the time of the calls beneath it
+            parent = path[:-1]
+
+            if parent and parent not in calls:
+                totals[parent] = totals.get(parent, 0) + record['total']
+
+        own = dict(totals)
+
+        for path, total in totals.items():
+            parent = path[:-1]
+
+            if parent in own:
+                own[parent] -= total
+
+        return ''.join(
+            '%s %d\n' % (';'.join(path), max(0, round(own[path] * 1e6)))
+            for path in sorted(own)
+        )
+
+
+# ------------------------------------------------------------------------------
+class TracedMethod(object):
+    """
+    Wraps the bound method of a component, recording each call against
+    the path leading to it. Where the method is a coroutine function the
+    call is recorded once the coroutine has been awaited.
+
+    :param method: Bound method of the component
+    :param method_name: Name the method was looked up with
+    :param path: Tuple of the frame labels leading to this call
+    :param tracer: Tracer to record the calls in
+    """
+    __slots__ = ('__self__', 'method', 'path', 'tracer')
+
+    # --------------------------------------------------------------------------
+    def __init__(self, method, method_name, path, tracer):
+        self.__self__ = getattr(method, '__self__', None)
+        self.method = method
+        self.path = path + (_label(self.__self__, method_name),)
+        self.tracer = tracer
+
+    # --------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs):
+        # -- The path is set for the duration of the call, rather than
+        # -- relying on the path of the caller, as the call may be made
+        # -- on another thread by an executor
+        token = _path.set(self.path)
+        start = time.perf_counter()
+
+        try:
+            result = self.method(*args, **kwargs)
+
+        except Exception:
+            self.tracer.record(self.path, time.perf_counter() - start)
+            raise
+
+        finally:
+            _path.reset(token)
+
+        if inspect.iscoroutine(result):
+            return self._await(result, start)
+
+        self.tracer.record(self.path, time.perf_counter() - start)
+        return result
+
+    # --------------------------------------------------------------------------
+    async def _await(self, coroutine, start):
+        token = _path.set(self.path)
+
+        try:
+            return await coroutine
+
+        finally:
+            _path.reset(token)
+            self.tracer.record(self.path, time.perf_counter() - start)